@@ -0,0 +1,37 @@
+"""
+Configuration loading: parse cost per YAML loader, and the mtime-keyed parse cache.
+"""
+import pytest
+import yaml
+
+from connection_manager.config_manager import ConfigManager
+
+LOADERS = {"SafeLoader": yaml.SafeLoader, "CSafeLoader": getattr(yaml, "CSafeLoader", None)}
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = str(tmp_path / "config.yaml")
+    ConfigManager.create_sample_config(path)
+    return path
+
+@pytest.mark.benchmark(group="config-parse")
+@pytest.mark.parametrize("loader", list(LOADERS))
+def bench_yaml_parse(benchmark, config_file, loader):
+    if LOADERS[loader] is None:
+        pytest.skip("PyYAML was built without libyaml.")
+    with open(config_file) as file:
+        text = file.read()
+    benchmark(yaml.load, text, Loader=LOADERS[loader])
+
+@pytest.mark.benchmark(group="config-load")
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def bench_load_config(benchmark, config_file, cached):
+    def load():
+        if not cached:
+            ConfigManager._file_cache.clear()
+        return ConfigManager.load_config(config_file)
+    benchmark(load)
+
+@pytest.mark.benchmark(group="config-load")
+def bench_layered_config(benchmark, config_file):
+    benchmark(lambda: ConfigManager(config_file).config["redshift"]["pool"]["max_size"])
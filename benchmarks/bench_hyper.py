@@ -0,0 +1,44 @@
+"""
+Hyper extract write and read throughput through the local Hyper process.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import ROW_COUNTS, record_throughput
+
+HYPER_ROW_COUNTS = ROW_COUNTS + [1000000]
+
+def make_frame(rows: int) -> pd.DataFrame:
+    index = np.arange(rows)
+    return pd.DataFrame({
+        "id": index,
+        "amount": index * 0.5,
+        "category": pd.Series(index % 50).map(lambda value: f"category-{value}"),
+        "created_at": pd.Timestamp("2024-01-01") + pd.to_timedelta(index, unit="s"),
+        "flag": index % 2 == 0,
+    })
+
+@pytest.mark.benchmark(group="hyper-write")
+@pytest.mark.parametrize("method", ["copy", "insert"])
+@pytest.mark.parametrize("rows", HYPER_ROW_COUNTS)
+def bench_dataframe_to_local_hyper(benchmark, hyper_manager, tmp_path, rows, method):
+    if method == "insert" and rows > 100000:
+        pytest.skip("Row-by-row insert is too slow to benchmark at this size.")
+    frame = make_frame(rows)
+    benchmark.pedantic(hyper_manager.dataframe_to_local_hyper, args=(frame, str(tmp_path / "write.hyper")), kwargs={"method": method}, rounds=3)
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="hyper-read")
+@pytest.mark.parametrize("method", ["fetch", "parquet"])
+@pytest.mark.parametrize("rows", HYPER_ROW_COUNTS)
+def bench_retrieve_data_from_local_hyper(benchmark, hyper_manager, tmp_path, rows, method):
+    path = str(tmp_path / "read.hyper")
+    hyper_manager.dataframe_to_local_hyper(make_frame(rows), path)
+    if method == "fetch":
+        benchmark(hyper_manager.retrieve_data_from_local_hyper, path)
+    else:
+        pytest.importorskip("pyarrow")
+        benchmark(hyper_manager.read_hyper, path, method="parquet")
+    hyper_manager.release_hyper_file(path)
+    record_throughput(benchmark, rows=rows)
@@ -0,0 +1,60 @@
+"""
+Cold import time and memory of the package and of each manager, measured in fresh interpreters.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+STUBS = os.path.join(os.path.dirname(__file__), "stubs")
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "tableauserverclient", "tableauhyperapi", "cx_Oracle", "boto3", "botocore", "psycopg2")
+
+# Peak RSS comes from /proc (ru_maxrss can carry over the parent's peak across exec on Linux).
+PROBE = """
+import json, resource, sys
+{statement}
+loaded = [name for name in {heavy!r} if name in sys.modules]
+try:
+    with open("/proc/self/status") as status:
+        rss_mb = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:")) / 1024
+except OSError:
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({{"rss_mb": rss_mb, "loaded": loaded}}))
+"""
+
+STATEMENTS = {
+    "package": "import connection_manager",
+    "aws": "from connection_manager import AWSConnectionManager",
+    "oracle": "from connection_manager import OracleConnectionManager",
+    "redshift": "from connection_manager import RedshiftConnectionManager",
+    "tableau": "from connection_manager import TableauConnectionManager",
+    "aws-client": "from connection_manager import AWSConnectionManager; AWSConnectionManager().connect_to_s3('key', 'secret', 'us-east-1')",
+}
+
+def run_probe(statement: str) -> dict:
+    # Run outside the repository so only the package (not the benchmarks directory) is importable.
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([STUBS, PACKAGE_ROOT]))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+        env=env, cwd=os.path.dirname(PACKAGE_ROOT), capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("target", list(STATEMENTS))
+def bench_import(benchmark, target):
+    statement = STATEMENTS[target]
+    if target.startswith("aws"):
+        pytest.importorskip("boto3")
+    elif target == "redshift":
+        pytest.importorskip("psycopg2")
+    elif target == "tableau":
+        pytest.importorskip("tableauserverclient")
+    benchmark.pedantic(run_probe, args=(statement,), rounds=5)
+    result = run_probe(statement)
+    benchmark.extra_info["max_rss_mb"] = result["rss_mb"]
+    benchmark.extra_info["heavy_modules_loaded"] = result["loaded"]
@@ -0,0 +1,59 @@
+"""
+OracleConnectionManager against the in-memory cx_Oracle stub: library overhead per call.
+"""
+import pytest
+
+from conftest import COLUMN_COUNTS, ROW_COUNTS, make_rows, record_throughput
+
+@pytest.mark.benchmark(group="oracle-connect")
+def bench_connect(benchmark, oracle_config):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    benchmark(manager.connect)
+
+@pytest.mark.benchmark(group="oracle-connect")
+def bench_pool_checkout(benchmark, oracle_manager):
+    def checkout():
+        with oracle_manager.acquire():
+            pass
+
+    benchmark(checkout)
+
+@pytest.mark.benchmark(group="oracle-latency")
+def bench_single_row_query(benchmark, oracle_manager, oracle_result):
+    oracle_result(1, 5)
+    benchmark(oracle_manager.fetch_all, "SELECT * FROM bench WHERE id = :id", {"id": 1})
+
+@pytest.mark.benchmark(group="oracle-fetch")
+@pytest.mark.parametrize("columns", COLUMN_COUNTS)
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_fetch_all(benchmark, oracle_manager, oracle_result, rows, columns):
+    oracle_result(rows, columns)
+    benchmark(oracle_manager.fetch_all, "SELECT * FROM bench")
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="oracle-fetch")
+@pytest.mark.parametrize("columns", COLUMN_COUNTS)
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_stream_query_dataframes(benchmark, oracle_manager, oracle_result, rows, columns):
+    oracle_result(rows, columns)
+    benchmark(lambda: sum(len(chunk) for chunk in oracle_manager.stream_query("SELECT * FROM bench", as_dataframe=True)))
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="oracle-fetch")
+@pytest.mark.parametrize("dtype_backend", ["pyarrow", "numpy"])
+@pytest.mark.parametrize("columns", COLUMN_COUNTS)
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_query_to_dataframe(benchmark, oracle_manager, oracle_result, rows, columns, dtype_backend):
+    pytest.importorskip("pyarrow")
+    oracle_result(rows, columns)
+    benchmark(oracle_manager.query_to_dataframe, "SELECT * FROM bench", dtype_backend=dtype_backend)
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="oracle-write")
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_execute_many(benchmark, oracle_manager, rows):
+    params = make_rows(rows, 4)
+    benchmark(oracle_manager.execute_many, "INSERT INTO bench VALUES (:1, :2, :3, :4)", params)
+    record_throughput(benchmark, rows=rows)
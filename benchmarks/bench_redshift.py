@@ -0,0 +1,93 @@
+"""
+RedshiftConnectionManager against a Postgres server (wire-compatible stand-in for Redshift).
+"""
+import pytest
+
+from conftest import COLUMN_COUNTS, ROW_COUNTS, make_rows, record_throughput
+
+_COLUMN_EXPRESSIONS = (
+    "g AS c{0}",
+    "g * 0.5::float8 AS c{0}",
+    "'value-' || g AS c{0}",
+    "TIMESTAMP '2024-01-01' + g * INTERVAL '1 second' AS c{0}",
+)
+
+def generated_query(columns: int) -> str:
+    """
+    Query producing ``%s`` rows of ``columns`` mixed-type columns, computed server-side.
+    """
+    select_list = ", ".join(_COLUMN_EXPRESSIONS[column % 4].format(column) for column in range(columns))
+    return f"SELECT {select_list} FROM generate_series(1, %s) AS g"
+
+@pytest.fixture
+def bench_table(redshift_manager):
+    with redshift_manager.acquire() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS cm_bench")
+            cursor.execute("CREATE TABLE cm_bench (c0 bigint, c1 double precision, c2 text, c3 timestamp)")
+        connection.commit()
+    yield "cm_bench"
+    with redshift_manager.acquire() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS cm_bench")
+        connection.commit()
+
+@pytest.mark.benchmark(group="redshift-connect")
+def bench_connect(benchmark, redshift_config):
+    from connection_manager import RedshiftConnectionManager
+
+    manager = RedshiftConnectionManager(redshift_config)
+
+    def connect():
+        manager.connect().close()
+
+    benchmark(connect)
+
+@pytest.mark.benchmark(group="redshift-connect")
+def bench_pool_checkout(benchmark, redshift_manager):
+    def checkout():
+        with redshift_manager.acquire():
+            pass
+
+    benchmark(checkout)
+
+@pytest.mark.benchmark(group="redshift-latency")
+def bench_single_row_query(benchmark, redshift_manager):
+    benchmark(redshift_manager.fetch_all, "SELECT %s", (1,))
+
+@pytest.mark.benchmark(group="redshift-fetch")
+@pytest.mark.parametrize("columns", COLUMN_COUNTS)
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_fetch_all(benchmark, redshift_manager, rows, columns):
+    benchmark(redshift_manager.fetch_all, generated_query(columns), (rows,))
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="redshift-fetch")
+@pytest.mark.parametrize("columns", COLUMN_COUNTS)
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_stream_query(benchmark, redshift_manager, rows, columns):
+    benchmark(lambda: sum(len(chunk) for chunk in redshift_manager.stream_query(generated_query(columns), (rows,))))
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="redshift-fetch")
+@pytest.mark.parametrize("dtype_backend", ["pyarrow", "numpy"])
+@pytest.mark.parametrize("columns", COLUMN_COUNTS)
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_query_to_dataframe(benchmark, redshift_manager, rows, columns, dtype_backend):
+    pytest.importorskip("pyarrow")
+    benchmark(redshift_manager.query_to_dataframe, generated_query(columns), (rows,), dtype_backend=dtype_backend)
+    record_throughput(benchmark, rows=rows)
+
+@pytest.mark.benchmark(group="redshift-write")
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_execute_many(benchmark, redshift_manager, bench_table, rows):
+    params = make_rows(rows, 4)
+
+    def truncate():
+        with redshift_manager.acquire() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(f"TRUNCATE {bench_table}")
+            connection.commit()
+
+    benchmark.pedantic(redshift_manager.execute_many, args=(f"INSERT INTO {bench_table} VALUES %s", params), setup=truncate, rounds=3)
+    record_throughput(benchmark, rows=rows)
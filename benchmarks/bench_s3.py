@@ -0,0 +1,73 @@
+"""
+AWSConnectionManager transfers against moto's in-process S3.
+
+moto keeps objects in memory and skips the network, so these numbers track the client-side
+cost (boto3 transfer manager, threading, chunking) rather than real S3 bandwidth.
+"""
+import os
+
+import pytest
+
+from conftest import record_throughput
+
+OBJECT_SIZES = [1 * 2 ** 20, 32 * 2 ** 20]
+SMALL_OBJECT_COUNT = 200
+
+@pytest.fixture
+def payload(tmp_path):
+    def write(size: int) -> str:
+        path = tmp_path / f"payload-{size}"
+        path.write_bytes(os.urandom(size))
+        return str(path)
+
+    return write
+
+@pytest.mark.benchmark(group="s3-connect")
+def bench_connect(benchmark, s3):
+    manager, _ = s3
+    benchmark(manager.connect_to_s3)
+
+@pytest.mark.benchmark(group="s3-upload")
+@pytest.mark.parametrize("size", OBJECT_SIZES)
+def bench_upload(benchmark, s3, payload, size):
+    manager, bucket = s3
+    path = payload(size)
+    benchmark(manager.upload, path, bucket, "bench/object")
+    record_throughput(benchmark, nbytes=size)
+
+@pytest.mark.benchmark(group="s3-download")
+@pytest.mark.parametrize("size", OBJECT_SIZES)
+def bench_download(benchmark, s3, payload, tmp_path, size):
+    manager, bucket = s3
+    manager.upload(payload(size), bucket, "bench/object")
+    benchmark(manager.download, bucket, "bench/object", str(tmp_path / "downloaded"))
+    record_throughput(benchmark, nbytes=size)
+
+@pytest.mark.benchmark(group="s3-many-objects")
+def bench_upload_files(benchmark, s3, tmp_path):
+    manager, bucket = s3
+    files = []
+    for index in range(SMALL_OBJECT_COUNT):
+        path = tmp_path / f"small-{index}"
+        path.write_bytes(os.urandom(16 * 1024))
+        files.append((str(path), f"bench/small/{index}"))
+    benchmark(manager.upload_files, files, bucket)
+    record_throughput(benchmark, rows=SMALL_OBJECT_COUNT, nbytes=SMALL_OBJECT_COUNT * 16 * 1024)
+
+@pytest.mark.benchmark(group="s3-many-objects")
+def bench_download_prefix(benchmark, s3, tmp_path):
+    manager, bucket = s3
+    client = manager.s3_client
+    for index in range(SMALL_OBJECT_COUNT):
+        client.put_object(Bucket=bucket, Key=f"bench/small/{index}", Body=os.urandom(16 * 1024))
+    benchmark(manager.download_prefix, bucket, "bench/small/", str(tmp_path / "prefix"))
+    record_throughput(benchmark, rows=SMALL_OBJECT_COUNT, nbytes=SMALL_OBJECT_COUNT * 16 * 1024)
+
+@pytest.mark.benchmark(group="s3-many-objects")
+def bench_iter_objects(benchmark, s3):
+    manager, bucket = s3
+    client = manager.s3_client
+    for index in range(SMALL_OBJECT_COUNT):
+        client.put_object(Bucket=bucket, Key=f"bench/list/{index}", Body=b"")
+    benchmark(lambda: sum(1 for _ in manager.iter_objects(bucket, "bench/list/")))
+    record_throughput(benchmark, rows=SMALL_OBJECT_COUNT)
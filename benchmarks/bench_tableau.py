@@ -0,0 +1,33 @@
+"""
+Tableau Server REST calls against the local fake server (``stubs/fake_tableau_server.py``).
+
+Set ``CM_BENCH_TABLEAU_LATENCY`` (seconds per response) to simulate a remote server.
+"""
+import pytest
+
+from conftest import record_throughput
+
+@pytest.mark.benchmark(group="tableau-connect")
+def bench_sign_in(benchmark, tableau_config):
+    from connection_manager import TableauConnectionManager
+
+    manager = TableauConnectionManager(tableau_config)
+    benchmark(manager.connect_to_server)
+
+@pytest.mark.benchmark(group="tableau-connect")
+def bench_cached_session(benchmark, tableau_config, tmp_path):
+    from connection_manager import FileSessionCache, TableauConnectionManager
+
+    manager = TableauConnectionManager(tableau_config, session_cache=FileSessionCache(str(tmp_path / "sessions.json")))
+    manager.connect_to_server()
+    benchmark(manager.connect_to_server)
+
+@pytest.mark.benchmark(group="tableau-list")
+@pytest.mark.parametrize("page_size", [100, 1000])
+def bench_iter_items(benchmark, tableau_config, tableau_server, page_size):
+    from connection_manager import TableauConnectionManager
+
+    manager = TableauConnectionManager(tableau_config)
+    manager.connect_to_server()
+    benchmark(lambda: sum(1 for _ in manager.iter_items("datasources", page_size=page_size)))
+    record_throughput(benchmark, rows=tableau_server.item_count)
@@ -0,0 +1,43 @@
+"""
+Oracle (stub) to Hyper extract: the streaming ``transfer`` pipeline against the DataFrame route.
+
+Publishing is replaced by a no-op, so both variants measure fetch plus extract build only.
+Peak traced Python memory of one extra run is recorded in ``extra_info``.
+"""
+import tracemalloc
+
+import pytest
+
+from conftest import ROW_COUNTS, record_throughput
+
+COLUMNS = 8
+
+def peak_memory(func) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+@pytest.fixture
+def unpublished_hyper_manager(hyper_manager, monkeypatch):
+    monkeypatch.setattr(hyper_manager, "_publish_hyper_file", lambda *args, **kwargs: None)
+    return hyper_manager
+
+@pytest.mark.benchmark(group="transfer")
+@pytest.mark.parametrize("route", ["transfer", "dataframe"])
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def bench_oracle_to_hyper(benchmark, oracle_manager, oracle_result, unpublished_hyper_manager, tmp_path, rows, route):
+    oracle_result(rows, COLUMNS)
+    if route == "transfer":
+        run = lambda: unpublished_hyper_manager.transfer(oracle_manager, "SELECT * FROM bench", "bench", "project", batch_size=10000)
+    else:
+        pytest.importorskip("pyarrow")
+        path = str(tmp_path / "bench.hyper")
+        run = lambda: unpublished_hyper_manager.dataframe_to_local_hyper(
+            oracle_manager.query_to_dataframe("SELECT * FROM bench"), path, method="insert"
+        )
+    benchmark.pedantic(run, rounds=3)
+    record_throughput(benchmark, rows=rows)
+    benchmark.extra_info["peak_traced_mb"] = peak_memory(run)
@@ -0,0 +1,164 @@
+"""
+Shared fixtures for the benchmark suite.
+
+Backends are replaced by local stand-ins: a cx_Oracle stub (``stubs/cx_Oracle.py``), moto
+for S3, an in-process fake Tableau Server, and a real Postgres server for the Redshift
+manager (``CM_BENCH_POSTGRES_DSN``, or a throwaway server via ``testing.postgresql``).
+"""
+import datetime
+import os
+import sys
+
+import pytest
+
+# The stub must shadow any installed cx_Oracle before connection_manager is imported.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "stubs"))
+
+import cx_Oracle  # noqa: E402  (the stub)
+
+ROW_COUNTS = [1000, 100000]
+COLUMN_COUNTS = [5, 50]
+
+def record_throughput(benchmark, rows: int = 0, nbytes: int = 0) -> None:
+    """
+    Store rows/s and MB/s (from the mean round time) in the benchmark's ``extra_info``.
+    """
+    stats = getattr(benchmark, "stats", None)
+    if not stats:
+        return
+    mean = stats.stats.mean
+    if rows:
+        benchmark.extra_info["rows"] = rows
+        benchmark.extra_info["rows_per_second"] = rows / mean
+    if nbytes:
+        benchmark.extra_info["bytes"] = nbytes
+        benchmark.extra_info["mb_per_second"] = nbytes / mean / 2 ** 20
+
+def make_rows(row_count: int, column_count: int) -> list:
+    """
+    Rows cycling through integer, float, text and timestamp columns.
+    """
+    start = datetime.datetime(2024, 1, 1)
+    makers = (
+        lambda i: i,
+        lambda i: i * 0.5,
+        lambda i: f"value-{i}",
+        lambda i: start + datetime.timedelta(seconds=i),
+    )
+    return [tuple(makers[column % 4](row) for column in range(column_count)) for row in range(row_count)]
+
+def oracle_description(column_count: int) -> list:
+    types = (
+        (cx_Oracle.DB_TYPE_NUMBER, 10, 0),
+        (cx_Oracle.DB_TYPE_NUMBER, 0, -127),
+        (cx_Oracle.DB_TYPE_VARCHAR, 0, 0),
+        (cx_Oracle.DB_TYPE_DATE, 0, 0),
+    )
+    return [
+        (f"COL{column}", types[column % 4][0], None, None, types[column % 4][1], types[column % 4][2], True)
+        for column in range(column_count)
+    ]
+
+@pytest.fixture
+def oracle_result():
+    """
+    Register a synthetic result of the requested shape with the cx_Oracle stub.
+    """
+    def register(row_count: int, column_count: int) -> None:
+        cx_Oracle.set_result(oracle_description(column_count), make_rows(row_count, column_count))
+
+    yield register
+    cx_Oracle.set_result(None, [])
+
+@pytest.fixture
+def oracle_config():
+    return {"oracle": {"dsn": "localhost:1521/BENCH", "user": "bench", "password": "bench"}}
+
+@pytest.fixture
+def oracle_manager(oracle_config):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    manager.create_pool(min_size=2, max_size=4)
+    yield manager
+    manager.close_pool()
+
+@pytest.fixture(scope="session")
+def postgres_dsn():
+    """
+    DSN of the Postgres server standing in for Redshift; skips the Redshift benchmarks if none.
+    """
+    dsn = os.environ.get("CM_BENCH_POSTGRES_DSN")
+    if dsn:
+        yield dsn
+        return
+    try:
+        import testing.postgresql
+    except ImportError:
+        pytest.skip("Set CM_BENCH_POSTGRES_DSN or install testing.postgresql to run the Redshift benchmarks.")
+    with testing.postgresql.Postgresql() as server:
+        yield server.url()
+
+@pytest.fixture(scope="session")
+def redshift_config(postgres_dsn):
+    import psycopg2.extensions
+
+    params = psycopg2.extensions.parse_dsn(postgres_dsn)
+    return {"redshift": {
+        "host": params.get("host", "localhost"),
+        "port": int(params.get("port", 5432)),
+        "dbname": params.get("dbname", "postgres"),
+        "user": params.get("user", "postgres"),
+        "password": params.get("password", ""),
+    }}
+
+@pytest.fixture
+def redshift_manager(redshift_config):
+    from connection_manager import RedshiftConnectionManager
+
+    manager = RedshiftConnectionManager(redshift_config)
+    manager.create_pool(min_size=2, max_size=4)
+    yield manager
+    manager.close_pool()
+
+@pytest.fixture
+def s3(tmp_path):
+    """
+    (AWSConnectionManager, bucket) against moto's in-process S3.
+    """
+    from moto import mock_aws
+    from connection_manager import AWSConnectionManager
+
+    config = {"aws": {"access_key_id": "bench", "secret_access_key": "bench", "region_name": "us-east-1"}}
+    with mock_aws():
+        manager = AWSConnectionManager(config)
+        client = manager.connect_to_s3()
+        client.create_bucket(Bucket="connection-manager-bench")
+        yield manager, "connection-manager-bench"
+
+@pytest.fixture(scope="session")
+def tableau_server():
+    from fake_tableau_server import FakeTableauServer
+
+    with FakeTableauServer(item_count=1000, latency=float(os.environ.get("CM_BENCH_TABLEAU_LATENCY", "0"))) as server:
+        yield server
+
+@pytest.fixture
+def tableau_config(tableau_server, tmp_path):
+    return {"tableau": {
+        "server_url": tableau_server.url,
+        "token_name": "bench",
+        "personal_access_token": "bench",
+        "site_id": "",
+        "hyper_telemetry": False,
+        "hyper_parameters": {"log_dir": str(tmp_path)},
+    }}
+
+@pytest.fixture(scope="session")
+def hyper_manager(tmp_path_factory):
+    from connection_manager import TableauConnectionManager
+
+    # Hyper writes hyperd.log into its log_dir (default: the working directory).
+    manager = TableauConnectionManager({"tableau": {"hyper_telemetry": False, "hyper_parameters": {"log_dir": str(tmp_path_factory.mktemp("hyper_logs"))}}})
+    yield manager
+    manager.close()
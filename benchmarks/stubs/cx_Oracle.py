@@ -0,0 +1,148 @@
+"""
+In-memory stand-in for the parts of cx_Oracle used by OracleConnectionManager.
+
+Every cursor returns the result registered with ``set_result``, sliced per ``fetchmany``
+call, and ``round_trip_latency`` seconds are slept per server round trip, so benchmarks
+measure the library's own overhead (plus a simulated network cost) without an Oracle server.
+"""
+import threading
+import time
+from typing import Any, List, Optional, Sequence
+
+class Error(Exception):
+    pass
+
+class DatabaseError(Error):
+    pass
+
+class _DbType:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<DbType {self.name}>"
+
+for _name in (
+    "NUMBER", "BINARY_DOUBLE", "BINARY_FLOAT", "DATE", "TIMESTAMP", "TIMESTAMP_TZ", "TIMESTAMP_LTZ",
+    "VARCHAR", "NVARCHAR", "CHAR", "NCHAR", "LONG", "CLOB", "NCLOB", "RAW", "LONG_RAW", "BLOB",
+):
+    globals()[f"DB_TYPE_{_name}"] = _DbType(_name)
+
+SPOOL_ATTRVAL_TIMEDWAIT = 3
+
+round_trip_latency: float = 0.0
+_description: Optional[List[tuple]] = None
+_rows: List[tuple] = []
+
+def set_result(description: Optional[List[tuple]], rows: List[tuple]) -> None:
+    """
+    Register the result every cursor returns (``description`` follows the DB-API 7-tuple layout).
+    """
+    global _description, _rows
+    _description, _rows = description, rows
+
+def _round_trip() -> None:
+    if round_trip_latency:
+        time.sleep(round_trip_latency)
+
+class Cursor:
+    def __init__(self, connection: "Connection"):
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.description: Optional[List[tuple]] = None
+        self.rowcount = 0
+        self._rows: List[tuple] = []
+        self._position = 0
+
+    def execute(self, query: str, params: Any = None) -> "Cursor":
+        _round_trip()
+        self.description, self._rows, self._position = _description, _rows, 0
+        self.rowcount = 0
+        return self
+
+    def executemany(self, query: str, seq_of_params: Sequence[Any]) -> None:
+        _round_trip()
+        self.description = None
+        self.rowcount = len(seq_of_params)
+
+    def fetchmany(self, size: Optional[int] = None) -> List[tuple]:
+        size = size or self.arraysize
+        if self._position < len(self._rows):
+            _round_trip()
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        self.rowcount = self._position
+        return rows
+
+    def fetchall(self) -> List[tuple]:
+        rows = []
+        while True:
+            batch = self.fetchmany(self.arraysize)
+            if not batch:
+                return rows
+            rows.extend(batch)
+
+    def fetchone(self) -> Optional[tuple]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def close(self) -> None:
+        self._rows = []
+
+class Connection:
+    def __init__(self, user: str = None, password: str = None, dsn: str = None, **kwargs):
+        _round_trip()
+        self.stmtcachesize = kwargs.get("stmtcachesize", 20)
+
+    def cursor(self) -> Cursor:
+        return Cursor(self)
+
+    def ping(self) -> None:
+        _round_trip()
+
+    def commit(self) -> None:
+        _round_trip()
+
+    def rollback(self) -> None:
+        _round_trip()
+
+    def close(self) -> None:
+        pass
+
+def connect(user: str = None, password: str = None, dsn: str = None, **kwargs) -> Connection:
+    return Connection(user=user, password=password, dsn=dsn, **kwargs)
+
+class SessionPool:
+    def __init__(self, user: str = None, password: str = None, dsn: str = None, min: int = 1, max: int = 5, increment: int = 1, **kwargs):
+        self.min = min
+        self.max = max
+        self.ping_interval = 60
+        self._kwargs = dict(kwargs, user=user, password=password, dsn=dsn)
+        self._idle = [Connection(**self._kwargs) for _ in range(min)]
+        self._busy = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> Connection:
+        with self._condition:
+            while not self._idle and self._busy >= self.max:
+                self._condition.wait()
+            self._busy += 1
+            if self._idle:
+                return self._idle.pop()
+        return Connection(**self._kwargs)
+
+    def release(self, connection: Connection) -> None:
+        with self._condition:
+            self._busy -= 1
+            self._idle.append(connection)
+            self._condition.notify()
+
+    def drop(self, connection: Connection) -> None:
+        with self._condition:
+            self._busy -= 1
+            self._condition.notify()
+
+    def close(self, force: bool = False) -> None:
+        with self._condition:
+            self._idle.clear()
@@ -0,0 +1,98 @@
+"""
+Minimal local Tableau Server REST API for benchmarking the TSC code paths.
+
+Serves ``serverInfo``, PAT sign-in/sign-out and paged listings of a fixed number of data
+sources and workbooks, with an optional per-request latency.
+"""
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+from urllib.parse import parse_qs, urlparse
+
+API_VERSION = "3.19"
+
+_ENVELOPE = '<?xml version="1.0" encoding="UTF-8"?><tsResponse xmlns="http://tableau.com/api">{}</tsResponse>'
+_SITE_ITEMS = re.compile(r"^/api/[\d.]+/sites/[^/]+/(datasources|workbooks)$")
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _reply(self, body: str, status: int = 200) -> None:
+        payload = _ENVELOPE.format(body).encode("utf-8")
+        time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path.endswith("/serverInfo"):
+            return self._reply(
+                f'<serverInfo><productVersion build="20232.0.0">2023.2.0</productVersion>'
+                f"<restApiVersion>{API_VERSION}</restApiVersion></serverInfo>"
+            )
+        match = _SITE_ITEMS.match(url.path)
+        if match:
+            return self._reply(self._page(match.group(1), parse_qs(url.query)))
+        self._reply('<error code="404000"><summary>Not Found</summary><detail>Unknown resource</detail></error>', 404)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/auth/signin"):
+            return self._reply(
+                '<credentials token="benchmark-token"><site id="benchmark-site" contentUrl=""/>'
+                '<user id="benchmark-user"/></credentials>'
+            )
+        if self.path.endswith("/auth/signout"):
+            return self._reply("")
+        self._reply('<error code="404000"><summary>Not Found</summary><detail>Unknown resource</detail></error>', 404)
+
+    def _page(self, kind: str, query: dict) -> str:
+        page_size = int(query.get("pageSize", ["100"])[0])
+        page_number = int(query.get("pageNumber", ["1"])[0])
+        start = (page_number - 1) * page_size
+        stop = min(start + page_size, self.server.item_count)
+        tag = kind[:-1]
+        items = "".join(
+            f'<{tag} id="{kind}-{index}" name="{tag} {index}" contentUrl="{tag}{index}" type="hyper" '
+            f'createdAt="2024-01-01T00:00:00Z" updatedAt="2024-01-02T00:00:00Z">'
+            f'<project id="project-1" name="Default"/><owner id="benchmark-user"/><tags/></{tag}>'
+            for index in range(start, stop)
+        )
+        return (
+            f'<pagination pageNumber="{page_number}" pageSize="{page_size}" totalAvailable="{self.server.item_count}"/>'
+            f"<{kind}>{items}</{kind}>"
+        )
+
+class FakeTableauServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, item_count: int = 1000, latency: float = 0.0, address: Tuple[str, int] = ("127.0.0.1", 0)):
+        """
+        :param item_count: Number of data sources and of workbooks listed.
+        :param latency: Seconds slept before every response.
+        :param address: Bind address (port 0 picks a free port).
+        """
+        super().__init__(address, _Handler)
+        self.item_count = item_count
+        self.latency = latency
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def __enter__(self) -> "FakeTableauServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
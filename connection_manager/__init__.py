@@ -1,8 +1,71 @@
-from .tableau_connection import TableauConnectionManager
-from .oracle_connection import OracleConnectionManager
-from .aws_connection import AWSConnectionManager
-from .redshift_connection import RedshiftConnectionManager
-from .config_manager import ConfigManager
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names are imported on first access (PEP 562), so e.g. an S3-only job never loads
+# pandas, tableauhyperapi or the database drivers.
+_LAZY_ATTRIBUTES = {
+    "TableauConnectionManager": ".tableau_connection",
+    "OracleConnectionManager": ".oracle_connection",
+    "AWSConnectionManager": ".aws_connection",
+    "RedshiftConnectionManager": ".redshift_connection",
+    "ConfigManager": ".config_manager",
+    "Config": ".config_manager",
+    "SecretProvider": ".secret_store",
+    "EnvSecretProvider": ".secret_store",
+    "FileSecretProvider": ".secret_store",
+    "SessionCache": ".session_cache",
+    "FileSessionCache": ".session_cache",
+    "QueryCache": ".query_cache",
+    "Event": ".instrumentation",
+    "MetricsCollector": ".instrumentation",
+    "SlowQueryLogger": ".instrumentation",
+    "OpenTelemetryExporter": ".instrumentation",
+    "PrometheusExporter": ".instrumentation",
+    "add_listener": ".instrumentation",
+    "remove_listener": ".instrumentation",
+    "instrument": ".instrumentation",
+    "AsyncTableauConnectionManager": ".async_connection",
+    "AsyncOracleConnectionManager": ".async_connection",
+    "AsyncAWSConnectionManager": ".async_connection",
+    "AsyncRedshiftConnectionManager": ".async_connection",
+}
+
+if TYPE_CHECKING:
+    from .tableau_connection import TableauConnectionManager
+    from .oracle_connection import OracleConnectionManager
+    from .aws_connection import AWSConnectionManager
+    from .redshift_connection import RedshiftConnectionManager
+    from .config_manager import ConfigManager, Config
+    from .secret_store import SecretProvider, EnvSecretProvider, FileSecretProvider
+    from .session_cache import SessionCache, FileSessionCache
+    from .query_cache import QueryCache
+    from .instrumentation import (
+        Event,
+        MetricsCollector,
+        SlowQueryLogger,
+        OpenTelemetryExporter,
+        PrometheusExporter,
+        add_listener,
+        remove_listener,
+        instrument,
+    )
+    from .async_connection import (
+        AsyncTableauConnectionManager,
+        AsyncOracleConnectionManager,
+        AsyncAWSConnectionManager,
+        AsyncRedshiftConnectionManager,
+    )
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 __all__ = [
     "TableauConnectionManager",
@@ -10,4 +73,23 @@ __all__ = [
     "AWSConnectionManager",
     "RedshiftConnectionManager",
     "ConfigManager",
+    "Config",
+    "SecretProvider",
+    "EnvSecretProvider",
+    "FileSecretProvider",
+    "SessionCache",
+    "FileSessionCache",
+    "QueryCache",
+    "Event",
+    "MetricsCollector",
+    "SlowQueryLogger",
+    "OpenTelemetryExporter",
+    "PrometheusExporter",
+    "add_listener",
+    "remove_listener",
+    "instrument",
+    "AsyncTableauConnectionManager",
+    "AsyncOracleConnectionManager",
+    "AsyncAWSConnectionManager",
+    "AsyncRedshiftConnectionManager",
 ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, List, Optional
+
+class LazyModule(ModuleType):
+    """
+    Module placeholder that imports the real module on first attribute access.
+
+    Lets manager modules refer to drivers (``cx_Oracle.connect``, ``TSC.Server``, ...) as if
+    they were imported at the top of the file, while the import cost is only paid when a
+    manager actually uses the driver. A missing driver raises an ImportError naming the
+    ``setup.py`` extra that provides it.
+    """
+    def __init__(self, name: str, extra: Optional[str] = None):
+        super().__init__(name)
+        self.__dict__["_lazy_extra"] = extra
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    try:
+                        module = importlib.import_module(self.__name__)
+                    except ImportError as e:
+                        extra = self.__dict__["_lazy_extra"]
+                        hint = f" Install it with: pip install connection_manager[{extra}]" if extra else ""
+                        raise ImportError(f"The '{self.__name__}' package is required for this feature.{hint}") from e
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+def lazy_import(name: str, extra: Optional[str] = None) -> LazyModule:
+    """
+    Return a placeholder for module ``name`` that imports it on first use.
+
+    :param name: Absolute module name, e.g. "psycopg2.extras".
+    :param extra: setup.py extra that installs the module, used in the error message.
+    """
+    return LazyModule(name, extra)
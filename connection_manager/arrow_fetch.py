@@ -0,0 +1,76 @@
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+import pyarrow as pa
+
+DTYPE_BACKENDS = ("pyarrow", "numpy_nullable", "numpy")
+
+class ResultColumn(NamedTuple):
+    """
+    A result column as described by a SQL manager's ``describe_columns``.
+    """
+    name: str
+    arrow_type: Optional[pa.DataType]  # None when the type must be inferred from the values
+    converter: Optional[Callable[[Any], Any]] = None  # applied to non-null values, e.g. LOB reads
+
+def fetch_arrow_table(
+    cursor: Any,
+    arrow_type: Callable[[Sequence[Any]], Optional[pa.DataType]],
+    batch_size: int = 50000,
+    converter: Optional[Callable[[Sequence[Any]], Optional[Callable[[Any], Any]]]] = None,
+) -> pa.Table:
+    """
+    Drain an executed DB-API cursor into an Arrow table, one ``fetchmany`` batch at a time.
+
+    Each batch is transposed into columns and converted straight into typed Arrow arrays, so
+    no DataFrame or object-dtype column is ever built from the Python rows, and only one batch
+    of driver tuples is alive at a time.
+
+    :param cursor: Cursor on which a query has been executed.
+    :param arrow_type: Maps a ``cursor.description`` entry to its Arrow type (None lets pyarrow infer it).
+    :param batch_size: Rows per ``fetchmany`` call.
+    :param converter: Optionally maps a description entry to a function applied to its non-null values.
+    :return: Arrow table with the full result.
+    """
+    # Server-side cursors only populate the description once the first batch is fetched.
+    rows = cursor.fetchmany(batch_size)
+    description = cursor.description
+    names = [column[0] for column in description]
+    types = [arrow_type(column) for column in description]
+    converters = [converter(column) if converter else None for column in description]
+    tables: List[pa.Table] = []
+    while rows:
+        arrays = []
+        for values, column_type, convert in zip(zip(*rows), types, converters):
+            if convert is not None:
+                values = [None if value is None else convert(value) for value in values]
+            arrays.append(pa.array(values, type=column_type))
+        tables.append(pa.Table.from_arrays(arrays, names=names))
+        rows = cursor.fetchmany(batch_size)
+    if not tables:
+        return pa.schema([pa.field(name, column_type or pa.null()) for name, column_type in zip(names, types)]).empty_table()
+    # Columns whose type is inferred may differ between batches (e.g. all-null batches).
+    return pa.concat_tables(tables, promote_options="permissive")
+
+def arrow_table_to_dataframe(table: pa.Table, dtype_backend: str = "pyarrow") -> "pd.DataFrame":
+    """
+    Convert an Arrow table into a Pandas DataFrame.
+
+    :param table: Arrow table to convert.
+    :param dtype_backend: "pyarrow" keeps Arrow-backed columns (ArrowDtype, no copy for most types),
+        "numpy_nullable" uses Pandas nullable dtypes and "numpy" plain NumPy dtypes.
+    :return: DataFrame with the table's data.
+    """
+    import pandas as pd
+
+    if dtype_backend == "pyarrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    if dtype_backend == "numpy_nullable":
+        nullable_types = {
+            pa.int8(): pd.Int8Dtype(), pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype(), pa.int64(): pd.Int64Dtype(),
+            pa.float32(): pd.Float32Dtype(), pa.float64(): pd.Float64Dtype(),
+            pa.bool_(): pd.BooleanDtype(), pa.string(): pd.StringDtype(), pa.large_string(): pd.StringDtype(),
+        }
+        return table.to_pandas(types_mapper=nullable_types.get)
+    if dtype_backend == "numpy":
+        return table.to_pandas()
+    raise ValueError(f"Invalid dtype_backend specified. Choose from {', '.join(DTYPE_BACKENDS)}.")
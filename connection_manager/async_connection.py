@@ -0,0 +1,361 @@
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .aws_connection import AWSConnectionManager
+from .oracle_connection import OracleConnectionManager
+from .redshift_connection import RedshiftConnectionManager
+from .tableau_connection import TableauConnectionManager
+
+_DONE = object()
+
+class _AsyncIterator:
+    """
+    Async iterator over a synchronous generator; each item is fetched on the wrapper's executor.
+
+    Stopping early with ``aclose`` (or ``async with``) closes the generator on the executor. An
+    iterator abandoned after ``break`` closes it as soon as it is garbage collected, so the
+    generator's connection goes back to the pool right away instead of at interpreter shutdown.
+    """
+    def __init__(self, wrapper: "_AsyncConnectionManager", iterator: Iterator[Any]):
+        self._wrapper = wrapper
+        self._iterator: Optional[Iterator[Any]] = iterator
+
+    def __aiter__(self) -> "_AsyncIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._iterator is None:
+            raise StopAsyncIteration
+        item = await self._wrapper.run(next, self._iterator, _DONE)
+        if item is _DONE:
+            await self.aclose()
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self) -> None:
+        """Close the generator, releasing whatever it holds (cursor, pooled connection)."""
+        iterator, self._iterator = self._iterator, None
+        if iterator is not None:
+            await self._wrapper.run(iterator.close)
+
+    async def __aenter__(self) -> "_AsyncIterator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __del__(self):
+        iterator = getattr(self, "_iterator", None)
+        if iterator is not None:
+            self._iterator = None
+            try:
+                iterator.close()
+            except Exception:
+                pass
+
+class _AsyncConnectionManager:
+    """
+    Runs a synchronous manager's blocking calls on an executor, with bounded concurrency.
+    """
+    def __init__(self, manager: Any, executor: Optional[Executor] = None, max_concurrency: int = 10):
+        """
+        Initialise the async wrapper.
+
+        :param manager: The synchronous connection manager to wrap.
+        :param executor: Executor for blocking calls (default: a private thread pool of ``max_concurrency`` threads).
+        :param max_concurrency: Maximum number of blocking calls in flight at once.
+        """
+        self.manager = manager
+        self.max_concurrency: int = max_concurrency
+        self._owns_executor = executor is None
+        self.executor: Executor = executor if executor is not None else ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=type(self).__name__)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the executor once a concurrency slot is free.
+
+        :param func: Callable to run, e.g. ``manager.server.datasources.get_by_id``.
+        :return: The callable's return value.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def gather(self, calls: Iterable[Tuple[Callable, tuple]]) -> List[Any]:
+        """
+        Run many (callable, args) pairs concurrently, at most ``max_concurrency`` at a time.
+
+        :param calls: Iterable of (callable, positional arguments) pairs.
+        :return: Results in the order of ``calls``.
+        """
+        return await asyncio.gather(*(self.run(func, *args) for func, args in calls))
+
+    async def aclose(self) -> None:
+        """
+        Shut down the private executor, if this wrapper created it.
+        """
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+class _AsyncSQLConnectionManager(_AsyncConnectionManager):
+    """
+    Shared async surface of the Oracle and Redshift managers.
+    """
+    async def connect(self, *args, **kwargs) -> Any:
+        """Open the wrapped manager's single connection (see the synchronous ``connect``)."""
+        return await self.run(self.manager.connect, *args, **kwargs)
+
+    async def create_pool(self, *args, **kwargs) -> Any:
+        """
+        Create the wrapped manager's connection pool (see the synchronous ``create_pool``).
+
+        Size the pool to ``max_concurrency`` so concurrent queries do not queue on checkout.
+        """
+        kwargs.setdefault("max_size", self.max_concurrency)
+        return await self.run(self.manager.create_pool, *args, **kwargs)
+
+    async def fetch_all(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None, **kwargs) -> List[tuple]:
+        """
+        Execute a query on a pooled (or the single) connection and return all rows
+        (see the synchronous ``fetch_all``, including its result cache options).
+
+        :param query: SQL query string to execute.
+        :param params: Optional bind parameters.
+        :return: List of row tuples.
+        """
+        return await self.run(self.manager.fetch_all, query, params, **kwargs)
+
+    async def query_to_dataframe(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None, **kwargs) -> "pd.DataFrame":
+        """Run an Arrow-backed ``query_to_dataframe`` on the executor (see the synchronous method)."""
+        return await self.run(self.manager.query_to_dataframe, query, params, **kwargs)
+
+    async def execute_many(self, query: str, seq_of_params: Iterable[Union[Sequence[Any], Dict[str, Any]]], **kwargs) -> int:
+        """Run a batched ``execute_many`` on the executor (see the synchronous method)."""
+        return await self.run(self.manager.execute_many, query, seq_of_params, **kwargs)
+
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        chunk_size: int = 10000,
+        as_dataframe: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Async iterator over the batches of the synchronous ``stream_query``; each batch is fetched on the executor.
+
+        Use it with ``async with`` (or call ``aclose``) to release the connection as soon as
+        iteration stops early.
+        """
+        return _AsyncIterator(self, self.manager.stream_query(query, params, chunk_size=chunk_size, as_dataframe=as_dataframe))
+
+    async def close_pool(self) -> None:
+        """Close the wrapped manager's connection pool."""
+        await self.run(self.manager.close_pool)
+
+class AsyncOracleConnectionManager(_AsyncSQLConnectionManager):
+    """
+    Asyncio front end for OracleConnectionManager; cx_Oracle calls run on an executor.
+    """
+    def __init__(self, config: Optional[Dict] = None, executor: Optional[Executor] = None, max_concurrency: int = 10):
+        """
+        Initialise the async Oracle connection manager.
+
+        :param config: A dictionary containing Oracle connection details.
+        :param executor: Executor for blocking driver calls.
+        :param max_concurrency: Maximum number of concurrent driver calls.
+        """
+        super().__init__(OracleConnectionManager(config), executor, max_concurrency)
+
+class AsyncRedshiftConnectionManager(_AsyncSQLConnectionManager):
+    """
+    Asyncio front end for RedshiftConnectionManager.
+
+    By default psycopg2 calls run on an executor. With ``native=True`` queries go through an
+    asyncpg pool instead, which takes asyncpg-style ``$1`` placeholders.
+    """
+    def __init__(self, config: Optional[Dict] = None, executor: Optional[Executor] = None, max_concurrency: int = 10, native: bool = False):
+        """
+        Initialise the async Redshift connection manager.
+
+        :param config: A dictionary containing Redshift connection details.
+        :param executor: Executor for blocking driver calls.
+        :param max_concurrency: Maximum number of concurrent queries.
+        :param native: Use an asyncpg pool instead of psycopg2 on an executor.
+        """
+        super().__init__(RedshiftConnectionManager(config), executor, max_concurrency)
+        self.config: Optional[Dict] = config
+        self.native: bool = native
+        self.native_pool = None
+
+    async def create_pool(self, *args, **kwargs) -> Any:
+        """
+        Create the connection pool: an asyncpg pool in native mode, otherwise the wrapped manager's pool.
+        """
+        if not self.native:
+            return await super().create_pool(*args, **kwargs)
+        try:
+            import asyncpg
+        except ImportError:
+            raise ImportError("Native async Redshift access requires asyncpg. Install it with: pip install connection_manager[async]")
+        try:
+            redshift_config = self.config["redshift"]
+            pool_config = redshift_config.get("pool", {})
+
+            def option(name: str, default: Any) -> Any:
+                return kwargs[name] if kwargs.get(name) is not None else default
+
+            self.native_pool = await asyncpg.create_pool(
+                host=option("host", redshift_config["host"]),
+                port=option("port", redshift_config["port"]),
+                database=option("dbname", redshift_config["dbname"]),
+                user=option("user", redshift_config["user"]),
+                password=option("password", redshift_config["password"]),
+                min_size=option("min_size", pool_config.get("min_size", 1)),
+                max_size=option("max_size", self.max_concurrency),
+                max_inactive_connection_lifetime=option("idle_timeout", pool_config.get("idle_timeout", 300)),
+            )
+            return self.native_pool
+        except Exception as e:
+            raise ConnectionError(f"Failed to create asyncpg pool for Redshift: {e}")
+
+    async def fetch_all(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None, **kwargs) -> List[tuple]:
+        """
+        Execute a query and return all rows (native mode bypasses the result cache).
+
+        :param query: SQL query string (``$1`` placeholders in native mode, ``%s`` otherwise).
+        :param params: Optional query parameters (a sequence in native mode).
+        :return: List of row tuples.
+        """
+        if self.native_pool is None:
+            return await super().fetch_all(query, params, **kwargs)
+        async with self._semaphore:
+            records = await self.native_pool.fetch(query, *(params or ()))
+        return [tuple(record) for record in records]
+
+    async def close_pool(self) -> None:
+        """Close the asyncpg pool and/or the wrapped manager's pool."""
+        if self.native_pool is not None:
+            await self.native_pool.close()
+            self.native_pool = None
+        await super().close_pool()
+
+class AsyncAWSConnectionManager(_AsyncConnectionManager):
+    """
+    Asyncio front end for AWSConnectionManager; S3 calls run on an executor.
+    """
+    def __init__(self, config: Optional[Dict] = None, executor: Optional[Executor] = None, max_concurrency: int = 16):
+        """
+        Initialise the async AWS connection manager.
+
+        :param config: A dictionary containing AWS credentials.
+        :param executor: Executor for blocking boto3 calls.
+        :param max_concurrency: Maximum number of concurrent S3 calls.
+        """
+        super().__init__(AWSConnectionManager(config), executor, max_concurrency)
+
+    async def connect_to_s3(self, *args, **kwargs) -> Any:
+        """Create the S3 client (see the synchronous ``connect_to_s3``)."""
+        return await self.run(self.manager.connect_to_s3, *args, **kwargs)
+
+    async def list_buckets(self) -> list:
+        """List all S3 bucket names."""
+        return await self.run(self.manager.list_buckets)
+
+    async def upload(self, file_path: str, bucket: str, key: str, **kwargs) -> None:
+        """Upload a local file to S3 (see the synchronous ``upload``)."""
+        await self.run(self.manager.upload, file_path, bucket, key, **kwargs)
+
+    async def download(self, bucket: str, key: str, file_path: str, **kwargs) -> None:
+        """Download an S3 object to a local file (see the synchronous ``download``)."""
+        await self.run(self.manager.download, bucket, key, file_path, **kwargs)
+
+    async def upload_files(self, files: Iterable[Tuple[str, str]], bucket: str) -> None:
+        """
+        Upload many (local file path, key) pairs concurrently, at most ``max_concurrency`` at a time.
+        """
+        await asyncio.gather(*(self.upload(file_path, bucket, key) for file_path, key in files))
+
+    async def iter_objects(self, bucket: str, prefix: str = "", page_size: int = 1000) -> AsyncIterator[Dict]:
+        """
+        Async iterator over the objects under a prefix; each listing page is fetched on the executor.
+        """
+        client = self.manager._require_client()
+        kwargs = {"Bucket": bucket, "Prefix": prefix, "MaxKeys": page_size}
+        while True:
+            page = await self.run(client.list_objects_v2, **kwargs)
+            for summary in page.get("Contents", []):
+                yield summary
+            if not page.get("IsTruncated"):
+                break
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    async def delete_objects(self, bucket: str, keys: Iterable[str]) -> int:
+        """Delete objects in batches of 1000 keys (see the synchronous ``delete_objects``)."""
+        return await self.run(self.manager.delete_objects, bucket, list(keys))
+
+class AsyncTableauConnectionManager(_AsyncConnectionManager):
+    """
+    Asyncio front end for TableauConnectionManager; REST and Hyper calls run on an executor.
+
+    Endpoint calls without a dedicated coroutine can be offloaded with ``run``, e.g.
+    ``await manager.run(manager.manager.datasources.get_by_id, datasource_id)``.
+    """
+    def __init__(self, config: Optional[Dict] = None, executor: Optional[Executor] = None, max_concurrency: int = 10, **kwargs):
+        """
+        Initialise the async Tableau connection manager.
+
+        :param config: A dictionary containing Tableau connection details.
+        :param executor: Executor for blocking calls.
+        :param max_concurrency: Maximum number of concurrent REST/Hyper calls.
+        :param kwargs: Extra keyword arguments for TableauConnectionManager.
+        """
+        super().__init__(TableauConnectionManager(config, **kwargs), executor, max_concurrency)
+
+    async def connect_to_server(self, *args, **kwargs) -> Any:
+        """Sign in to Tableau Server (see the synchronous ``connect_to_server``)."""
+        return await self.run(self.manager.connect_to_server, *args, **kwargs)
+
+    async def load_hyper_to_dataframe(self, *args, **kwargs) -> Any:
+        """Download a published extract into a DataFrame (see the synchronous method)."""
+        return await self.run(self.manager.load_hyper_to_dataframe, *args, **kwargs)
+
+    def read_hyper(
+        self,
+        hyper_file: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        table_name: Any = None,
+        chunk_size: Optional[int] = None,
+        method: str = "fetch",
+    ) -> Union[Awaitable["pd.DataFrame"], AsyncIterator["pd.DataFrame"]]:
+        """
+        Read a local hyper file (see the synchronous ``read_hyper``).
+
+        Returns an awaitable DataFrame, or with ``chunk_size`` an async iterator of DataFrames
+        whose chunks are read on the executor, like ``stream_query``.
+        """
+        kwargs = dict(columns=columns, where=where, table_name=table_name, method=method)
+        if chunk_size:
+            return _AsyncIterator(self, self.manager.read_hyper(hyper_file, chunk_size=chunk_size, **kwargs))
+        return self.run(self.manager.read_hyper, hyper_file, **kwargs)
+
+    async def dataframe_to_local_hyper(self, *args, **kwargs) -> None:
+        """Write a DataFrame to a local hyper file (see the synchronous method)."""
+        await self.run(self.manager.dataframe_to_local_hyper, *args, **kwargs)
+
+    async def dataframe_to_published_datasource(self, *args, **kwargs) -> None:
+        """Publish a DataFrame as a datasource (see the synchronous method)."""
+        await self.run(self.manager.dataframe_to_published_datasource, *args, **kwargs)
+
+    async def aclose(self) -> None:
+        """Shut down the shared Hyper process and the private executor."""
+        await self.run(self.manager.close)
+        await super().aclose()
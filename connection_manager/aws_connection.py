@@ -1,5 +1,17 @@
-import boto3
-from typing import Optional, Dict
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Iterator, Iterable, Callable, List, Tuple
+from .instrumentation import instrument
+from ._lazy import lazy_import
+
+boto3 = lazy_import("boto3", extra="aws")
+s3_transfer = lazy_import("boto3.s3.transfer", extra="aws")
+botocore_config = lazy_import("botocore.config", extra="aws")
+
+logger = logging.getLogger(__name__)
 
 class AWSConnectionManager:
     """
@@ -14,10 +26,22 @@ class AWSConnectionManager:
         self.config: Optional[Dict] = config
         self.s3_client: Optional[boto3.client] = None
 
+        transfer_config = (config or {}).get("aws", {}).get("transfer", {})
+        self.transfer_config: s3_transfer.TransferConfig = s3_transfer.TransferConfig(
+            multipart_threshold=transfer_config.get("multipart_threshold", 64 * 1024 * 1024),
+            multipart_chunksize=transfer_config.get("multipart_chunksize", 64 * 1024 * 1024),
+            max_concurrency=transfer_config.get("max_concurrency", 10),
+            use_threads=True,
+        )
+        self.max_workers: int = transfer_config.get("max_workers", 16)
+
     def connect_to_s3(self, aws_access_key_id: Optional[str] = None, aws_secret_access_key: Optional[str] = None, region_name: Optional[str] = None) -> boto3.client:
         """
         Connect to AWS S3.
 
+        The client's HTTP connection pool is sized for ``max_workers`` concurrent objects, each
+        transferring ``transfer_config.max_concurrency`` parts.
+
         :param aws_access_key_id: AWS access key ID.
         :param aws_secret_access_key: AWS secret access key.
         :param region_name: AWS region name.
@@ -28,24 +52,220 @@ class AWSConnectionManager:
             aws_secret_access_key = aws_secret_access_key or self.config["aws"]["secret_access_key"]
             region_name = region_name or self.config["aws"]["region_name"]
 
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=region_name,
-            )
-            print("Successfully connected to AWS S3.")
+            with instrument("s3", "connect", region=region_name):
+                self.s3_client = boto3.client(
+                    "s3",
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    region_name=region_name,
+                    config=botocore_config.Config(max_pool_connections=max(10, self.max_workers * self.transfer_config.max_concurrency)),
+                )
+            logger.info("Successfully connected to AWS S3.")
             return self.s3_client
         except Exception as e:
             raise ConnectionError(f"Failed to connect to AWS S3: {e}")
 
+    def _require_client(self) -> boto3.client:
+        if not self.s3_client:
+            raise ConnectionError("Not connected to AWS S3. Call 'connect_to_s3' first.")
+        return self.s3_client
+
     def list_buckets(self) -> list:
         """
         List all S3 buckets in the account.
 
         :return: List of bucket names.
         """
-        if not self.s3_client:
-            raise ConnectionError("Not connected to AWS S3. Call 'connect_to_s3' first.")
-        response = self.s3_client.list_buckets()
+        response = self._require_client().list_buckets()
         return [bucket['Name'] for bucket in response['Buckets']]
+
+    def upload(self, file_path: str, bucket: str, key: str, callback: Optional[Callable[[int], None]] = None, extra_args: Optional[Dict] = None) -> None:
+        """
+        Upload a local file to S3, using concurrent multipart upload above the configured threshold.
+
+        :param file_path: Path of the local file.
+        :param bucket: Destination bucket.
+        :param key: Destination object key.
+        :param callback: Called with the number of bytes transferred since the previous call.
+        :param extra_args: Extra arguments passed to S3 (e.g. {"ServerSideEncryption": "AES256"}).
+        """
+        with instrument("s3", "upload", bucket=bucket, key=key, bytes=os.path.getsize(file_path)):
+            self._require_client().upload_file(
+                file_path, bucket, key, ExtraArgs=extra_args, Callback=callback, Config=self.transfer_config
+            )
+
+    def download(self, bucket: str, key: str, file_path: str, callback: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Download an S3 object to a local file, using concurrent ranged GETs for large objects.
+
+        :param bucket: Source bucket.
+        :param key: Source object key.
+        :param file_path: Path of the local file to write.
+        :param callback: Called with the number of bytes transferred since the previous call.
+        """
+        with instrument("s3", "download", bucket=bucket, key=key) as event:
+            self._require_client().download_file(bucket, key, file_path, Callback=callback, Config=self.transfer_config)
+            event["bytes"] = os.path.getsize(file_path)
+
+    def iter_objects(self, bucket: str, prefix: str = "", page_size: int = 1000) -> Iterator[Dict]:
+        """
+        Lazily iterate over the objects under a prefix, fetching one listing page at a time.
+
+        :param bucket: Bucket to list.
+        :param prefix: Key prefix to filter on.
+        :param page_size: Number of keys requested per page (at most 1000).
+        :return: Iterator of object summaries (``Key``, ``Size``, ``LastModified``, ``ETag``, ...).
+        """
+        paginator = self._require_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": page_size}):
+            yield from page.get("Contents", [])
+
+    def delete_objects(self, bucket: str, keys: Iterable[str]) -> int:
+        """
+        Delete objects in batches of 1000 keys per request.
+
+        :param bucket: Bucket containing the objects.
+        :param keys: Keys to delete.
+        :return: Number of keys deleted.
+        """
+        client = self._require_client()
+        deleted = 0
+        batch: List[str] = []
+
+        def flush() -> None:
+            nonlocal deleted
+            with instrument("s3", "delete", bucket=bucket, objects=len(batch)):
+                response = client.delete_objects(
+                    Bucket=bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+                )
+            errors = response.get("Errors", [])
+            if errors:
+                raise RuntimeError(f"Failed to delete {len(errors)} S3 objects, e.g. {errors[0].get('Key')}: {errors[0].get('Message')}")
+            deleted += len(batch)
+            batch.clear()
+
+        for key in keys:
+            batch.append(key)
+            if len(batch) == 1000:
+                flush()
+        if batch:
+            flush()
+        return deleted
+
+    def _run_bounded(
+        self,
+        operation: str,
+        tasks: Iterable[Tuple[str, Callable[[], None]]],
+        max_workers: Optional[int],
+        progress_callback: Optional[Callable[[int, str], None]],
+    ) -> int:
+        """
+        Run (name, task) pairs on a bounded thread pool, keeping at most ``2 * max_workers``
+        tasks queued so arbitrarily long listings are consumed lazily.
+        """
+        max_workers = max_workers or self.max_workers
+        completed = 0
+        pending = {}
+        with instrument("s3", operation, max_workers=max_workers) as event, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def drain(return_when) -> None:
+                nonlocal completed
+                done, _ = wait(list(pending), return_when=return_when)
+                for future in done:
+                    name = pending.pop(future)
+                    future.result()
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, name)
+
+            for name, task in tasks:
+                pending[executor.submit(task)] = name
+                if len(pending) >= 2 * max_workers:
+                    drain(FIRST_COMPLETED)
+            while pending:
+                drain(FIRST_COMPLETED)
+            event["objects"] = completed
+        return completed
+
+    def copy_prefix(
+        self,
+        source_bucket: str,
+        source_prefix: str,
+        destination_bucket: str,
+        destination_prefix: str,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> int:
+        """
+        Copy every object under a prefix server-side, on a bounded thread pool.
+
+        :param source_bucket: Bucket to copy from.
+        :param source_prefix: Prefix of the objects to copy.
+        :param destination_bucket: Bucket to copy to.
+        :param destination_prefix: Prefix replacing ``source_prefix`` in the destination keys.
+        :param max_workers: Number of concurrent object copies (defaults to ``aws.transfer.max_workers``).
+        :param progress_callback: Called with (objects completed, key) after each copy.
+        :return: Number of objects copied.
+        """
+        client = self._require_client()
+
+        def tasks() -> Iterator[Tuple[str, Callable[[], None]]]:
+            for summary in self.iter_objects(source_bucket, source_prefix):
+                key = summary["Key"]
+                destination_key = destination_prefix + key[len(source_prefix):]
+                yield key, lambda key=key, destination_key=destination_key: client.copy(
+                    {"Bucket": source_bucket, "Key": key}, destination_bucket, destination_key, Config=self.transfer_config
+                )
+
+        return self._run_bounded("copy_prefix", tasks(), max_workers, progress_callback)
+
+    def download_prefix(
+        self,
+        bucket: str,
+        prefix: str,
+        local_dir: str,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> int:
+        """
+        Download every object under a prefix into a local directory, on a bounded thread pool.
+
+        :param bucket: Bucket to download from.
+        :param prefix: Prefix of the objects to download; the remainder of each key becomes its local path.
+        :param local_dir: Directory to download into.
+        :param max_workers: Number of concurrent downloads (defaults to ``aws.transfer.max_workers``).
+        :param progress_callback: Called with (objects completed, key) after each download.
+        :return: Number of objects downloaded.
+        """
+        def tasks() -> Iterator[Tuple[str, Callable[[], None]]]:
+            for summary in self.iter_objects(bucket, prefix):
+                key = summary["Key"]
+                relative_key = key[len(prefix):].lstrip("/")
+                if not relative_key or key.endswith("/"):
+                    continue
+                file_path = os.path.join(local_dir, *relative_key.split("/"))
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                yield key, lambda key=key, file_path=file_path: self.download(bucket, key, file_path)
+
+        return self._run_bounded("download_prefix", tasks(), max_workers, progress_callback)
+
+    def upload_files(
+        self,
+        files: Iterable[Tuple[str, str]],
+        bucket: str,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> int:
+        """
+        Upload many local files concurrently, on a bounded thread pool.
+
+        :param files: Iterable of (local file path, destination key) pairs.
+        :param bucket: Destination bucket.
+        :param max_workers: Number of concurrent uploads (defaults to ``aws.transfer.max_workers``).
+        :param progress_callback: Called with (objects completed, key) after each upload.
+        :return: Number of files uploaded.
+        """
+        tasks = (
+            (key, lambda file_path=file_path, key=key: self.upload(file_path, bucket, key))
+            for file_path, key in files
+        )
+        return self._run_bounded("upload_files", tasks, max_workers, progress_callback)
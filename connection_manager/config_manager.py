@@ -1,11 +1,246 @@
+import copy
 import json
+import logging
+import os
+import threading
 import yaml
-from typing import Dict, Optional
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .secret_store import SecretProvider, SecretResolver, parse_secret_reference
+
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader parses several times faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_POOL_SCHEMA = {"min_size": int, "max_size": int, "timeout": float, "idle_timeout": float, "max_lifetime": float, "health_check_interval": float}
+_CACHE_SCHEMA = {
+    "enabled": bool, "max_bytes": int, "default_ttl": float, "spill_dir": str, "spill_threshold": int, "max_spill_bytes": int,
+}
+
+# Expected type of every setting the managers read, per section; nested dicts are subsections.
+CONFIG_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "tableau": {
+        "server_url": str, "token_name": str, "personal_access_token": str, "site_id": str, "server_version": str,
+        "hyper_telemetry": bool, "hyper_parameters": dict, "requests_per_second": float, "max_retries": int,
+        "session_cache_file": str, "session_ttl": float,
+    },
+    "oracle": {
+        "dsn": str, "user": str, "password": str, "statement_cache_size": int, "pool": _POOL_SCHEMA, "cache": _CACHE_SCHEMA,
+    },
+    "aws": {
+        "access_key_id": str, "secret_access_key": str, "region_name": str,
+        "transfer": {"multipart_threshold": int, "multipart_chunksize": int, "max_concurrency": int, "max_workers": int},
+    },
+    "redshift": {
+        "host": str, "port": int, "dbname": str, "user": str, "password": str, "iam_role": str,
+        "s3_staging_bucket": str, "s3_staging_prefix": str, "pool": _POOL_SCHEMA, "cache": _CACHE_SCHEMA,
+    },
+}
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+def yaml_load(stream: Any) -> Any:
+    """
+    Parse YAML with the C-accelerated safe loader when libyaml is available.
+    """
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+def _schema_for(path: Tuple[str, ...]) -> Any:
+    schema: Any = CONFIG_SCHEMA
+    for key in path:
+        if not isinstance(schema, dict):
+            return None
+        schema = schema.get(key)
+    return schema
+
+def _coerce(value: Any, expected: type) -> Any:
+    """
+    Convert ``value`` to ``expected`` where that is lossless (e.g. "5439" to 5439); raise ValueError otherwise.
+    """
+    if value is None:
+        return value
+    if expected is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.strip().lower() in _TRUE + _FALSE:
+            return value.strip().lower() in _TRUE
+    elif expected is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str) and value.strip().lstrip("+-").isdigit():
+            return int(value)
+    elif expected is float:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    elif expected is str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+    elif expected is dict:
+        if isinstance(value, str):
+            value = yaml_load(value)
+        if isinstance(value, dict):
+            return value
+    raise ValueError(f"expected {expected.__name__}, got {type(value).__name__} {value!r}")
+
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def _file_stamp(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+class Config(Mapping):
+    """
+    Read-only, dict-compatible view of the configuration loaded by a ``ConfigManager``.
+
+    Managers accept it wherever they take a config dictionary. Sections are ``Config`` views
+    too (also readable as attributes, e.g. ``config.redshift.pool.max_size``), secret
+    references are resolved when their value is read, and the view always reflects the
+    manager's latest reload.
+    """
+    __slots__ = ("_manager", "_path")
+
+    def __init__(self, manager: "ConfigManager", path: Tuple[str, ...] = ()):
+        self._manager = manager
+        self._path = path
+
+    def _data(self) -> Dict:
+        data = self._manager._data
+        for key in self._path:
+            data = data.get(key)
+            if not isinstance(data, dict):
+                # The section disappeared in a reload.
+                return {}
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data()[key]
+        if isinstance(value, dict):
+            return Config(self._manager, self._path + (key,))
+        reference = parse_secret_reference(value)
+        if reference is not None:
+            return self._manager._resolve_secret(self._path + (key,), *reference)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"Config section {'.'.join(self._path) or '<root>'!r} has no key {name!r}") from None
+
+    def to_dict(self, resolve_secrets: bool = False) -> Dict:
+        """
+        Plain nested dictionary copy of this view.
+
+        :param resolve_secrets: Replace secret references with their values instead of keeping them.
+        """
+        if not resolve_secrets:
+            return copy.deepcopy(self._data())
+        return {key: value.to_dict(True) if isinstance(value, Config) else copy.deepcopy(value) for key, value in self.items()}
+
+    def __repr__(self) -> str:
+        # Secret references are shown unresolved.
+        return f"Config({self._data()!r})"
 
 class ConfigManager:
     """
     Handles loading and saving of configuration files.
+
+    The static ``load_config`` returns a file as a plain dictionary. An instance layers the
+    file into a validated ``Config``: the base settings, then the selected entry of its
+    ``profiles`` section, then ``<env_prefix>__SECTION__KEY`` environment variables. Values of
+    the form ``secret://<provider>/<name>`` are resolved on first read and memoized.
+
+    Parsed files are cached per process keyed by path and modification time, so repeated
+    loads of an unchanged file skip parsing.
     """
+    _file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+    _file_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        profile: Optional[str] = None,
+        env_prefix: str = "CM",
+        secret_providers: Optional[Dict[str, SecretProvider]] = None,
+        validate: bool = True,
+    ):
+        """
+        Initialise the configuration manager and load ``file_path`` if given.
+
+        :param file_path: YAML or JSON configuration file.
+        :param profile: Entry of the file's ``profiles`` section to layer over the base settings
+            (default: the ``<env_prefix>_PROFILE`` environment variable, if set).
+        :param env_prefix: Prefix of override variables, e.g. ``CM__REDSHIFT__PORT=5439``.
+        :param secret_providers: Secret providers keyed by the name used in references,
+            e.g. {"file": FileSecretProvider("/run/secrets")}; ``env`` is always available.
+        :param validate: Check settings against ``CONFIG_SCHEMA`` and convert them to their types.
+        """
+        self.file_path: Optional[str] = os.path.abspath(os.path.expanduser(file_path)) if file_path else None
+        self.env_prefix: str = env_prefix
+        self.profile: Optional[str] = profile if profile is not None else os.environ.get(f"{env_prefix}_PROFILE")
+        self.validate: bool = validate
+        self.secrets: SecretResolver = SecretResolver(secret_providers)
+        self.config: Config = Config(self)
+        self._data: Dict = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[Config], None]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        if self.file_path:
+            self.reload(force=True)
+
+    @classmethod
+    def _read_file(cls, file_path: str) -> Tuple[Tuple[int, int], Any]:
+        """
+        Parse a configuration file, reusing the cached result while its mtime and size are unchanged.
+        """
+        file_path = os.path.abspath(os.path.expanduser(file_path))
+        stamp = _file_stamp(file_path)
+        cached = cls._file_cache.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            return cached
+        with open(file_path, 'r') as file:
+            if file_path.endswith('.json'):
+                data = json.load(file)
+            elif file_path.endswith('.yaml') or file_path.endswith('.yml'):
+                data = yaml_load(file)
+            else:
+                raise ValueError("Unsupported config file format.")
+        with cls._file_cache_lock:
+            cls._file_cache[file_path] = (stamp, data)
+        return stamp, data
+
     @staticmethod
     def load_config(file_path: str) -> Dict:
         """
@@ -15,16 +250,180 @@ class ConfigManager:
         :return: Dictionary with configuration data.
         """
         try:
-            with open(file_path, 'r') as file:
-                if file_path.endswith('.json'):
-                    return json.load(file)
-                elif file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                    return yaml.safe_load(file)
-                else:
-                    raise ValueError("Unsupported config file format.")
+            return copy.deepcopy(ConfigManager._read_file(file_path)[1])
         except Exception as e:
             raise FileNotFoundError(f"Failed to load config file: {e}")
 
+    @staticmethod
+    def validate_config(config: Dict) -> Dict:
+        """
+        Check a configuration dictionary against ``CONFIG_SCHEMA``.
+
+        Values are converted to their expected types where that is lossless (environment
+        overrides arrive as strings); secret references are checked once resolved. Unknown keys
+        in known sections are logged as likely typos.
+
+        :param config: Configuration dictionary.
+        :return: A validated copy of the configuration.
+        :raises ValueError: Listing every invalid setting.
+        """
+        errors: List[str] = []
+
+        def check(data: Dict, schema: Dict, path: Tuple[str, ...]) -> Dict:
+            checked = {}
+            for key, value in data.items():
+                name = ".".join(path + (key,))
+                expected = schema.get(key)
+                if expected is None:
+                    logger.warning("Unknown configuration key '%s'.", name)
+                    checked[key] = value
+                elif isinstance(expected, dict):
+                    if isinstance(value, dict):
+                        checked[key] = check(value, expected, path + (key,))
+                    else:
+                        errors.append(f"{name}: expected a section, got {type(value).__name__}")
+                elif parse_secret_reference(value) is not None:
+                    checked[key] = value
+                else:
+                    try:
+                        value = checked[key] = _coerce(value, expected)
+                    except ValueError as e:
+                        errors.append(f"{name}: {e}")
+                        continue
+                    if isinstance(value, (int, float)) and not isinstance(value, bool) and value < 0:
+                        errors.append(f"{name}: must not be negative, got {value}")
+            pool = checked.get("pool")
+            if isinstance(pool, dict) and isinstance(pool.get("min_size"), int) and isinstance(pool.get("max_size"), int):
+                if pool["min_size"] > pool["max_size"]:
+                    errors.append(f"{'.'.join(path + ('pool',))}: min_size {pool['min_size']} exceeds max_size {pool['max_size']}")
+            return checked
+
+        if not isinstance(config, dict):
+            raise ValueError(f"Configuration must be a mapping, got {type(config).__name__}.")
+        validated = {}
+        for section, value in config.items():
+            schema = CONFIG_SCHEMA.get(section)
+            if schema is not None and isinstance(value, dict):
+                validated[section] = check(value, schema, (section,))
+            elif schema is not None and value is not None:
+                errors.append(f"{section}: expected a section, got {type(value).__name__}")
+            else:
+                validated[section] = value
+        if errors:
+            raise ValueError("Invalid configuration: " + "; ".join(errors))
+        return validated
+
+    def _environment_overrides(self) -> Dict:
+        marker = f"{self.env_prefix}__"
+        overrides: Dict = {}
+        for name, value in os.environ.items():
+            if not name.startswith(marker):
+                continue
+            path = [part.lower() for part in name[len(marker):].split("__") if part]
+            if not path:
+                continue
+            target = overrides
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+        return overrides
+
+    def _layer(self, data: Any) -> Dict:
+        if data is None:
+            data = {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Configuration file {self.file_path} must contain a mapping.")
+        profiles = data.get("profiles") or {}
+        layered = {key: value for key, value in data.items() if key != "profiles"}
+        if self.profile:
+            if self.profile not in profiles:
+                raise ValueError(f"Profile {self.profile!r} is not defined in {self.file_path} (available: {sorted(profiles)}).")
+            layered = _deep_merge(layered, profiles[self.profile] or {})
+        layered = _deep_merge(layered, self._environment_overrides())
+        return self.validate_config(layered) if self.validate else layered
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reload the configuration if the file changed since it was last loaded.
+
+        Views handed out earlier (``self.config`` and its sections) see the new settings
+        immediately. On failure (unreadable, empty or invalid file) the previous configuration
+        stays in effect.
+
+        :param force: Reload even if the file is unchanged (e.g. to pick up new environment overrides).
+        :return: True if the configuration was reloaded.
+        """
+        if not self.file_path:
+            raise ValueError("ConfigManager was created without a file_path.")
+        with self._lock:
+            stamp = _file_stamp(self.file_path)
+            if not force and self._stamp == stamp:
+                return False
+            try:
+                stamp, data = self._read_file(self.file_path)
+                if data is None and self._data:
+                    # Most likely caught mid-write; the finished write changes the stamp again.
+                    raise ValueError(f"Configuration file {self.file_path} is empty.")
+                self._data = self._layer(data)
+            finally:
+                # A failed version is not retried (or logged again) until the file changes.
+                self._stamp = stamp
+        logger.info("Loaded configuration from %s%s", self.file_path, f" (profile {self.profile})" if self.profile else "")
+        return True
+
+    def _resolve_secret(self, path: Tuple[str, ...], provider: str, name: str) -> Any:
+        try:
+            value = self.secrets.resolve(provider, name)
+        except Exception as e:
+            # Not a KeyError, so Mapping.get() does not mistake a failed lookup for a missing key.
+            raise ValueError(f"Failed to resolve secret for '{'.'.join(path)}': {e}") from e
+        expected = _schema_for(path)
+        if self.validate and isinstance(expected, type):
+            try:
+                return _coerce(value, expected)
+            except ValueError as e:
+                raise ValueError(f"Invalid secret for '{'.'.join(path)}': {e}") from None
+        return value
+
+    def watch(self, callback: Optional[Callable[[Config], None]] = None, interval: float = 1.0) -> None:
+        """
+        Reload the configuration in a background thread whenever the file changes.
+
+        :param callback: Called with ``self.config`` after each reload, e.g. to rebuild connection pools.
+        :param interval: Seconds between modification-time checks.
+        """
+        if callback is not None:
+            self._callbacks.append(callback)
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+
+        def poll() -> None:
+            while not self._stop_watching.wait(interval):
+                try:
+                    changed = self.reload()
+                except Exception:
+                    logger.exception("Failed to reload %s; keeping the previous configuration.", self.file_path)
+                    continue
+                if changed:
+                    for registered in list(self._callbacks):
+                        try:
+                            registered(self.config)
+                        except Exception:
+                            logger.exception("Configuration reload callback %r failed.", registered)
+
+        self._watcher = threading.Thread(target=poll, name="connection-manager-config-watch", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """
+        Stop the background reload thread started by ``watch``.
+        """
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
     @staticmethod
     def create_sample_config(file_path: str, config_type: Optional[str] = "all", format: str = "yaml") -> None:
         """
@@ -41,21 +440,47 @@ class ConfigManager:
                     "token_name": "your-token-name",
                     "personal_access_token": "your-personal-access-token",
                     "site_id": "default",
-                    "server_version": "2023.2"
+                    "server_version": "2023.2",
+                    "hyper_telemetry": False,
+                    "requests_per_second": 10,
+                    "max_retries": 5,
+                    "session_cache_file": "~/.connection_manager/tableau_sessions.json",
+                    "session_ttl": 7200
                 }
             },
             "oracle": {
                 "oracle": {
                     "dsn": "your-host:1521/your-service",
                     "user": "your-username",
-                    "password": "your-password"
+                    "password": "your-password",
+                    "statement_cache_size": 50,
+                    "pool": {
+                        "min_size": 1,
+                        "max_size": 5,
+                        "timeout": 30,
+                        "idle_timeout": 300,
+                        "max_lifetime": 3600,
+                        "health_check_interval": 30
+                    },
+                    "cache": {
+                        "enabled": False,
+                        "max_bytes": 268435456,
+                        "default_ttl": 300,
+                        "spill_dir": ""
+                    }
                 }
             },
             "aws": {
                 "aws": {
                     "access_key_id": "your-access-key-id",
                     "secret_access_key": "your-secret-access-key",
-                    "region_name": "your-region"
+                    "region_name": "your-region",
+                    "transfer": {
+                        "multipart_threshold": 67108864,
+                        "multipart_chunksize": 67108864,
+                        "max_concurrency": 10,
+                        "max_workers": 16
+                    }
                 }
             },
             "redshift": {
@@ -64,7 +489,24 @@ class ConfigManager:
                     "port": 5439,
                     "dbname": "your-database-name",
                     "user": "your-username",
-                    "password": "your-password"
+                    "password": "your-password",
+                    "iam_role": "arn:aws:iam::123456789012:role/your-redshift-copy-role",
+                    "s3_staging_bucket": "your-staging-bucket",
+                    "s3_staging_prefix": "redshift-staging",
+                    "pool": {
+                        "min_size": 1,
+                        "max_size": 5,
+                        "timeout": 30,
+                        "idle_timeout": 300,
+                        "max_lifetime": 3600,
+                        "health_check_interval": 30
+                    },
+                    "cache": {
+                        "enabled": False,
+                        "max_bytes": 268435456,
+                        "default_ttl": 300,
+                        "spill_dir": ""
+                    }
                 }
             }
         }
@@ -85,6 +527,6 @@ class ConfigManager:
                     json.dump(sample_config, file, indent=4)
                 else:
                     raise ValueError("Unsupported file format. Choose 'yaml' or 'json'.")
-            print(f"Sample configuration file created at: {file_path}")
+            logger.info("Sample configuration file created at: %s", file_path)
         except Exception as e:
             raise IOError(f"Failed to create sample config file: {e}")
\ No newline at end of file
@@ -0,0 +1,326 @@
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+class Event(NamedTuple):
+    """
+    One timed operation reported by a manager.
+
+    ``component`` is the backend ("oracle", "redshift", "s3", "hyper", "tableau" or "retry") and
+    ``operation`` the step within it ("connect", "execute", "fetch", "upload", "write", ...).
+    ``attributes`` carries counters such as ``rows`` and ``bytes`` plus context such as ``statement``.
+    """
+    component: str
+    operation: str
+    start_time: float
+    duration: float
+    attributes: Dict[str, Any]
+    error: Optional[BaseException] = None
+
+Listener = Callable[[Event], None]
+
+_listeners: List[Listener] = []
+_listeners_lock = threading.Lock()
+
+def add_listener(listener: Listener) -> Listener:
+    """
+    Register a callable receiving every ``Event`` emitted by the managers (process-wide).
+
+    :return: The listener, so it can later be passed to ``remove_listener``.
+    """
+    global _listeners
+    with _listeners_lock:
+        _listeners = _listeners + [listener]
+    return listener
+
+def remove_listener(listener: Listener) -> None:
+    """
+    Unregister a listener added with ``add_listener``.
+    """
+    global _listeners
+    with _listeners_lock:
+        _listeners = [registered for registered in _listeners if registered is not listener]
+
+def emit(event: Event) -> None:
+    """
+    Deliver an event to every listener; a failing listener is logged and never breaks the caller.
+    """
+    for listener in _listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Instrumentation listener %r failed.", listener)
+
+@contextmanager
+def instrument(component: str, operation: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time the enclosed block and emit it as an ``Event``.
+
+    The yielded dictionary holds ``attributes`` and may be updated inside the block, e.g. to
+    add the number of rows fetched. With no listeners registered nothing is timed or emitted.
+
+    :param component: Backend name, e.g. "oracle" or "s3".
+    :param operation: Operation name, e.g. "execute" or "upload".
+    :param attributes: Initial event attributes.
+    """
+    if not _listeners:
+        yield attributes
+        return
+    start_time = time.time()
+    started = time.perf_counter()
+    error = None
+    try:
+        yield attributes
+    except GeneratorExit:
+        # A streaming generator closed early by its consumer is not a failure.
+        raise
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        emit(Event(component, operation, start_time, time.perf_counter() - started, attributes, error))
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "count", "errors", "total", "minimum", "maximum", "totals")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.totals: Dict[str, float] = defaultdict(float)
+
+    def observe(self, event: Event) -> None:
+        self.counts[bisect.bisect_left(self.bounds, event.duration)] += 1
+        self.count += 1
+        self.errors += event.error is not None
+        self.total += event.duration
+        self.minimum = min(self.minimum, event.duration)
+        self.maximum = max(self.maximum, event.duration)
+        for name in ("rows", "bytes", "objects"):
+            value = event.attributes.get(name)
+            if isinstance(value, (int, float)):
+                self.totals[name] += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation inside the bucket holding its rank.
+        """
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.maximum
+                lower, upper = max(lower, self.minimum), min(upper, self.maximum)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.maximum
+
+class MetricsCollector:
+    """
+    In-memory listener aggregating events into per-operation latency histograms and counters.
+
+    Register it with ``add_listener`` and call ``report()`` to see which stage of a pipeline
+    takes the time.
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialise the collector.
+
+        :param buckets: Upper bounds (seconds) of the latency histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        key = f"{event.component}.{event.operation}"
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(event)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-operation statistics keyed "component.operation": count, errors, total/mean/min/max
+        and p50/p95/p99 seconds, summed rows/bytes/objects and raw bucket counts.
+        """
+        with self._lock:
+            return {
+                key: dict(
+                    count=histogram.count,
+                    errors=histogram.errors,
+                    total=histogram.total,
+                    mean=histogram.total / histogram.count,
+                    min=histogram.minimum,
+                    max=histogram.maximum,
+                    p50=histogram.quantile(0.5),
+                    p95=histogram.quantile(0.95),
+                    p99=histogram.quantile(0.99),
+                    buckets=dict(zip(self.buckets + (float("inf"),), histogram.counts)),
+                    **histogram.totals,
+                )
+                for key, histogram in self._histograms.items()
+            }
+
+    def report(self) -> str:
+        """
+        Plain-text table of all operations, sorted by total time spent.
+        """
+        rows = sorted(self.snapshot().items(), key=lambda item: item[1]["total"], reverse=True)
+        lines = [f"{'operation':<28}{'count':>8}{'errors':>8}{'total s':>11}{'mean ms':>11}{'p95 ms':>11}{'rows':>12}{'MB':>10}"]
+        for key, stats in rows:
+            lines.append(
+                f"{key:<28}{stats['count']:>8}{stats['errors']:>8}{stats['total']:>11.3f}{stats['mean'] * 1000:>11.2f}"
+                f"{stats['p95'] * 1000:>11.2f}{int(stats.get('rows', 0)):>12}{stats.get('bytes', 0) / 2 ** 20:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Drop all collected statistics.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+class SlowQueryLogger:
+    """
+    Listener logging operations that exceed a duration threshold, with their SQL statement.
+    """
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        thresholds: Optional[Dict[str, float]] = None,
+        log: Optional[logging.Logger] = None,
+        level: int = logging.WARNING,
+        max_statement_length: int = 1000,
+    ):
+        """
+        Initialise the slow-query logger.
+
+        :param threshold: Default threshold in seconds.
+        :param thresholds: Overrides keyed "component.operation" or "component",
+            e.g. {"redshift.execute": 10.0, "s3": 30.0}.
+        :param log: Logger to write to (default: ``connection_manager.slow_query``).
+        :param level: Log level for slow operations.
+        :param max_statement_length: Statements are truncated to this many characters.
+        """
+        self.threshold = threshold
+        self.thresholds = thresholds or {}
+        self.log = log or logging.getLogger("connection_manager.slow_query")
+        self.level = level
+        self.max_statement_length = max_statement_length
+
+    def __call__(self, event: Event) -> None:
+        threshold = self.thresholds.get(
+            f"{event.component}.{event.operation}", self.thresholds.get(event.component, self.threshold)
+        )
+        if event.duration < threshold:
+            return
+        attributes = dict(event.attributes)
+        statement = attributes.pop("statement", None)
+        if statement is not None:
+            statement = " ".join(str(statement).split())[:self.max_statement_length]
+        self.log.log(
+            self.level, "Slow %s.%s took %.3fs (threshold %.3fs) %s%s",
+            event.component, event.operation, event.duration, threshold, attributes,
+            f": {statement}" if statement else "",
+        )
+
+class OpenTelemetryExporter:
+    """
+    Listener exporting events as OpenTelemetry spans and duration/row/byte metrics.
+
+    Requires the ``opentelemetry-api`` package; providers default to the globally configured ones.
+    Without the package the exporter logs a warning and ignores events.
+    """
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        """
+        Initialise the exporter.
+
+        :param tracer_provider: TracerProvider to create spans with.
+        :param meter_provider: MeterProvider to record metrics with.
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError:
+            logger.warning("OpenTelemetryExporter is disabled: 'opentelemetry-api' is not installed. Install it with: pip install connection_manager[opentelemetry]")
+            self.enabled = False
+            return
+        self.enabled = True
+        self._trace = trace
+        self.tracer = trace.get_tracer("connection_manager", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("connection_manager", meter_provider=meter_provider)
+        self.duration = meter.create_histogram("connection_manager.operation.duration", unit="s", description="Duration of manager operations.")
+        self.rows = meter.create_counter("connection_manager.rows", description="Rows fetched or written.")
+        self.bytes = meter.create_counter("connection_manager.bytes", unit="By", description="Bytes transferred.")
+
+    def __call__(self, event: Event) -> None:
+        if not self.enabled:
+            return
+        labels = {"component": event.component, "operation": event.operation, "error": event.error is not None}
+        start_ns = int(event.start_time * 1e9)
+        span = self.tracer.start_span(f"{event.component}.{event.operation}", start_time=start_ns)
+        for name, value in event.attributes.items():
+            if isinstance(value, (str, bool, int, float)):
+                span.set_attribute(f"connection_manager.{name}", value)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start_ns + int(event.duration * 1e9))
+        self.duration.record(event.duration, labels)
+        if isinstance(event.attributes.get("rows"), int):
+            self.rows.add(event.attributes["rows"], labels)
+        if isinstance(event.attributes.get("bytes"), int):
+            self.bytes.add(event.attributes["bytes"], labels)
+
+class PrometheusExporter:
+    """
+    Listener exporting events as Prometheus histograms and counters.
+
+    Requires the ``prometheus_client`` package; expose the registry with its HTTP server or
+    ``generate_latest``. Without the package the exporter logs a warning and ignores events.
+    """
+    def __init__(self, registry: Any = None, namespace: str = "connection_manager", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialise the exporter.
+
+        :param registry: CollectorRegistry to register the metrics with (default: the global registry).
+        :param namespace: Metric name prefix.
+        :param buckets: Latency histogram bucket upper bounds in seconds.
+        """
+        try:
+            from prometheus_client import REGISTRY, Counter, Histogram
+        except ImportError:
+            logger.warning("PrometheusExporter is disabled: 'prometheus_client' is not installed. Install it with: pip install connection_manager[prometheus]")
+            self.enabled = False
+            return
+        self.enabled = True
+        registry = registry if registry is not None else REGISTRY
+        labels = ("component", "operation", "status")
+        self.duration = Histogram("operation_duration_seconds", "Duration of manager operations.", labels, namespace=namespace, buckets=tuple(buckets), registry=registry)
+        self.rows = Counter("rows", "Rows fetched or written.", labels, namespace=namespace, registry=registry)
+        self.bytes = Counter("bytes", "Bytes transferred.", labels, namespace=namespace, registry=registry)
+
+    def __call__(self, event: Event) -> None:
+        if not self.enabled:
+            return
+        labels = (event.component, event.operation, "error" if event.error is not None else "ok")
+        self.duration.labels(*labels).observe(event.duration)
+        if isinstance(event.attributes.get("rows"), (int, float)):
+            self.rows.labels(*labels).inc(event.attributes["rows"])
+        if isinstance(event.attributes.get("bytes"), (int, float)):
+            self.bytes.labels(*labels).inc(event.attributes["bytes"])
@@ -1,18 +1,37 @@
-import cx_Oracle
-from typing import Optional, Dict
+from __future__ import annotations
+
+import itertools
+import logging
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterable, Iterator, Union, List, Sequence, Any, Callable
+from .query_cache import QueryCache
+from .pool import PooledCursor
+from .instrumentation import instrument
+from ._lazy import lazy_import
+
+cx_Oracle = lazy_import("cx_Oracle", extra="oracle")
+
+logger = logging.getLogger(__name__)
+
+_DISCONNECT_ERRORS = ("ORA-03113", "ORA-03114", "DPI-1080")
 
 class OracleConnectionManager:
     """
     Manages connections to Oracle databases and allows command passthrough.
     """
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(self, config: Optional[Dict] = None, cache: Optional[QueryCache] = None):
         """
         Initialise Oracle connection manager.
 
         :param config: A dictionary containing Oracle connection details.
+        :param cache: Result cache used by ``fetch_all`` (defaults to one built from ``oracle.cache``
+            in the config, if present).
         """
         self.config: Optional[Dict] = config
+        self.cache: Optional[QueryCache] = cache or QueryCache.from_config((config or {}).get("oracle", {}).get("cache"))
         self.connection: Optional[cx_Oracle.Connection] = None
+        self.pool: Optional[cx_Oracle.SessionPool] = None
+        self.statement_cache_size: int = (config or {}).get("oracle", {}).get("statement_cache_size", 50)
 
     def connect(self, dsn: Optional[str] = None, user: Optional[str] = None, password: Optional[str] = None) -> cx_Oracle.Connection:
         """
@@ -28,21 +47,403 @@ class OracleConnectionManager:
             user = user or self.config["oracle"]["user"]
             password = password or self.config["oracle"]["password"]
 
-            self.connection = cx_Oracle.connect(user=user, password=password, dsn=dsn)
-            print("Successfully connected to Oracle.")
+            with instrument("oracle", "connect", dsn=dsn):
+                self.connection = cx_Oracle.connect(user=user, password=password, dsn=dsn)
+            self.connection.stmtcachesize = self.statement_cache_size
+            logger.info("Successfully connected to Oracle.")
             return self.connection
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Oracle: {e}")
 
-    def execute_query(self, query: str) -> cx_Oracle.Cursor:
+    def create_pool(
+        self,
+        dsn: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        max_lifetime: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+    ) -> cx_Oracle.SessionPool:
+        """
+        Create a cx_Oracle SessionPool; afterwards ``acquire`` and ``execute_query`` use pooled sessions.
+
+        Pool settings not passed explicitly are read from the optional ``oracle.pool`` config section.
+
+        :param dsn: Data source name (host:port/service_name).
+        :param user: Oracle username.
+        :param password: Oracle password.
+        :param min_size: Number of sessions kept open (default 1).
+        :param max_size: Maximum number of sessions (default 5).
+        :param timeout: Seconds to wait for a free session on checkout (default 30).
+        :param idle_timeout: Seconds before an idle session is closed (default 300).
+        :param max_lifetime: Seconds before a session is retired (default 3600).
+        :param health_check_interval: Seconds a session must have been idle before the pool
+            pings it on checkout (the SessionPool's ``ping_interval``; default 30).
+        :return: The cx_Oracle SessionPool.
+        """
+        try:
+            pool_config = (self.config or {}).get("oracle", {}).get("pool", {})
+            dsn = dsn or self.config["oracle"]["dsn"]
+            user = user or self.config["oracle"]["user"]
+            password = password or self.config["oracle"]["password"]
+            min_size = min_size if min_size is not None else pool_config.get("min_size", 1)
+            max_size = max_size if max_size is not None else pool_config.get("max_size", 5)
+            timeout = timeout if timeout is not None else pool_config.get("timeout", 30)
+            idle_timeout = idle_timeout if idle_timeout is not None else pool_config.get("idle_timeout", 300)
+            max_lifetime = max_lifetime if max_lifetime is not None else pool_config.get("max_lifetime", 3600)
+            health_check_interval = health_check_interval if health_check_interval is not None else pool_config.get("health_check_interval", 30)
+
+            with instrument("oracle", "create_pool", dsn=dsn, min_size=min_size, max_size=max_size):
+                self.pool = cx_Oracle.SessionPool(
+                    user=user,
+                    password=password,
+                    dsn=dsn,
+                    min=min_size,
+                    max=max_size,
+                    increment=1,
+                    threaded=True,
+                    getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+                    wait_timeout=int(timeout * 1000),
+                    timeout=int(idle_timeout),
+                    max_lifetime_session=int(max_lifetime),
+                    stmtcachesize=self.statement_cache_size,
+                )
+                self.pool.ping_interval = int(health_check_interval)
+            logger.info("Created Oracle session pool (%s-%s sessions).", min_size, max_size)
+            return self.pool
+        except Exception as e:
+            raise ConnectionError(f"Failed to create Oracle session pool: {e}")
+
+    @contextmanager
+    def acquire(self) -> Iterator[cx_Oracle.Connection]:
+        """
+        Context manager yielding a connection: a pooled session when a pool exists, otherwise
+        the connection opened by ``connect``.
+
+        A pooled session is dropped instead of returned to the pool when the block fails with
+        a disconnect error (ORA-03113, ORA-03114, DPI-1080).
+        """
+        if self.pool is None:
+            if not self.connection:
+                raise ConnectionError("Not connected to Oracle. Call 'connect' or 'create_pool' first.")
+            yield self.connection
+            return
+
+        pool = self.pool
+        connection = self._checkout()
+        discard = False
+        try:
+            yield connection
+        except cx_Oracle.DatabaseError as e:
+            discard = self._is_disconnect(e)
+            raise
+        finally:
+            # Also runs on GeneratorExit, when a generator holding the session is closed early.
+            if discard:
+                pool.drop(connection)
+            else:
+                pool.release(connection)
+
+    def _checkout(self) -> cx_Oracle.Connection:
+        """
+        Acquire a session from the pool; the pool itself pings sessions idle for longer
+        than its ``ping_interval``.
+        """
+        with instrument("oracle", "checkout"):
+            return self.pool.acquire()
+
+    @staticmethod
+    def _is_disconnect(error: cx_Oracle.DatabaseError) -> bool:
+        """
+        Whether a database error means the session's connection to the server is gone.
+        """
+        detail = error.args[0] if error.args else ""
+        message = str(getattr(detail, "message", detail))
+        return message.startswith(_DISCONNECT_ERRORS)
+
+    def close_pool(self) -> None:
+        """
+        Close the session pool, if one was created.
+        """
+        if self.pool is not None:
+            self.pool.close(force=True)
+            self.pool = None
+
+    def execute(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None) -> Union[cx_Oracle.Cursor, PooledCursor]:
+        """
+        Execute a SQL statement with bind parameters on the Oracle database.
+
+        Binding values (``:name`` or ``:1`` placeholders) instead of formatting them into the
+        SQL lets Oracle and the session statement cache reuse the parsed statement.
+
+        In pooled mode the returned cursor holds a pooled session until it is closed;
+        commit through ``cursor.connection`` before closing, as uncommitted work is rolled back.
+
+        :param query: SQL statement to execute.
+        :param params: Bind parameters, as a sequence or a dictionary.
+        :return: Cursor with the results of the query.
+        """
+        if self.pool is None:
+            if not self.connection:
+                raise ConnectionError("Not connected to Oracle. Call 'connect' first.")
+            cursor = self.connection.cursor()
+            with instrument("oracle", "execute", statement=query):
+                cursor.execute(query, params or [])
+            return cursor
+
+        pool = self.pool
+        connection = self._checkout()
+        try:
+            cursor = connection.cursor()
+            with instrument("oracle", "execute", statement=query):
+                cursor.execute(query, params or [])
+        except Exception:
+            pool.release(connection)
+            raise
+        return PooledCursor(cursor, lambda: pool.release(connection))
+
+    def execute_query(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None) -> Union[cx_Oracle.Cursor, PooledCursor]:
         """
         Execute a SQL query on the Oracle database.
 
         :param query: SQL query string to execute.
+        :param params: Optional bind parameters (see ``execute``).
         :return: Cursor with the results of the query.
         """
-        if not self.connection:
-            raise ConnectionError("Not connected to Oracle. Call 'connect' first.")
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor
+        return self.execute(query, params)
+
+    def execute_many(
+        self,
+        query: str,
+        seq_of_params: Iterable[Union[Sequence[Any], Dict[str, Any]]],
+        batch_size: int = 10000,
+        commit: bool = True,
+    ) -> int:
+        """
+        Execute a DML statement for every parameter set using array binding.
+
+        Parameter sets are sent ``batch_size`` at a time with ``cursor.executemany``, so each
+        batch is a single round trip.
+
+        :param query: SQL statement with bind placeholders, e.g. "INSERT INTO t (a, b) VALUES (:1, :2)".
+        :param seq_of_params: Iterable of parameter sets; consumed lazily one batch at a time.
+        :param batch_size: Number of parameter sets bound per round trip.
+        :param commit: Commit once all batches have been executed; if a batch fails, the batches
+            already executed are rolled back instead.
+        :return: Total number of rows affected.
+        """
+        rows_affected = 0
+        iterator = iter(seq_of_params)
+        with self.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                while True:
+                    batch = list(itertools.islice(iterator, batch_size))
+                    if not batch:
+                        break
+                    with instrument("oracle", "execute_many", statement=query, rows=len(batch)):
+                        cursor.executemany(query, batch)
+                    rows_affected += cursor.rowcount
+                if commit:
+                    with instrument("oracle", "commit"):
+                        connection.commit()
+            except Exception:
+                if commit:
+                    connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        return rows_affected
+
+    def fetch_all(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        ttl: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+        use_cache: bool = True,
+    ) -> List[tuple]:
+        """
+        Execute a query and return all rows, serving repeats from the result cache when one is configured.
+
+        Cached results are tagged with the tables named in the query plus ``tags``; drop them
+        with ``cache.invalidate(table)`` after the table changes.
+
+        :param query: SQL query string to execute.
+        :param params: Optional bind parameters (part of the cache key).
+        :param ttl: Seconds to cache this result (default: the cache's ``default_ttl``).
+        :param tags: Extra invalidation tags for this result.
+        :param use_cache: Set to False to bypass the cache for this call.
+        :return: List of row tuples.
+        """
+        key = None
+        if self.cache is not None and use_cache:
+            key = self.cache.make_key(query, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return list(cached[1])
+
+        with self.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                with instrument("oracle", "execute", statement=query):
+                    cursor.execute(query, params or [])
+                if cursor.description is None:
+                    return []
+                columns = [column[0] for column in cursor.description]
+                with instrument("oracle", "fetch", statement=query) as event:
+                    rows = cursor.fetchall()
+                    event["rows"] = len(rows)
+            finally:
+                cursor.close()
+
+        if key is not None:
+            self.cache.put(key, columns, rows, ttl=ttl, tags=QueryCache.table_tags(query) | set(tags or ()))
+        return rows
+
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        chunk_size: int = 10000,
+        as_dataframe: bool = False,
+        on_description: Optional[Callable[[Sequence[Any]], None]] = None,
+    ) -> Iterator[Union[List[tuple], "pd.DataFrame"]]:
+        """
+        Execute a SQL query and yield its result set in batches of at most ``chunk_size`` rows.
+
+        The cursor's ``arraysize`` and ``prefetchrows`` are sized to the chunk so each batch is
+        a single round trip, and only one batch is held in memory at a time.
+
+        :param query: SQL query string to execute.
+        :param params: Optional bind parameters for the query.
+        :param chunk_size: Number of rows per batch.
+        :param as_dataframe: Yield Pandas DataFrames instead of lists of row tuples.
+        :param on_description: Called with ``cursor.description`` before the first batch is
+            yielded (also for empty results), e.g. to derive column types.
+        :return: Iterator over row batches.
+        """
+        if as_dataframe:
+            import pandas as pd
+
+        with self.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.arraysize = chunk_size
+                cursor.prefetchrows = chunk_size + 1
+                with instrument("oracle", "execute", statement=query):
+                    cursor.execute(query, params or [])
+                columns = [column[0] for column in cursor.description]
+                if on_description is not None:
+                    on_description(cursor.description)
+                while True:
+                    with instrument("oracle", "fetch", statement=query) as event:
+                        rows = cursor.fetchmany(chunk_size)
+                        event["rows"] = len(rows)
+                    if not rows:
+                        break
+                    yield pd.DataFrame.from_records(rows, columns=columns) if as_dataframe else rows
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _lob_reader(column: tuple) -> Optional[Callable[[Any], Any]]:
+        """
+        Converter reading LOB locators into str/bytes, for LOB columns only.
+        """
+        lob_types = (cx_Oracle.DB_TYPE_CLOB, cx_Oracle.DB_TYPE_NCLOB, cx_Oracle.DB_TYPE_BLOB)
+        return (lambda lob: lob.read()) if column[1] in lob_types else None
+
+    @staticmethod
+    def _arrow_type(column: tuple) -> Optional["pa.DataType"]:
+        """
+        Arrow type for a ``cursor.description`` entry (None lets pyarrow infer it).
+        """
+        import pyarrow as pa
+
+        _, db_type, _, _, precision, scale, _ = column
+        if db_type is cx_Oracle.DB_TYPE_NUMBER:
+            # NUMBER(p, 0) with p <= 18 always fits int64; anything else may carry a fraction.
+            return pa.int64() if scale == 0 and 0 < (precision or 0) <= 18 else pa.float64()
+        if db_type is cx_Oracle.DB_TYPE_BINARY_DOUBLE:
+            return pa.float64()
+        if db_type is cx_Oracle.DB_TYPE_BINARY_FLOAT:
+            return pa.float32()
+        if db_type in (cx_Oracle.DB_TYPE_DATE, cx_Oracle.DB_TYPE_TIMESTAMP, cx_Oracle.DB_TYPE_TIMESTAMP_TZ, cx_Oracle.DB_TYPE_TIMESTAMP_LTZ):
+            return pa.timestamp("us")
+        if db_type in (
+            cx_Oracle.DB_TYPE_VARCHAR, cx_Oracle.DB_TYPE_NVARCHAR, cx_Oracle.DB_TYPE_CHAR, cx_Oracle.DB_TYPE_NCHAR,
+            cx_Oracle.DB_TYPE_LONG, cx_Oracle.DB_TYPE_CLOB, cx_Oracle.DB_TYPE_NCLOB,
+        ):
+            return pa.string()
+        if db_type in (cx_Oracle.DB_TYPE_RAW, cx_Oracle.DB_TYPE_LONG_RAW, cx_Oracle.DB_TYPE_BLOB):
+            return pa.binary()
+        return None
+
+    def describe_columns(self, description: Sequence[tuple]) -> List["ResultColumn"]:
+        """
+        Name, Arrow type and value converter of each column of a ``cursor.description``, e.g. as
+        passed to ``stream_query``'s ``on_description``.
+
+        :param description: Cursor description of an executed query.
+        :return: One ResultColumn per column; LOB columns carry a converter reading the locator.
+        """
+        from .arrow_fetch import ResultColumn
+
+        return [ResultColumn(column[0], self._arrow_type(column), self._lob_reader(column)) for column in description]
+
+    def query_to_arrow(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        batch_size: int = 50000,
+    ) -> "pa.Table":
+        """
+        Execute a SQL query and return its result as an Arrow table.
+
+        Rows are fetched ``batch_size`` at a time and converted column-wise into Arrow arrays
+        typed from the cursor description, so the full result is never held as Python tuples.
+
+        :param query: SQL query string to execute.
+        :param params: Optional bind parameters for the query.
+        :param batch_size: Rows per round trip and per conversion batch.
+        :return: Arrow table with the query result.
+        """
+        from .arrow_fetch import fetch_arrow_table
+
+        with self.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.arraysize = batch_size
+                cursor.prefetchrows = batch_size + 1
+                with instrument("oracle", "execute", statement=query):
+                    cursor.execute(query, params or [])
+                with instrument("oracle", "fetch", statement=query) as event:
+                    table = fetch_arrow_table(cursor, self._arrow_type, batch_size, self._lob_reader)
+                    event["rows"] = table.num_rows
+                return table
+            finally:
+                cursor.close()
+
+    def query_to_dataframe(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        dtype_backend: str = "pyarrow",
+        batch_size: int = 50000,
+    ) -> "pd.DataFrame":
+        """
+        Execute a SQL query and return its result as a Pandas DataFrame built through Arrow.
+
+        :param query: SQL query string to execute.
+        :param params: Optional bind parameters for the query.
+        :param dtype_backend: "pyarrow" (ArrowDtype columns), "numpy_nullable" or "numpy".
+        :param batch_size: Rows per round trip and per conversion batch.
+        :return: DataFrame with the query result.
+        """
+        from .arrow_fetch import arrow_table_to_dataframe
+
+        return arrow_table_to_dataframe(self.query_to_arrow(query, params, batch_size), dtype_backend)
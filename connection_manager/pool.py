@@ -0,0 +1,262 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from .instrumentation import instrument
+
+class PoolTimeoutError(ConnectionError):
+    """
+    Raised when no pooled connection becomes available within the checkout timeout.
+    """
+
+class _PooledConnection:
+    """
+    Book-keeping for a single connection owned by a ConnectionPool.
+    """
+    __slots__ = ("connection", "created_at", "last_used")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.created_at: float = time.monotonic()
+        self.last_used: float = self.created_at
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections with bounded size, checkout timeout,
+    idle eviction, maximum connection lifetime and a health check on checkout of
+    connections that have been idle for a while.
+    """
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        idle_timeout: Optional[float] = 300.0,
+        max_lifetime: Optional[float] = 3600.0,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        health_check_interval: float = 30.0,
+        reset: Optional[Callable[[Any], None]] = None,
+        name: str = "pool",
+    ):
+        """
+        Initialise the pool and open ``min_size`` connections up front.
+
+        :param factory: Callable returning a new, open connection.
+        :param min_size: Number of connections kept open at all times.
+        :param max_size: Maximum number of connections (idle and checked out).
+        :param timeout: Seconds to wait for a free connection before raising PoolTimeoutError.
+        :param idle_timeout: Seconds a connection may sit idle before it is closed (None disables).
+        :param max_lifetime: Seconds after which a connection is retired (None disables).
+        :param health_check: Callable returning True if a connection is still usable.
+        :param health_check_interval: Seconds a connection must have been idle before it is
+            health-checked on checkout (0 checks on every checkout).
+        :param reset: Callable invoked on a connection when it is returned to the pool.
+        :param name: Component name used for the pool's instrumentation events.
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check = health_check
+        self.health_check_interval = health_check_interval
+        self.reset = reset
+        self.name = name
+
+        self._idle: List[_PooledConnection] = []
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+
+        for _ in range(min_size):
+            self._idle.append(self._open())
+
+    @property
+    def size(self) -> int:
+        """Number of connections currently owned by the pool."""
+        return self._size
+
+    def _open(self) -> _PooledConnection:
+        entry = _PooledConnection(self.factory())
+        self._size += 1
+        return entry
+
+    def _discard(self, entry: _PooledConnection) -> None:
+        self._size -= 1
+        try:
+            entry.connection.close()
+        except Exception:
+            pass
+
+    def _expired(self, entry: _PooledConnection, now: float) -> bool:
+        if self.max_lifetime is not None and now - entry.created_at > self.max_lifetime:
+            return True
+        if self.idle_timeout is not None and now - entry.last_used > self.idle_timeout:
+            return self._size > self.min_size
+        return False
+
+    def _evict_expired(self, now: float) -> None:
+        for entry in list(self._idle):
+            if self._expired(entry, now):
+                self._idle.remove(entry)
+                self._discard(entry)
+
+    def _healthy(self, connection: Any) -> bool:
+        if self.health_check is None:
+            return True
+        try:
+            return bool(self.health_check(connection))
+        except Exception:
+            return False
+
+    def _recovered(self, connection: Any) -> bool:
+        # Reset before checking: a failed statement can leave the transaction aborted (as in
+        # psycopg2), which would fail the health check of a still usable connection.
+        if self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                return False
+        return self._healthy(connection)
+
+    def acquire(self) -> Any:
+        """
+        Check a connection out of the pool, opening a new one if below ``max_size``.
+
+        :return: A live connection. Hand it back with ``release``.
+        """
+        with instrument(self.name, "checkout"):
+            return self._acquire()
+
+    def _acquire(self) -> Any:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            entry = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise ConnectionError("Connection pool is closed.")
+                    now = time.monotonic()
+                    self._evict_expired(now)
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1  # reserve a slot while opening outside the lock
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise PoolTimeoutError(f"Timed out after {self.timeout}s waiting for a pooled connection.")
+                    self._condition.wait(remaining)
+
+            if entry is None:
+                try:
+                    entry = _PooledConnection(self.factory())
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+            elif time.monotonic() - entry.last_used >= self.health_check_interval and not self._healthy(entry.connection):
+                with self._condition:
+                    self._discard(entry)
+                    self._condition.notify()
+                continue
+
+            with self._condition:
+                self._in_use[id(entry.connection)] = entry
+            return entry.connection
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        :param connection: A connection previously obtained from ``acquire``.
+        :param discard: Close the connection instead of keeping it (e.g. after a fatal error).
+        """
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+            if entry is None:
+                raise ValueError("Connection does not belong to this pool.")
+        if not discard and self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                discard = True
+        with self._condition:
+            entry.last_used = time.monotonic()
+            if discard or self._closed or self._expired(entry, entry.last_used):
+                self._discard(entry)
+            else:
+                self._idle.append(entry)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Context manager that checks out a connection and always returns it.
+        """
+        connection = self.acquire()
+        discard = False
+        try:
+            yield connection
+        except Exception:
+            discard = not self._recovered(connection)
+            raise
+        finally:
+            # Also runs on GeneratorExit, when a generator holding the connection is closed early.
+            self.release(connection, discard=discard)
+
+    def close(self) -> None:
+        """
+        Close all idle connections; checked-out connections are closed when released.
+        """
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._condition.notify_all()
+
+class PooledCursor:
+    """
+    Cursor proxy that hands its connection back to the pool when closed.
+
+    Returned by ``execute_query`` in pooled mode so callers keep receiving a
+    cursor; close it (or use it as a context manager) once the results are read.
+    """
+    def __init__(self, cursor: Any, release: Callable[[], None]):
+        self._cursor = cursor
+        self._release: Optional[Callable[[], None]] = release
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._cursor)
+
+    def close(self) -> None:
+        """Close the underlying cursor and release its connection."""
+        try:
+            self._cursor.close()
+        finally:
+            if self._release is not None:
+                release, self._release = self._release, None
+                release()
+
+    def __enter__(self) -> "PooledCursor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "_release", None) is not None:
+            try:
+                self.close()
+            except Exception:
+                pass
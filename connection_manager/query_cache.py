@@ -0,0 +1,282 @@
+import datetime
+import decimal
+import hashlib
+import os
+import pickle
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_LITERAL_OR_WHITESPACE = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|\s+")
+_TABLE_REFERENCE = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_][\w$#]*(?:\.[A-Za-z_][\w$#]*)*)", re.IGNORECASE)
+
+# Value types pyarrow stores in Parquet and returns unchanged from ``to_pylist``.
+_PARQUET_TYPES = (int, float, str, bytes, bool, datetime.date, datetime.datetime, datetime.time, decimal.Decimal)
+
+class _CacheEntry:
+    __slots__ = ("columns", "rows", "path", "size", "expires_at", "tags")
+
+    def __init__(self, columns: List[str], rows: Optional[Tuple[tuple, ...]], path: Optional[str], size: int, expires_at: float, tags: frozenset):
+        self.columns = columns
+        self.rows = rows
+        self.path = path
+        self.size = size
+        self.expires_at = expires_at
+        self.tags = tags
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of query results keyed on normalised SQL and bound parameters.
+
+    Entries expire after a per-query TTL and are evicted least-recently-used first once the
+    in-memory byte budget is exceeded. Results larger than ``spill_threshold`` are written to
+    ``spill_dir`` (Parquet when every value round-trips through it unchanged, pickle otherwise)
+    and read back on a hit, so a hit returns the same values and types as the original query. Entries are tagged with the tables they read from, for targeted invalidation.
+    """
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        spill_dir: Optional[str] = None,
+        spill_threshold: int = 16 * 1024 * 1024,
+        max_spill_bytes: int = 4 * 1024 * 1024 * 1024,
+    ):
+        """
+        Initialise the query cache.
+
+        :param max_bytes: In-memory budget, estimated from the cached Python objects.
+        :param default_ttl: Seconds a result stays valid unless a TTL is given per query.
+        :param spill_dir: Directory for spilled results (None keeps everything in memory).
+        :param spill_threshold: Results estimated above this size are spilled to disk.
+        :param max_spill_bytes: On-disk budget for spilled results.
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.spill_dir = spill_dir
+        self.spill_threshold = spill_threshold
+        self.max_spill_bytes = max_spill_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._spill_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0, "spills": 0}
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Collapse whitespace outside quoted literals and drop a trailing semicolon.
+        """
+        normalized = _LITERAL_OR_WHITESPACE.sub(lambda match: match.group(1) or " ", query).strip()
+        return normalized.rstrip(";").rstrip()
+
+    @classmethod
+    def make_key(cls, query: str, params: Any = None) -> str:
+        """
+        Build the cache key for a query and its bind parameters.
+        """
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        payload = f"{cls.normalize_query(query)}\x00{params!r}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def table_tags(query: str) -> frozenset:
+        """
+        Lower-cased names of the tables a query reads from (FROM/JOIN references).
+        """
+        tags = set()
+        for table in _TABLE_REFERENCE.findall(query):
+            tags.add(table.lower())
+            tags.add(table.lower().rsplit(".", 1)[-1])
+        return frozenset(tags)
+
+    @staticmethod
+    def _estimate_size(rows: List[tuple]) -> int:
+        """
+        Estimate the memory held by a result by sampling up to 100 rows.
+        """
+        if not rows:
+            return sys.getsizeof(rows)
+        step = max(1, len(rows) // 100)
+        sample = rows[::step]
+        per_row = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in sample) / len(sample)
+        return sys.getsizeof(rows) + int(per_row * len(rows))
+
+    @staticmethod
+    def _round_trips_through_parquet(values: Sequence[Any]) -> bool:
+        """
+        True if a column comes back from Parquet exactly as cached: one value type per column
+        (mixing ints and floats would return the ints as floats), no time zones (returned as
+        UTC) and one scale per Decimal column (returned padded to the widest scale).
+        """
+        kinds = {type(value) for value in values if value is not None}
+        if len(kinds) > 1 or not kinds <= set(_PARQUET_TYPES):
+            return False
+        kind = next(iter(kinds), None)
+        if kind in (datetime.datetime, datetime.time):
+            return all(value is None or value.tzinfo is None for value in values)
+        if kind is decimal.Decimal:
+            return len({value.as_tuple().exponent for value in values if value is not None}) == 1
+        return True
+
+    def _spill(self, columns: List[str], rows: List[tuple]) -> str:
+        base = os.path.join(self.spill_dir, uuid.uuid4().hex)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            values_by_column = list(zip(*rows))
+            if not all(self._round_trips_through_parquet(values) for values in values_by_column):
+                raise TypeError("Result values would not round-trip through Parquet.")
+            table = pa.Table.from_arrays(
+                [pa.array(list(values)) for values in values_by_column] if rows else [pa.array([]) for _ in columns],
+                names=[str(column) for column in columns],
+            )
+            pq.write_table(table, base + ".parquet")
+            return base + ".parquet"
+        except Exception:
+            with open(base + ".pkl", "wb") as file:
+                pickle.dump(rows, file, protocol=pickle.HIGHEST_PROTOCOL)
+            return base + ".pkl"
+
+    @staticmethod
+    def _load(entry: _CacheEntry) -> List[tuple]:
+        if entry.path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            table = pq.read_table(entry.path)
+            return list(zip(*(column.to_pylist() for column in table.columns)))
+        with open(entry.path, "rb") as file:
+            return pickle.load(file)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        if entry.path is None:
+            self._memory_bytes -= entry.size
+        else:
+            self._spill_bytes -= entry.size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        for key in list(self._entries):
+            if self._memory_bytes <= self.max_bytes and self._spill_bytes <= self.max_spill_bytes:
+                break
+            entry = self._entries[key]
+            if (entry.path is None and self._memory_bytes > self.max_bytes) or (entry.path is not None and self._spill_bytes > self.max_spill_bytes):
+                self._remove(key)
+                self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[Tuple[List[str], Sequence[tuple]]]:
+        """
+        Return the cached (columns, rows) for a key, or None on a miss or expired entry.
+
+        Rows held in memory are returned as the cached tuple itself; copy them before mutating.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            if entry.rows is not None:
+                return entry.columns, entry.rows
+        try:
+            return entry.columns, self._load(entry)
+        except OSError:
+            return None
+
+    def put(self, key: str, columns: Sequence[str], rows: List[tuple], ttl: Optional[float] = None, tags: Iterable[str] = ()) -> None:
+        """
+        Cache a result under a key.
+
+        :param key: Key from ``make_key``.
+        :param columns: Column names of the result.
+        :param rows: Result rows; in-memory entries keep a copy, so the caller may go on using the list.
+        :param ttl: Seconds the entry stays valid (default: ``default_ttl``).
+        :param tags: Tags (typically table names) used by ``invalidate``.
+        """
+        size = self._estimate_size(rows)
+        path = None
+        if self.spill_dir and size > self.spill_threshold:
+            path = self._spill(list(columns), rows)
+            size = os.path.getsize(path)
+        elif size > self.max_bytes:
+            return
+        entry = _CacheEntry(
+            list(columns), tuple(rows) if path is None else None, path, size,
+            time.monotonic() + (self.default_ttl if ttl is None else ttl),
+            frozenset(tag.lower() for tag in tags),
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            if path is None:
+                self._memory_bytes += size
+            else:
+                self._spill_bytes += size
+                self._stats["spills"] += 1
+            self._evict()
+
+    def invalidate(self, tag: str) -> int:
+        """
+        Drop every entry tagged with ``tag`` (e.g. a table name after it was reloaded).
+
+        :return: Number of entries removed.
+        """
+        tag = tag.lower()
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if tag in entry.tags]
+            for key in keys:
+                self._remove(key)
+            self._stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters plus current entry count and memory/disk usage.
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                hit_rate=self._stats["hits"] / lookups if lookups else 0.0,
+                entries=len(self._entries),
+                memory_bytes=self._memory_bytes,
+                spill_bytes=self._spill_bytes,
+            )
+
+    @classmethod
+    def from_config(cls, cache_config: Optional[Dict]) -> Optional["QueryCache"]:
+        """
+        Build a cache from a config section such as ``redshift.cache`` (None when absent or disabled).
+        """
+        if not cache_config or not cache_config.get("enabled", True):
+            return None
+        return cls(
+            max_bytes=cache_config.get("max_bytes", 256 * 1024 * 1024),
+            default_ttl=cache_config.get("default_ttl", 300.0),
+            spill_dir=cache_config.get("spill_dir") or None,
+            spill_threshold=cache_config.get("spill_threshold", 16 * 1024 * 1024),
+            max_spill_bytes=cache_config.get("max_spill_bytes", 4 * 1024 * 1024 * 1024),
+        )
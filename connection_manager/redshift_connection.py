@@ -1,18 +1,46 @@
-import psycopg2
-from typing import Optional, Dict
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import re
+import os
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterable, Iterator, Union, List, Sequence, Any, Tuple, Callable
+from .aws_connection import AWSConnectionManager
+from .query_cache import QueryCache
+from .pool import ConnectionPool, PooledCursor
+from .instrumentation import instrument
+from ._lazy import lazy_import
+
+psycopg2 = lazy_import("psycopg2", extra="redshift")
+psycopg2_extras = lazy_import("psycopg2.extras", extra="redshift")
+sql = lazy_import("psycopg2.sql", extra="redshift")
+
+logger = logging.getLogger(__name__)
+
+_VALUES_PLACEHOLDER = re.compile(r"\bVALUES\s*%s", re.IGNORECASE)
 
 class RedshiftConnectionManager:
     """
     Manages connections to Amazon Redshift and allows command passthrough.
     """
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(self, config: Optional[Dict] = None, cache: Optional[QueryCache] = None):
         """
         Initialise Redshift connection manager.
 
         :param config: A dictionary containing Redshift connection details.
+        :param cache: Result cache used by ``fetch_all`` (defaults to one built from ``redshift.cache``
+            in the config, if present).
         """
         self.config: Optional[Dict] = config
+        self.cache: Optional[QueryCache] = cache or QueryCache.from_config((config or {}).get("redshift", {}).get("cache"))
         self.connection: Optional[psycopg2.extensions.connection] = None
+        self.pool: Optional[ConnectionPool] = None
 
     def connect(self, host: Optional[str] = None, port: Optional[int] = None, dbname: Optional[str] = None, user: Optional[str] = None, password: Optional[str] = None) -> psycopg2.extensions.connection:
         """
@@ -32,23 +60,675 @@ class RedshiftConnectionManager:
             user = user or self.config["redshift"]["user"]
             password = password or self.config["redshift"]["password"]
 
-            self.connection = psycopg2.connect(
-                host=host, port=port, dbname=dbname, user=user, password=password
-            )
-            print("Successfully connected to Redshift.")
+            with instrument("redshift", "connect", host=host):
+                self.connection = psycopg2.connect(
+                    host=host, port=port, dbname=dbname, user=user, password=password
+                )
+            logger.info("Successfully connected to Redshift.")
             return self.connection
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Redshift: {e}")
 
-    def execute_query(self, query: str) -> psycopg2.extensions.cursor:
+    def create_pool(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        dbname: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        max_lifetime: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+    ) -> ConnectionPool:
+        """
+        Create a connection pool; afterwards ``acquire`` and ``execute_query`` use pooled connections.
+
+        Pool settings not passed explicitly are read from the optional ``redshift.pool`` config section.
+
+        :param host: Redshift cluster host.
+        :param port: Redshift port (default is 5439).
+        :param dbname: Redshift database name.
+        :param user: Redshift username.
+        :param password: Redshift password.
+        :param min_size: Number of connections kept open (default 1).
+        :param max_size: Maximum number of connections (default 5).
+        :param timeout: Seconds to wait for a free connection on checkout (default 30).
+        :param idle_timeout: Seconds before an idle connection is closed (default 300).
+        :param max_lifetime: Seconds before a connection is retired (default 3600).
+        :param health_check_interval: Seconds a connection must have been idle before it is
+            checked with ``SELECT 1`` on checkout (default 30).
+        :return: The connection pool.
+        """
+        try:
+            pool_config = (self.config or {}).get("redshift", {}).get("pool", {})
+            connect_kwargs = dict(
+                host=host or self.config["redshift"]["host"],
+                port=port or self.config["redshift"]["port"],
+                dbname=dbname or self.config["redshift"]["dbname"],
+                user=user or self.config["redshift"]["user"],
+                password=password or self.config["redshift"]["password"],
+            )
+            min_size = min_size if min_size is not None else pool_config.get("min_size", 1)
+            max_size = max_size if max_size is not None else pool_config.get("max_size", 5)
+
+            def connect() -> psycopg2.extensions.connection:
+                with instrument("redshift", "connect", host=connect_kwargs["host"]):
+                    return psycopg2.connect(**connect_kwargs)
+
+            self.pool = ConnectionPool(
+                factory=connect,
+                min_size=min_size,
+                max_size=max_size,
+                timeout=timeout if timeout is not None else pool_config.get("timeout", 30),
+                idle_timeout=idle_timeout if idle_timeout is not None else pool_config.get("idle_timeout", 300),
+                max_lifetime=max_lifetime if max_lifetime is not None else pool_config.get("max_lifetime", 3600),
+                health_check=self._is_healthy,
+                health_check_interval=health_check_interval if health_check_interval is not None else pool_config.get("health_check_interval", 30),
+                reset=lambda connection: connection.rollback(),
+                name="redshift",
+            )
+            logger.info("Created Redshift connection pool (%s-%s connections).", min_size, max_size)
+            return self.pool
+        except Exception as e:
+            raise ConnectionError(f"Failed to create Redshift connection pool: {e}")
+
+    @staticmethod
+    def _is_healthy(connection: psycopg2.extensions.connection) -> bool:
+        """
+        Check that a pooled connection is open and responsive.
+        """
+        if connection.closed:
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        connection.rollback()
+        return True
+
+    @contextmanager
+    def acquire(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Context manager yielding a connection: a health-checked pooled connection when a pool
+        exists, otherwise the connection opened by ``connect``.
+        """
+        if self.pool is None:
+            if not self.connection:
+                raise ConnectionError("Not connected to Redshift. Call 'connect' or 'create_pool' first.")
+            yield self.connection
+            return
+
+        with self.pool.connection() as connection:
+            yield connection
+
+    def close_pool(self) -> None:
+        """
+        Close the connection pool, if one was created.
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def execute(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None) -> Union[psycopg2.extensions.cursor, PooledCursor]:
+        """
+        Execute a SQL statement with query parameters on the Redshift database.
+
+        Values are passed separately (``%s`` or ``%(name)s`` placeholders) and escaped by
+        psycopg2 instead of being formatted into the SQL by the caller.
+
+        In pooled mode the returned cursor holds a pooled connection until it is closed;
+        commit through ``cursor.connection`` before closing, as uncommitted work is rolled back.
+
+        :param query: SQL statement to execute.
+        :param params: Query parameters, as a sequence or a dictionary.
+        :return: Cursor with the results of the query.
+        """
+        if self.pool is None:
+            if not self.connection:
+                raise ConnectionError("Not connected to Redshift. Call 'connect' first.")
+            cursor = self.connection.cursor()
+            with instrument("redshift", "execute", statement=query):
+                cursor.execute(query, params)
+            return cursor
+
+        pool = self.pool
+        connection = pool.acquire()
+        try:
+            cursor = connection.cursor()
+            with instrument("redshift", "execute", statement=query):
+                cursor.execute(query, params)
+        except Exception:
+            pool.release(connection, discard=bool(connection.closed))
+            raise
+        return PooledCursor(cursor, lambda: pool.release(connection))
+
+    def execute_query(self, query: str, params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None) -> Union[psycopg2.extensions.cursor, PooledCursor]:
         """
         Execute a SQL query on the Redshift database.
 
         :param query: SQL query string to execute.
+        :param params: Optional query parameters (see ``execute``).
         :return: Cursor with the results of the query.
         """
-        if not self.connection:
-            raise ConnectionError("Not connected to Redshift. Call 'connect' first.")
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        return cursor
\ No newline at end of file
+        return self.execute(query, params)
+
+    def execute_many(
+        self,
+        query: str,
+        seq_of_params: Iterable[Union[Sequence[Any], Dict[str, Any]]],
+        batch_size: int = 1000,
+        commit: bool = True,
+    ) -> int:
+        """
+        Execute a statement for every parameter set in batches.
+
+        A statement of the form "INSERT INTO t (a, b) VALUES %s" is run with
+        ``execute_values``, which sends one multi-row INSERT per batch; any other statement
+        is run with ``execute_batch``, which sends ``batch_size`` statements per round trip.
+
+        :param query: SQL statement with ``%s`` placeholders.
+        :param seq_of_params: Iterable of parameter sets; consumed lazily one batch at a time.
+        :param batch_size: Number of parameter sets per round trip.
+        :param commit: Commit once all batches have been executed; if a batch fails, the batches
+            already executed are rolled back instead.
+        :return: Number of parameter sets executed.
+        """
+        executed = 0
+        iterator = iter(seq_of_params)
+        use_values = bool(_VALUES_PLACEHOLDER.search(query))
+        with self.acquire() as connection:
+            try:
+                with connection.cursor() as cursor:
+                    while True:
+                        batch = list(itertools.islice(iterator, batch_size))
+                        if not batch:
+                            break
+                        with instrument("redshift", "execute_many", statement=query, rows=len(batch)):
+                            if use_values:
+                                psycopg2_extras.execute_values(cursor, query, batch, page_size=batch_size)
+                            else:
+                                psycopg2_extras.execute_batch(cursor, query, batch, page_size=batch_size)
+                        executed += len(batch)
+                if commit:
+                    with instrument("redshift", "commit"):
+                        connection.commit()
+            except Exception:
+                if commit:
+                    connection.rollback()
+                raise
+        return executed
+
+    def fetch_all(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        ttl: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+        use_cache: bool = True,
+    ) -> List[tuple]:
+        """
+        Execute a query and return all rows, serving repeats from the result cache when one is configured.
+
+        Cached results are tagged with the tables named in the query plus ``tags``; drop them
+        with ``cache.invalidate(table)`` after the table changes.
+
+        :param query: SQL query string to execute.
+        :param params: Optional bind parameters (part of the cache key).
+        :param ttl: Seconds to cache this result (default: the cache's ``default_ttl``).
+        :param tags: Extra invalidation tags for this result.
+        :param use_cache: Set to False to bypass the cache for this call.
+        :return: List of row tuples.
+        """
+        key = None
+        if self.cache is not None and use_cache:
+            key = self.cache.make_key(query, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return list(cached[1])
+
+        with self.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                with instrument("redshift", "execute", statement=query):
+                    cursor.execute(query, params)
+                if cursor.description is None:
+                    return []
+                columns = [column[0] for column in cursor.description]
+                with instrument("redshift", "fetch", statement=query) as event:
+                    rows = cursor.fetchall()
+                    event["rows"] = len(rows)
+            finally:
+                cursor.close()
+
+        if key is not None:
+            self.cache.put(key, columns, rows, ttl=ttl, tags=QueryCache.table_tags(query) | set(tags or ()))
+        return rows
+
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        chunk_size: int = 10000,
+        as_dataframe: bool = False,
+        on_description: Optional[Callable[[Sequence[Any]], None]] = None,
+    ) -> Iterator[Union[List[tuple], "pd.DataFrame"]]:
+        """
+        Execute a SQL query and yield its result set in batches of at most ``chunk_size`` rows.
+
+        Uses a server-side (named) cursor with ``itersize`` set to the chunk size, so rows stay
+        on the cluster until fetched and only one batch is held in memory at a time.
+
+        :param query: SQL query string to execute.
+        :param params: Optional query parameters.
+        :param chunk_size: Number of rows per batch.
+        :param as_dataframe: Yield Pandas DataFrames instead of lists of row tuples.
+        :param on_description: Called with ``cursor.description`` before the first batch is
+            yielded (also for empty results), e.g. to derive column types.
+        :return: Iterator over row batches.
+        """
+        if as_dataframe:
+            import pandas as pd
+
+        with self.acquire() as connection:
+            cursor = connection.cursor(name=f"cm_stream_{uuid.uuid4().hex}")
+            try:
+                cursor.itersize = chunk_size
+                with instrument("redshift", "execute", statement=query):
+                    cursor.execute(query, params)
+
+                def fetch() -> List[tuple]:
+                    with instrument("redshift", "fetch", statement=query) as event:
+                        batch = cursor.fetchmany(chunk_size)
+                        event["rows"] = len(batch)
+                    return batch
+
+                # Named cursors only populate description after the first fetch.
+                rows = fetch()
+                columns = [column[0] for column in cursor.description]
+                if on_description is not None:
+                    on_description(cursor.description)
+                while rows:
+                    yield pd.DataFrame.from_records(rows, columns=columns) if as_dataframe else rows
+                    rows = fetch()
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _table_identifier(table: str) -> sql.Composed:
+        """
+        Quote a (optionally schema-qualified) table name.
+        """
+        return sql.SQL(".").join(sql.Identifier(part) for part in table.split("."))
+
+    def _s3_credentials(self, command: str, iam_role: Optional[str], aws_manager: Optional[AWSConnectionManager]) -> sql.Composed:
+        """
+        Authorisation clause for COPY/UNLOAD: an IAM role, or the access keys of ``aws_manager``.
+        """
+        iam_role = iam_role or (self.config or {}).get("redshift", {}).get("iam_role")
+        if iam_role:
+            return sql.SQL("IAM_ROLE {}").format(sql.Literal(iam_role))
+        if aws_manager is not None and aws_manager.config:
+            return sql.SQL("ACCESS_KEY_ID {} SECRET_ACCESS_KEY {}").format(
+                sql.Literal(aws_manager.config["aws"]["access_key_id"]),
+                sql.Literal(aws_manager.config["aws"]["secret_access_key"]),
+            )
+        raise ValueError(f"{command} requires an IAM role or an AWSConnectionManager with credentials.")
+
+    @staticmethod
+    def _csv_frame(dataframe: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        The frame with float columns holding only whole numbers as Int64, so integer columns
+        with missing values (stored by pandas as float) are written as "1", not "1.0", which
+        COPY rejects for INT columns.
+        """
+        converted = {}
+        for index, dtype in enumerate(dataframe.dtypes):
+            if dtype.kind != "f":
+                continue
+            values = dataframe.iloc[:, index]
+            present = values.dropna()
+            if len(present) and present.mod(1).eq(0).all() and present.abs().lt(2 ** 63).all():
+                converted[index] = values.astype("Int64")
+        if not converted:
+            return dataframe
+        frame = dataframe.copy(deep=False)
+        for index, values in converted.items():
+            frame.isetitem(index, values)
+        return frame
+
+    def stage_dataframe_to_s3(
+        self,
+        dataframe: "pd.DataFrame",
+        aws_manager: AWSConnectionManager,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+        rows_per_file: int = 1000000,
+        max_workers: int = 8,
+    ) -> Tuple[str, List[str]]:
+        """
+        Write a DataFrame as gzip-compressed CSV partitions, upload them to S3 in parallel
+        and upload a COPY manifest listing them.
+
+        Float columns holding only whole numbers are written as integers, so nullable integer
+        columns load into INT columns.
+
+        :param dataframe: DataFrame to stage.
+        :param aws_manager: AWSConnectionManager whose S3 client performs the uploads.
+        :param s3_bucket: Staging bucket (defaults to ``redshift.s3_staging_bucket`` in the config).
+        :param s3_prefix: Key prefix for the staged files (defaults to ``redshift.s3_staging_prefix``).
+        :param rows_per_file: Maximum number of rows per partition file.
+        :param max_workers: Number of concurrent uploads.
+        :return: The manifest S3 URL and the list of staged object keys (manifest included).
+        """
+        redshift_config = (self.config or {}).get("redshift", {})
+        s3_bucket = s3_bucket or redshift_config["s3_staging_bucket"]
+        s3_prefix = (s3_prefix or redshift_config.get("s3_staging_prefix", "redshift-staging")).strip("/")
+        s3_prefix = f"{s3_prefix}/{uuid.uuid4().hex}"
+        s3_client = aws_manager.s3_client or aws_manager.connect_to_s3()
+
+        partitions = max(1, math.ceil(len(dataframe) / rows_per_file))
+        bounds = [(i * len(dataframe) // partitions, (i + 1) * len(dataframe) // partitions) for i in range(partitions)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            def write_and_upload(index: int) -> Tuple[str, int]:
+                start, stop = bounds[index]
+                path = os.path.join(temp_dir, f"part-{index:05d}.csv.gz")
+                self._csv_frame(dataframe.iloc[start:stop]).to_csv(path, index=False, header=False, compression="gzip", na_rep="\\N")
+                key = f"{s3_prefix}/part-{index:05d}.csv.gz"
+                aws_manager.upload(path, s3_bucket, key)
+                size = os.path.getsize(path)
+                os.remove(path)
+                return key, size
+
+            with instrument("redshift", "stage", rows=len(dataframe), objects=partitions) as event:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    staged = list(executor.map(write_and_upload, range(partitions)))
+                event["bytes"] = sum(size for _, size in staged)
+
+        manifest = {
+            "entries": [
+                {"url": f"s3://{s3_bucket}/{key}", "mandatory": True, "meta": {"content_length": size}}
+                for key, size in staged
+            ]
+        }
+        manifest_key = f"{s3_prefix}/manifest.json"
+        s3_client.put_object(Bucket=s3_bucket, Key=manifest_key, Body=json.dumps(manifest).encode("utf-8"))
+        return f"s3://{s3_bucket}/{manifest_key}", [key for key, _ in staged] + [manifest_key]
+
+    def copy_from_s3(
+        self,
+        table: str,
+        manifest_url: str,
+        columns: Optional[Sequence[str]] = None,
+        iam_role: Optional[str] = None,
+        aws_manager: Optional[AWSConnectionManager] = None,
+        copy_options: Optional[str] = None,
+    ) -> None:
+        """
+        Issue a single manifest-driven COPY of gzip CSV files staged by ``stage_dataframe_to_s3``.
+
+        Authorises with ``iam_role`` (or ``redshift.iam_role`` in the config) and otherwise
+        with the access keys of ``aws_manager``.
+
+        :param table: Target table, optionally schema-qualified.
+        :param manifest_url: S3 URL of the manifest file.
+        :param columns: Target column list, in file order.
+        :param iam_role: ARN of an IAM role Redshift can assume to read the bucket.
+        :param aws_manager: AWSConnectionManager supplying access keys when no IAM role is used.
+        :param copy_options: Extra COPY options appended verbatim (e.g. "COMPUPDATE OFF").
+        """
+        credentials = self._s3_credentials("COPY", iam_role, aws_manager)
+        column_list = sql.SQL("")
+        if columns:
+            column_list = sql.SQL(" ({})").format(sql.SQL(", ").join(sql.Identifier(column) for column in columns))
+
+        statement = sql.SQL(
+            "COPY {table}{columns} FROM {manifest} {credentials} MANIFEST FORMAT AS CSV GZIP "
+            "NULL AS '\\N' DATEFORMAT 'auto' TIMEFORMAT 'auto' {options}"
+        ).format(
+            table=self._table_identifier(table),
+            columns=column_list,
+            manifest=sql.Literal(manifest_url),
+            credentials=credentials,
+            options=sql.SQL(copy_options or ""),
+        )
+        with self.acquire() as connection:
+            with instrument("redshift", "copy", table=table) as event:
+                with connection.cursor() as cursor:
+                    cursor.execute(statement)
+                    event["rows"] = cursor.rowcount
+                connection.commit()
+
+    def insert_dataframe(self, dataframe: "pd.DataFrame", table: str, page_size: int = 1000) -> int:
+        """
+        Insert a DataFrame with batched multi-row INSERT statements (``execute_values``).
+
+        :param dataframe: DataFrame to insert; column names must match the table.
+        :param table: Target table, optionally schema-qualified.
+        :param page_size: Number of rows per INSERT statement.
+        :return: Number of rows inserted.
+        """
+        statement = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+            self._table_identifier(table),
+            sql.SQL(", ").join(sql.Identifier(str(column)) for column in dataframe.columns),
+        )
+        rows = dataframe.astype(object).where(dataframe.notna(), None).itertuples(index=False, name=None)
+        with self.acquire() as connection:
+            query = statement.as_string(connection)
+        return self.execute_many(query, rows, batch_size=page_size)
+
+    def bulk_load_dataframe(
+        self,
+        dataframe: "pd.DataFrame",
+        table: str,
+        aws_manager: Optional[AWSConnectionManager] = None,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+        iam_role: Optional[str] = None,
+        copy_threshold: int = 100000,
+        rows_per_file: int = 1000000,
+        max_workers: int = 8,
+        copy_options: Optional[str] = None,
+        cleanup: bool = True,
+    ) -> int:
+        """
+        Load a DataFrame into a Redshift table.
+
+        Frames with at least ``copy_threshold`` rows are staged to S3 as compressed partitions
+        and loaded with one manifest COPY; smaller frames (or calls without ``aws_manager``)
+        fall back to batched ``execute_values`` inserts.
+
+        :param dataframe: DataFrame to load; column names must match the table.
+        :param table: Target table, optionally schema-qualified.
+        :param aws_manager: AWSConnectionManager used for S3 staging.
+        :param s3_bucket: Staging bucket (defaults to ``redshift.s3_staging_bucket``).
+        :param s3_prefix: Staging key prefix (defaults to ``redshift.s3_staging_prefix``).
+        :param iam_role: IAM role ARN for COPY (defaults to ``redshift.iam_role``).
+        :param copy_threshold: Minimum row count for the S3/COPY path.
+        :param rows_per_file: Maximum rows per staged file.
+        :param max_workers: Number of concurrent uploads.
+        :param copy_options: Extra COPY options appended verbatim.
+        :param cleanup: Delete the staged files after the COPY.
+        :return: Number of rows loaded.
+        """
+        try:
+            if aws_manager is None or len(dataframe) < copy_threshold:
+                return self.insert_dataframe(dataframe, table)
+
+            manifest_url, keys = self.stage_dataframe_to_s3(
+                dataframe, aws_manager, s3_bucket=s3_bucket, s3_prefix=s3_prefix,
+                rows_per_file=rows_per_file, max_workers=max_workers,
+            )
+            try:
+                self.copy_from_s3(
+                    table, manifest_url, columns=[str(column) for column in dataframe.columns],
+                    iam_role=iam_role, aws_manager=aws_manager, copy_options=copy_options,
+                )
+            finally:
+                if cleanup:
+                    bucket = manifest_url[len("s3://"):].split("/", 1)[0]
+                    aws_manager.delete_objects(bucket, keys)
+            logger.info("Loaded %s rows into %s via COPY.", len(dataframe), table)
+            return len(dataframe)
+        except Exception as e:
+            raise RuntimeError(f"Failed to bulk load DataFrame into Redshift: {e}")
+
+    @staticmethod
+    def _arrow_type(column: psycopg2.extensions.Column) -> Optional["pa.DataType"]:
+        """
+        Arrow type for a result column, from its type OID (None lets pyarrow infer it).
+        """
+        import pyarrow as pa
+
+        type_code = column.type_code
+        if type_code == 1700:  # NUMERIC: exact decimal when the typmod is known
+            if column.precision and 0 < column.precision <= 38 and column.scale is not None:
+                return pa.decimal128(column.precision, column.scale)
+            # Unconstrained NUMERIC: the scale varies per value, so a decimal type inferred
+            # from one batch would truncate later ones.
+            return pa.float64()
+        if type_code == 1184:
+            return pa.timestamp("us", tz="UTC")
+        return {
+            16: pa.bool_(), 20: pa.int64(), 21: pa.int16(), 23: pa.int32(),
+            700: pa.float32(), 701: pa.float64(),
+            1082: pa.date32(), 1114: pa.timestamp("us"),
+            25: pa.string(), 1042: pa.string(), 1043: pa.string(), 17: pa.binary(),
+        }.get(type_code)
+
+    def describe_columns(self, description: Sequence[psycopg2.extensions.Column]) -> List["ResultColumn"]:
+        """
+        Name and Arrow type of each column of a ``cursor.description``, e.g. as passed to
+        ``stream_query``'s ``on_description``.
+
+        :param description: Cursor description of an executed query.
+        :return: One ResultColumn per column (psycopg2 values need no converter).
+        """
+        from .arrow_fetch import ResultColumn
+
+        return [ResultColumn(column[0], self._arrow_type(column)) for column in description]
+
+    def query_to_arrow(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        batch_size: int = 50000,
+    ) -> "pa.Table":
+        """
+        Execute a SQL query and return its result as an Arrow table.
+
+        Rows are streamed through a server-side cursor ``batch_size`` at a time and converted
+        column-wise into Arrow arrays typed from the result's type OIDs, so the full result is
+        never held as Python tuples.
+
+        :param query: SQL query string to execute.
+        :param params: Optional query parameters.
+        :param batch_size: Rows per round trip and per conversion batch.
+        :return: Arrow table with the query result.
+        """
+        from .arrow_fetch import fetch_arrow_table
+
+        with self.acquire() as connection:
+            cursor = connection.cursor(name=f"cm_arrow_{uuid.uuid4().hex}")
+            try:
+                cursor.itersize = batch_size
+                with instrument("redshift", "execute", statement=query):
+                    cursor.execute(query, params)
+                with instrument("redshift", "fetch", statement=query) as event:
+                    table = fetch_arrow_table(cursor, self._arrow_type, batch_size)
+                    event["rows"] = table.num_rows
+                return table
+            finally:
+                cursor.close()
+
+    def unload_to_arrow(
+        self,
+        query: str,
+        aws_manager: AWSConnectionManager,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+        iam_role: Optional[str] = None,
+        cleanup: bool = True,
+    ) -> "pa.Table":
+        """
+        Run a query through ``UNLOAD ... FORMAT AS PARQUET`` and read the files back with pyarrow.
+
+        The cluster writes Parquet in parallel straight to S3, so large results bypass the
+        leader node's row-by-row protocol and Python-level row conversion entirely.
+
+        :param query: SQL query string to unload.
+        :param aws_manager: AWSConnectionManager used to download (and delete) the files.
+        :param params: Optional query parameters, bound client-side before the query is quoted.
+        :param s3_bucket: Bucket for the unloaded files (defaults to ``redshift.s3_staging_bucket``).
+        :param s3_prefix: Key prefix for the unloaded files (defaults to ``redshift.s3_staging_prefix``).
+        :param iam_role: IAM role ARN for UNLOAD (defaults to ``redshift.iam_role``).
+        :param cleanup: Delete the unloaded files afterwards.
+        :return: Arrow table with the query result.
+        """
+        import pyarrow.parquet as pq
+
+        redshift_config = (self.config or {}).get("redshift", {})
+        s3_bucket = s3_bucket or redshift_config["s3_staging_bucket"]
+        s3_prefix = (s3_prefix or redshift_config.get("s3_staging_prefix", "redshift-staging")).strip("/")
+        s3_prefix = f"{s3_prefix}/unload-{uuid.uuid4().hex}/"
+        credentials = self._s3_credentials("UNLOAD", iam_role, aws_manager)
+
+        with self.acquire() as connection:
+            with instrument("redshift", "unload", statement=query):
+                with connection.cursor() as cursor:
+                    bound_query = cursor.mogrify(query, params).decode(psycopg2.extensions.encodings[connection.encoding]) if params else query
+                    cursor.execute(sql.SQL("UNLOAD ({query}) TO {target} {credentials} FORMAT AS PARQUET").format(
+                        query=sql.Literal(bound_query),
+                        target=sql.Literal(f"s3://{s3_bucket}/{s3_prefix}"),
+                        credentials=credentials,
+                    ))
+                connection.commit()
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                aws_manager.download_prefix(s3_bucket, s3_prefix, temp_dir)
+                files = sorted(os.path.join(temp_dir, name) for name in os.listdir(temp_dir))
+                if not files:
+                    import pyarrow as pa
+                    return pa.table({})
+                with instrument("redshift", "fetch", statement=query, method="unload") as event:
+                    table = pq.read_table(files)
+                    event["rows"] = table.num_rows
+                return table
+        finally:
+            if cleanup:
+                aws_manager.delete_objects(s3_bucket, (item["Key"] for item in aws_manager.iter_objects(s3_bucket, s3_prefix)))
+
+    def query_to_dataframe(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        dtype_backend: str = "pyarrow",
+        batch_size: int = 50000,
+        unload: bool = False,
+        aws_manager: Optional[AWSConnectionManager] = None,
+        **unload_options: Any,
+    ) -> "pd.DataFrame":
+        """
+        Execute a SQL query and return its result as a Pandas DataFrame built through Arrow.
+
+        :param query: SQL query string to execute.
+        :param params: Optional query parameters.
+        :param dtype_backend: "pyarrow" (ArrowDtype columns), "numpy_nullable" or "numpy".
+        :param batch_size: Rows per round trip and per conversion batch (cursor path only).
+        :param unload: Fetch through ``UNLOAD`` to Parquet on S3 instead of the cursor.
+        :param aws_manager: AWSConnectionManager required by the UNLOAD path.
+        :param unload_options: Extra keyword arguments for ``unload_to_arrow``.
+        :return: DataFrame with the query result.
+        """
+        from .arrow_fetch import arrow_table_to_dataframe
+
+        if unload:
+            if aws_manager is None:
+                raise ValueError("unload=True requires an AWSConnectionManager.")
+            table = self.unload_to_arrow(query, aws_manager, params=params, **unload_options)
+        else:
+            table = self.query_to_arrow(query, params, batch_size)
+        return arrow_table_to_dataframe(table, dtype_backend)
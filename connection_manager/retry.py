@@ -0,0 +1,77 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+from .instrumentation import Event, emit
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many calls start per second.
+    """
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialise the rate limiter.
+
+        :param rate: Sustained number of calls allowed per second.
+        :param burst: Number of calls that may start back to back (default: ``max(1, rate)``).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a call may start.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def retry_call(
+    func: Callable,
+    args: Sequence[Any] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+    retries: int = 5,
+    backoff: float = 0.5,
+    max_backoff: float = 30.0,
+    should_retry: Callable[[Exception], bool] = lambda error: True,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Any:
+    """
+    Call ``func`` and retry retryable failures with exponential backoff and full jitter.
+
+    :param func: Callable to invoke.
+    :param args: Positional arguments for ``func``.
+    :param kwargs: Keyword arguments for ``func``.
+    :param retries: Maximum number of retries after the first attempt.
+    :param backoff: Base delay in seconds; attempt ``n`` waits up to ``backoff * 2 ** n``.
+    :param max_backoff: Upper bound for a single delay.
+    :param should_retry: Returns True if an exception is transient.
+    :param rate_limiter: Optional limiter acquired before every attempt.
+    :return: The return value of ``func``.
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return func(*args, **(kwargs or {}))
+        except Exception as e:
+            if attempt >= retries or not should_retry(e):
+                raise
+            delay = random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+            attempt += 1
+            # Reported as a "retry" event whose duration is the backoff delay.
+            emit(Event("retry", getattr(func, "__qualname__", "call"), time.time(), delay, {"attempt": attempt, "error": type(e).__name__}, e))
+            time.sleep(delay)
@@ -0,0 +1,129 @@
+import abc
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+SECRET_SCHEME = "secret://"
+
+class SecretProvider(abc.ABC):
+    """
+    Interface for stores that resolve secret references in configuration files.
+
+    A config value ``secret://<provider>/<name>`` is resolved by the provider registered under
+    ``<provider>`` with ``get_secret(<name>)``.
+    """
+    @abc.abstractmethod
+    def get_secret(self, name: str) -> str:
+        """Return the secret stored under ``name``; raise KeyError when it does not exist."""
+
+class EnvSecretProvider(SecretProvider):
+    """
+    Secrets read from environment variables, e.g. ``secret://env/REDSHIFT_PASSWORD``.
+    """
+    def get_secret(self, name: str) -> str:
+        try:
+            return os.environ[name]
+        except KeyError:
+            raise KeyError(f"Environment variable {name!r} is not set.") from None
+
+class FileSecretProvider(SecretProvider):
+    """
+    Secrets kept in local files.
+
+    ``path`` is either a directory holding one file per secret (the layout of Docker and
+    Kubernetes secret mounts; surrounding whitespace is stripped) or a YAML/JSON file mapping
+    secret names to values, which is parsed again only when its modification time changes.
+    """
+    def __init__(self, path: str):
+        """
+        Initialise the file-backed secret provider.
+
+        :param path: Secrets directory, or YAML/JSON secrets file.
+        """
+        self.path: str = os.path.expanduser(path)
+        self._secrets: Optional[Tuple[int, Dict[str, str]]] = None
+        self._lock = threading.Lock()
+
+    def _load_file(self) -> Dict[str, str]:
+        mtime = os.stat(self.path).st_mtime_ns
+        with self._lock:
+            if self._secrets is None or self._secrets[0] != mtime:
+                with open(self.path, "r") as file:
+                    if self.path.endswith(".json"):
+                        secrets = json.load(file)
+                    else:
+                        from .config_manager import yaml_load
+                        secrets = yaml_load(file)
+                if not isinstance(secrets, dict):
+                    raise ValueError(f"Secrets file {self.path} must contain a mapping.")
+                self._secrets = (mtime, secrets)
+            return self._secrets[1]
+
+    def get_secret(self, name: str) -> str:
+        if os.path.isdir(self.path):
+            directory = os.path.abspath(self.path)
+            secret_path = os.path.abspath(os.path.join(directory, name))
+            if os.path.dirname(secret_path) != directory:
+                raise KeyError(f"Invalid secret name {name!r}.")
+            try:
+                with open(secret_path, "r") as file:
+                    return file.read().strip()
+            except FileNotFoundError:
+                raise KeyError(f"Secret {name!r} not found in {self.path}.") from None
+        secrets = self._load_file()
+        if name not in secrets:
+            raise KeyError(f"Secret {name!r} not found in {self.path}.")
+        return str(secrets[name])
+
+def parse_secret_reference(value: object) -> Optional[Tuple[str, str]]:
+    """
+    Split ``secret://<provider>/<name>`` into (provider, name); None for any other value.
+    """
+    if not isinstance(value, str) or not value.startswith(SECRET_SCHEME):
+        return None
+    provider, _, name = value[len(SECRET_SCHEME):].partition("/")
+    if not provider or not name:
+        raise ValueError(f"Malformed secret reference {value!r}; expected 'secret://<provider>/<name>'.")
+    return provider, name
+
+class SecretResolver:
+    """
+    Resolves secret references through registered providers and memoizes the results.
+
+    Each secret is fetched at most once (until ``clear()``), and only when a config value
+    referring to it is actually read.
+    """
+    def __init__(self, providers: Optional[Dict[str, SecretProvider]] = None):
+        """
+        Initialise the resolver.
+
+        :param providers: Providers keyed by the name used in references; an ``env`` provider
+            is always available.
+        """
+        self.providers: Dict[str, SecretProvider] = {"env": EnvSecretProvider(), **(providers or {})}
+        self._resolved: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, provider: str, name: str) -> str:
+        """
+        Return the secret ``name`` from ``provider``, fetching it on first use.
+        """
+        key = (provider, name)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        if provider not in self.providers:
+            raise KeyError(f"No secret provider registered as {provider!r}.")
+        with self._lock:
+            if key not in self._resolved:
+                self._resolved[key] = self.providers[provider].get_secret(name)
+            return self._resolved[key]
+
+    def clear(self) -> None:
+        """
+        Forget memoized secrets so the next access fetches them again (e.g. after rotation).
+        """
+        with self._lock:
+            self._resolved.clear()
@@ -0,0 +1,95 @@
+import abc
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+class SessionCache(abc.ABC):
+    """
+    Interface for stores that share Tableau Server sessions across processes.
+
+    Implementations store JSON-serialisable session dictionaries under a key and must drop
+    entries once their ``expires_at`` (epoch seconds) has passed.
+    """
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the unexpired session stored under ``key``, or None."""
+
+    @abc.abstractmethod
+    def set(self, key: str, session: Dict) -> None:
+        """Store a session dictionary under ``key``."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the session stored under ``key``, if any."""
+
+    @staticmethod
+    def make_key(server_url: str, site_id: str, token_name: str) -> str:
+        """
+        Derive a cache key from the sign-in identity, without embedding it in clear text.
+        """
+        return hashlib.sha256(f"{server_url}|{site_id}|{token_name}".encode("utf-8")).hexdigest()
+
+class FileSessionCache(SessionCache):
+    """
+    Session cache persisted to a local JSON file readable only by the current user.
+
+    Reads and writes take an exclusive ``flock`` on a sibling lock file (where supported), and
+    the file is replaced atomically, so concurrent processes on one host can share it safely.
+    """
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialise the file-backed session cache.
+
+        :param path: Cache file path (default: ``~/.connection_manager/tableau_sessions.json``).
+        """
+        self.path: str = os.path.expanduser(path or os.path.join("~", ".connection_manager", "tableau_sessions.json"))
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict[str, Dict]]:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with self._lock, open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    with open(self.path, "r") as file:
+                        sessions = json.load(file)
+                except (FileNotFoundError, ValueError):
+                    sessions = {}
+                original = dict(sessions)
+                now = time.time()
+                sessions = {key: value for key, value in sessions.items() if value.get("expires_at", 0) > now}
+                yield sessions
+                if sessions != original:
+                    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".sessions-")
+                    with os.fdopen(descriptor, "w") as file:
+                        json.dump(sessions, file)
+                    os.chmod(temp_path, 0o600)
+                    os.replace(temp_path, self.path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._locked() as sessions:
+            return sessions.get(key)
+
+    def set(self, key: str, session: Dict) -> None:
+        with self._locked() as sessions:
+            sessions[key] = session
+
+    def delete(self, key: str) -> None:
+        with self._locked() as sessions:
+            sessions.pop(key, None)
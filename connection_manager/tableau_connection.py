@@ -1,39 +1,394 @@
-# connection_manager/__init__.py
-from .tableau_connection import TableauConnectionManager
-from .oracle_connection import OracleConnectionManager
-from .aws_connection import AWSConnectionManager
-from .redshift_connection import RedshiftConnectionManager
-from .config_manager import ConfigManager
-
-__all__ = [
-    "TableauConnectionManager",
-    "OracleConnectionManager",
-    "AWSConnectionManager",
-    "RedshiftConnectionManager",
-    "ConfigManager",
-]
-
-# connection_manager/tableau_connection.py
-import tableauserverclient as TSC
-from tableauhyperapi import HyperProcess, Telemetry, Connection, TableDefinition, SqlType, Inserter
-from tableauhyperapi import NOT_NULLABLE
-import pandas as pd
-from typing import Optional, List, Dict
+from __future__ import annotations
+
+import datetime
+import decimal
+import itertools
+import logging
+import queue
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Iterable, Iterator, Union, Tuple, Any, Callable, NamedTuple, Sequence
 import os
+from .retry import RateLimiter, retry_call
+from .session_cache import SessionCache, FileSessionCache
+from .instrumentation import instrument
+from ._lazy import lazy_import
+
+TSC = lazy_import("tableauserverclient", extra="tableau")
+tsc_exceptions = lazy_import("tableauserverclient.server.endpoint.exceptions", extra="tableau")
+hyperapi = lazy_import("tableauhyperapi", extra="tableau")
+pd = lazy_import("pandas", extra="tableau")
+np = lazy_import("numpy", extra="tableau")
+requests = lazy_import("requests", extra="tableau")
+
+logger = logging.getLogger(__name__)
+
+# Non-null values of an object column inspected to choose its Hyper type.
+_TYPE_SAMPLE_SIZE = 1000
+
+def _hyper_type_for_dtype(dtype, values: Optional[pd.Series] = None) -> hyperapi.SqlType:
+    """
+    Map a Pandas dtype (and, for object columns, the column's non-null values) to a Hyper SQL type.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _hyper_type_for_dtype(dtype.categories.dtype, dtype.categories.to_series())
+    if isinstance(dtype, pd.ArrowDtype):
+        return _hyper_type_for_arrow_type(dtype.pyarrow_dtype)
+    if pd.api.types.is_bool_dtype(dtype):
+        return hyperapi.SqlType.bool()
+    if pd.api.types.is_integer_dtype(dtype):
+        if dtype.itemsize <= 2 and pd.api.types.is_signed_integer_dtype(dtype):
+            return hyperapi.SqlType.small_int()
+        if dtype.itemsize <= 4 and pd.api.types.is_signed_integer_dtype(dtype):
+            return hyperapi.SqlType.int()
+        return hyperapi.SqlType.big_int()
+    if pd.api.types.is_float_dtype(dtype):
+        return hyperapi.SqlType.double()
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return hyperapi.SqlType.timestamp_tz()
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return hyperapi.SqlType.timestamp()
+    if dtype == object and values is not None and len(values):
+        return _hyper_type_for_objects(values)
+    return hyperapi.SqlType.text()
+
+def _hyper_type_for_objects(values: pd.Series) -> hyperapi.SqlType:
+    """
+    Map an object column to a Hyper SQL type from its first ``_TYPE_SAMPLE_SIZE`` non-null
+    values, so typing a column never converts or copies all of it; columns mixing
+    incompatible types are text.
+    """
+    sample = list(itertools.islice(
+        (value for value in values if not (pd.api.types.is_scalar(value) and pd.isna(value))), _TYPE_SAMPLE_SIZE
+    ))
+    if not sample:
+        return hyperapi.SqlType.text()
+    try:
+        import pyarrow as pa
+    except ImportError:
+        kinds = {type(value) for value in sample}
+        if len(kinds) > 1:
+            return hyperapi.SqlType.text()
+        first = sample[0]
+        if isinstance(first, datetime.datetime):
+            return hyperapi.SqlType.timestamp_tz() if first.tzinfo else hyperapi.SqlType.timestamp()
+        if isinstance(first, datetime.date):
+            return hyperapi.SqlType.date()
+        if isinstance(first, bool):
+            return hyperapi.SqlType.bool()
+        if isinstance(first, int):
+            return hyperapi.SqlType.big_int()
+        if isinstance(first, (float, decimal.Decimal)):
+            return hyperapi.SqlType.double()
+        return hyperapi.SqlType.text()
+    # Converting the sample (rather than pa.infer_type, which only looks at the first value) rejects mixed columns.
+    try:
+        return _hyper_type_for_arrow_type(pa.array(sample).type)
+    except (pa.ArrowException, OverflowError, TypeError, ValueError):
+        return hyperapi.SqlType.text()
+
+def _arrow_type_for_hyper_type(sql_type: hyperapi.SqlType, source_type) -> Any:
+    """
+    Arrow type a column staged for COPY must have to load into a Hyper column of ``sql_type``;
+    timestamps keep the unit of ``source_type``, the column's type before the cast.
+    """
+    import pyarrow as pa
+
+    tag = sql_type.tag
+    unit = source_type.unit if pa.types.is_timestamp(source_type) else "us"
+    types = {
+        hyperapi.TypeTag.BOOL: pa.bool_(),
+        hyperapi.TypeTag.SMALL_INT: pa.int16(),
+        hyperapi.TypeTag.INT: pa.int32(),
+        hyperapi.TypeTag.BIG_INT: pa.int64(),
+        hyperapi.TypeTag.DOUBLE: pa.float64(),
+        hyperapi.TypeTag.DATE: pa.date32(),
+        hyperapi.TypeTag.TIMESTAMP: pa.timestamp(unit),
+        hyperapi.TypeTag.TIMESTAMP_TZ: pa.timestamp(unit, tz="UTC"),
+        hyperapi.TypeTag.BYTES: pa.binary(),
+    }
+    if tag == hyperapi.TypeTag.NUMERIC:
+        return pa.decimal128(sql_type.precision, sql_type.scale)
+    return types.get(tag, pa.string())
+
+def _conform_chunk(chunk: pd.DataFrame, table_definition: hyperapi.TableDefinition) -> pd.DataFrame:
+    """
+    Coerce columns of a chunk whose values do not match the table definition: non-string objects
+    in text columns become strings, and integer columns that arrived as floats (because the
+    chunk has missing values) become nullable integers.
+    """
+    integer_tags = (hyperapi.TypeTag.SMALL_INT, hyperapi.TypeTag.INT, hyperapi.TypeTag.BIG_INT)
+    conformed = {}
+    for position, column in enumerate(table_definition.columns):
+        series = chunk.iloc[:, position]
+        tag = column.type.tag
+        if tag == hyperapi.TypeTag.TEXT and series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+            series = series.astype(object).where(series.isna(), series.astype(str))
+        elif tag in integer_tags and pd.api.types.is_float_dtype(series.dtype):
+            series = series.astype("Int64")
+        else:
+            continue
+        conformed[position] = series
+    if not conformed:
+        return chunk
+    chunk = chunk.copy()
+    for position, series in conformed.items():
+        chunk.isetitem(position, series)
+    return chunk
+
+def _hyper_type_for_arrow_type(arrow_type) -> hyperapi.SqlType:
+    """
+    Map a pyarrow type (from a Pandas ArrowDtype column) to a Hyper SQL type.
+    """
+    import pyarrow as pa
+
+    if pa.types.is_boolean(arrow_type):
+        return hyperapi.SqlType.bool()
+    if pa.types.is_integer(arrow_type):
+        if arrow_type.bit_width <= 16 and pa.types.is_signed_integer(arrow_type):
+            return hyperapi.SqlType.small_int()
+        if arrow_type.bit_width <= 32 and pa.types.is_signed_integer(arrow_type):
+            return hyperapi.SqlType.int()
+        return hyperapi.SqlType.big_int()
+    if pa.types.is_floating(arrow_type):
+        return hyperapi.SqlType.double()
+    if pa.types.is_decimal(arrow_type):
+        # Hyper NUMERIC holds at most 18 digits (128-bit numerics need a newer database version);
+        # wider decimals degrade to double, and staged COPY columns are cast to float64 to match.
+        return hyperapi.SqlType.numeric(arrow_type.precision, arrow_type.scale) if arrow_type.precision <= 18 else hyperapi.SqlType.double()
+    if pa.types.is_timestamp(arrow_type):
+        return hyperapi.SqlType.timestamp_tz() if arrow_type.tz else hyperapi.SqlType.timestamp()
+    if pa.types.is_date(arrow_type):
+        return hyperapi.SqlType.date()
+    if pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type):
+        return hyperapi.SqlType.bytes()
+    return hyperapi.SqlType.text()
+
+def _hyper_rows(dataframe: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Yield DataFrame rows as tuples of Python values, with missing values as None.
+    """
+    return dataframe.astype(object).where(dataframe.notna(), None).itertuples(index=False, name=None)
+
+def _hyper_values_to_series(values: tuple, tag: hyperapi.TypeTag) -> pd.Series:
+    """
+    Convert one column of Hyper result values into a Series with a matching (nullable) dtype.
+    """
+    if tag in (hyperapi.TypeTag.SMALL_INT, hyperapi.TypeTag.INT, hyperapi.TypeTag.BIG_INT, hyperapi.TypeTag.OID):
+        return pd.Series(pd.array(values, dtype="Int64"))
+    if tag in (hyperapi.TypeTag.DOUBLE, hyperapi.TypeTag.NUMERIC):
+        return pd.Series(np.array([np.nan if value is None else float(value) for value in values], dtype="float64"))
+    if tag == hyperapi.TypeTag.BOOL:
+        return pd.Series(pd.array(values, dtype="boolean"))
+    if tag == hyperapi.TypeTag.DATE:
+        return pd.Series(pd.to_datetime([None if value is None else value.to_date() for value in values]))
+    if tag in (hyperapi.TypeTag.TIMESTAMP, hyperapi.TypeTag.TIMESTAMP_TZ):
+        return pd.Series(pd.to_datetime([None if value is None else value.to_datetime() for value in values], utc=tag == hyperapi.TypeTag.TIMESTAMP_TZ))
+    return pd.Series(values, dtype=object)
+
+def _arrow_to_dataframe(table) -> pd.DataFrame:
+    """
+    Convert an Arrow table exported by Hyper into a DataFrame with the same dtypes as rows
+    fetched over the connection (see ``_hyper_values_to_series``).
+    """
+    import pyarrow as pa
+
+    data = {}
+    for name, column in zip(table.column_names, table.columns):
+        arrow_type = column.type
+        if pa.types.is_integer(arrow_type):
+            series = column.cast(pa.int64()).to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+        elif pa.types.is_decimal(arrow_type):
+            series = column.cast(pa.float64()).to_pandas()
+        elif pa.types.is_boolean(arrow_type):
+            series = column.to_pandas(types_mapper={pa.bool_(): pd.BooleanDtype()}.get)
+        elif pa.types.is_date(arrow_type):
+            series = column.cast(pa.timestamp("s")).to_pandas()
+        elif pa.types.is_floating(arrow_type) or pa.types.is_timestamp(arrow_type):
+            series = column.to_pandas()
+        else:
+            series = pd.Series(column.to_pylist(), dtype=object)
+        data[name] = series.reset_index(drop=True)
+    return pd.DataFrame(data, columns=table.column_names)
+
+def _timed_chunks(chunks: Iterator[pd.DataFrame], **attributes: Any) -> Iterator[pd.DataFrame]:
+    """
+    Re-yield DataFrame chunks, emitting a "hyper.read" event per chunk that times only its production.
+    """
+    while True:
+        with instrument("hyper", "read", **attributes) as event:
+            chunk = next(chunks, None)
+            event["rows"] = 0 if chunk is None else len(chunk)
+        if chunk is None:
+            return
+        yield chunk
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one item in a bulk Tableau Server operation.
+    """
+    item: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+class TransferResult(NamedTuple):
+    """
+    Outcome of a ``transfer`` into a published datasource.
+    """
+    datasource: Any
+    rows: int
+    bytes: int
+    job: Any = None
+
+_TRANSFER_DONE = object()
 
 class TableauConnectionManager:
     """
     Manages connections to Tableau Server and provides simplified access to Tableau Server Client (TSC) resources.
     """
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(
+        self,
+        config: Optional[Dict] = None,
+        hyper_telemetry: Optional[bool] = None,
+        max_hyper_connections: int = 8,
+        session_cache: Optional[SessionCache] = None,
+    ):
         """
         Initialise the TableauConnectionManager with optional configuration.
 
         :param config: A dictionary containing Tableau connection details.
+        :param hyper_telemetry: Send Hyper usage data to Tableau (defaults to ``tableau.hyper_telemetry``
+            in the config, or True).
+        :param max_hyper_connections: Number of open Hyper file connections kept for reuse.
+        :param session_cache: Store used to reuse signed-in sessions across processes (defaults to a
+            FileSessionCache at ``tableau.session_cache_file`` when that is configured, else disabled).
         """
         self.config: Optional[Dict] = config
         self.server: Optional[TSC.Server] = None
 
+        tableau_config = (config or {}).get("tableau", {})
+        self.hyper_telemetry: bool = hyper_telemetry if hyper_telemetry is not None else tableau_config.get("hyper_telemetry", True)
+        self.hyper_parameters: Optional[Dict[str, str]] = tableau_config.get("hyper_parameters")
+        self.max_hyper_connections: int = max_hyper_connections
+        self.max_retries: int = tableau_config.get("max_retries", 5)
+        requests_per_second = tableau_config.get("requests_per_second")
+        self.rate_limiter: Optional[RateLimiter] = RateLimiter(requests_per_second) if requests_per_second else None
+        if session_cache is None and tableau_config.get("session_cache_file"):
+            session_cache = FileSessionCache(tableau_config["session_cache_file"])
+        self.session_cache: Optional[SessionCache] = session_cache
+        self.session_ttl: int = tableau_config.get("session_ttl", 7200)
+        self._auth: Optional[TSC.PersonalAccessTokenAuth] = None
+        self._session_key: Optional[str] = None
+        self._auth_lock = threading.Lock()
+        self._hyper: Optional[hyperapi.HyperProcess] = None
+        self._hyper_lock = threading.RLock()
+        self._hyper_connections: "OrderedDict[str, Tuple[hyperapi.Connection, threading.Lock]]" = OrderedDict()
+
+    @property
+    def hyper_process(self) -> hyperapi.HyperProcess:
+        """
+        The manager's Hyper process, started on first use and shared by all Hyper methods.
+        """
+        with self._hyper_lock:
+            if self._hyper is None or not self._hyper.is_open:
+                telemetry = hyperapi.Telemetry.SEND_USAGE_DATA_TO_TABLEAU if self.hyper_telemetry else hyperapi.Telemetry.DO_NOT_SEND_USAGE_DATA_TO_TABLEAU
+                self._hyper = hyperapi.HyperProcess(telemetry=telemetry, parameters=self.hyper_parameters)
+                # Shut the process down when the manager is collected or the interpreter exits.
+                weakref.finalize(self, self._hyper.close)
+            return self._hyper
+
+    @contextmanager
+    def _hyper_connection(self, database: str, create_mode: Optional[hyperapi.CreateMode] = None) -> Iterator[hyperapi.Connection]:
+        """
+        Yield a Hyper connection to ``database`` on the shared process.
+
+        Read connections are cached per file and reused across calls. A per-file lock keeps a
+        cached connection to one user at a time; while it is taken (by another thread, or by a
+        lazy ``read_hyper`` iterator on this one) callers get a private connection instead of
+        waiting for it. Connections that create or replace the file are opened fresh and closed
+        afterwards.
+        """
+        path = os.path.abspath(database)
+        if create_mode is not None:
+            self.release_hyper_file(path)
+            with hyperapi.Connection(endpoint=self.hyper_process.endpoint, database=database, create_mode=create_mode) as connection:
+                yield connection
+            return
+
+        with self._hyper_lock:
+            entry = self._hyper_connections.get(path)
+            if entry is None or not entry[0].is_open:
+                entry = (hyperapi.Connection(endpoint=self.hyper_process.endpoint, database=database), threading.Lock())
+                self._hyper_connections[path] = entry
+            self._hyper_connections.move_to_end(path)
+            excess = len(self._hyper_connections) - self.max_hyper_connections
+            for stale_path in list(self._hyper_connections)[:max(excess, 0)]:
+                stale_connection, stale_lock = self._hyper_connections[stale_path]
+                if stale_path != path and stale_lock.acquire(blocking=False):
+                    del self._hyper_connections[stale_path]
+                    stale_connection.close()
+                    stale_lock.release()
+
+        connection, lock = entry
+        acquired = lock.acquire(blocking=False)
+        if not acquired or not connection.is_open:
+            if acquired:
+                lock.release()
+            with hyperapi.Connection(endpoint=self.hyper_process.endpoint, database=database) as connection:
+                yield connection
+            return
+        try:
+            yield connection
+        finally:
+            lock.release()
+            with self._hyper_lock:
+                released = self._hyper_connections.get(path) is not entry
+            # Released (or evicted) while in use: closing it was left to us.
+            if released and connection.is_open:
+                connection.close()
+
+    def release_hyper_file(self, hyper_file: str) -> None:
+        """
+        Close the cached connection to a Hyper file so it can be moved, replaced or deleted.
+
+        A connection that is still in use (e.g. by an unfinished ``read_hyper`` iterator) is
+        removed from the cache and closed once that use ends.
+
+        :param hyper_file: Path to the hyper file.
+        """
+        with self._hyper_lock:
+            entry = self._hyper_connections.pop(os.path.abspath(hyper_file), None)
+        if entry is not None:
+            connection, lock = entry
+            if lock.acquire(blocking=False):
+                try:
+                    connection.close()
+                finally:
+                    lock.release()
+
+    def close(self) -> None:
+        """
+        Close cached Hyper connections and shut down the shared Hyper process.
+        """
+        with self._hyper_lock:
+            for path in list(self._hyper_connections):
+                self.release_hyper_file(path)
+            if self._hyper is not None:
+                self._hyper.close()
+                self._hyper = None
+
+    def __enter__(self) -> "TableauConnectionManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def connect_to_server(
         self, 
         server_url: Optional[str] = None, 
@@ -45,6 +400,9 @@ class TableauConnectionManager:
         """
         Connect to Tableau Server using Personal Access Token.
 
+        With a session cache, an unexpired session (auth token, site and negotiated server
+        version) is reused instead of signing in, and new sessions are written back to it.
+
         :param server_url: The URL of the Tableau Server.
         :param token_name: The name of the personal access token.
         :param personal_access_token: The value of the personal access token.
@@ -64,15 +422,65 @@ class TableauConnectionManager:
                 personal_access_token=personal_access_token,
                 site_id=site_id
             )
-            self.server = TSC.Server(server_url, use_server_version=(server_version is None))
-            if server_version:
-                self.server.server_info.server_version = server_version
-            self.server.auth.sign_in(tableau_auth)
-            print(f"Connected to Tableau Server version {server_version or 'latest'}.")
+            self._auth = tableau_auth
+            self._session_key = SessionCache.make_key(server_url, site_id, token_name)
+
+            with instrument("tableau", "connect", server_url=server_url) as event:
+                cached = self.session_cache.get(self._session_key) if self.session_cache else None
+                event["cached_session"] = bool(cached)
+                if cached:
+                    self.server = TSC.Server(server_url)
+                    self.server.version = cached["server_version"]
+                    self.server._set_auth(cached["site_id"], cached["user_id"], cached["auth_token"], cached.get("site_url"))
+                    logger.info("Reusing cached Tableau Server session (API version %s).", self.server.version)
+                    return self.server
+
+                self.server = TSC.Server(server_url, use_server_version=(server_version is None))
+                if server_version:
+                    self.server.server_info.server_version = server_version
+                self._sign_in()
+            logger.info("Connected to Tableau Server version %s.", server_version or "latest")
             return self.server
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Tableau Server: {e}")
 
+    def _sign_in(self) -> None:
+        """
+        Sign in with the stored credentials and publish the new session to the session cache.
+        """
+        with instrument("tableau", "sign_in"):
+            self.server.auth.sign_in(self._auth)
+        if self.session_cache is not None:
+            self.session_cache.set(self._session_key, {
+                "auth_token": self.server.auth_token,
+                "site_id": self.server.site_id,
+                "user_id": self.server.user_id,
+                "site_url": getattr(self.server, "_site_url", None),
+                "server_version": self.server.version,
+                "expires_at": time.time() + self.session_ttl,
+            })
+
+    def reauthenticate(self, stale_token: Optional[str] = None) -> None:
+        """
+        Replace an expired session: adopt a newer session from the cache if another process
+        already refreshed it, otherwise sign in again.
+
+        :param stale_token: The token that was rejected; if the current token differs, another
+            thread has already refreshed the session and nothing is done.
+        """
+        if self._auth is None:
+            raise ConnectionError("Not connected to Tableau Server. Call 'connect_to_server' first.")
+        with self._auth_lock:
+            if stale_token is not None and self.server.is_signed_in() and self.server.auth_token != stale_token:
+                return
+            if self.session_cache is not None:
+                cached = self.session_cache.get(self._session_key)
+                if cached and cached["auth_token"] != stale_token:
+                    self.server._set_auth(cached["site_id"], cached["user_id"], cached["auth_token"], cached.get("site_url"))
+                    return
+                self.session_cache.delete(self._session_key)
+            self._sign_in()
+
     @property
     def datasources(self) -> TSC.Datasources:
         """Access the Tableau Server datasources endpoint."""
@@ -98,85 +506,499 @@ class TableauConnectionManager:
         """Access the Tableau Server users endpoint."""
         return self.server.users
 
-    def load_hyper_to_dataframe(self, datasource_id: str) -> pd.DataFrame:
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """
+        True for throttling (429), server-side (5xx) and network errors worth retrying.
+        """
+        code = str(getattr(error, "code", "") or "")
+        if code[:3] in ("429", "500", "502", "503", "504"):
+            return True
+        return isinstance(error, (tsc_exceptions.NonXMLResponseError, requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    @staticmethod
+    def _is_unsent_error(error: Exception) -> bool:
+        """
+        True for failures after which the server cannot have acted on the request: throttling
+        (429) and errors opening the connection. Timeouts, dropped connections and 5xx responses
+        are ambiguous, as the request may already have been processed.
+        """
+        if str(getattr(error, "code", "") or "")[:3] == "429":
+            return True
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            import urllib3
+
+            reason = getattr(error.args[0], "reason", error.args[0])
+            return isinstance(reason, urllib3.exceptions.NewConnectionError)
+        return False
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Invoke a Tableau Server REST call through the manager's rate limiter, retrying
+        429/5xx responses with exponential backoff and signing in again once on 401.
+
+        :param func: Endpoint method to call, e.g. ``manager.datasources.get_by_id``.
+        :return: The endpoint method's return value.
+        """
+        return self._call(func, args, kwargs, self.max_retries, self._is_transient_error)
+
+    def call_once(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Like ``call``, but without retrying 429/5xx responses or network errors, for requests
+        that must not run twice (e.g. an Append publish would duplicate rows). A 401 is still
+        answered by signing in again and repeating the request, which the server rejected.
+
+        :param func: Endpoint method to call, e.g. ``manager.datasources.publish``.
+        :return: The endpoint method's return value.
+        """
+        return self._call(func, args, kwargs, 0, self._is_transient_error)
+
+    def call_unsent(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Like ``call``, but only retrying failures that guarantee the request was not processed
+        (429 and connection errors), for requests that start server-side work which must not
+        be queued twice (e.g. extract refreshes). Timeouts and 5xx responses are raised.
+
+        :param func: Endpoint method to call, e.g. ``manager.datasources.refresh``.
+        :return: The endpoint method's return value.
+        """
+        return self._call(func, args, kwargs, self.max_retries, self._is_unsent_error)
+
+    def _call(self, func: Callable, args: Sequence[Any], kwargs: Dict[str, Any], retries: int, should_retry: Callable[[Exception], bool]) -> Any:
+        token = self.server.auth_token if self.server is not None and self.server.is_signed_in() else None
+        with instrument("tableau", "rest", method=getattr(func, "__qualname__", repr(func))):
+            try:
+                return retry_call(
+                    func, args, kwargs,
+                    retries=retries,
+                    should_retry=should_retry,
+                    rate_limiter=self.rate_limiter,
+                )
+            except Exception as e:
+                if self._auth is None or not str(getattr(e, "code", "") or "").startswith("401"):
+                    raise
+                self.reauthenticate(stale_token=token)
+            return retry_call(
+                func, args, kwargs,
+                retries=retries,
+                should_retry=should_retry,
+                rate_limiter=self.rate_limiter,
+            )
+
+    def _endpoint(self, endpoint: str) -> Any:
+        if not self.server:
+            raise ConnectionError("Not connected to Tableau Server. Call 'connect_to_server' first.")
+        return getattr(self.server, endpoint)
+
+    def iter_items(
+        self,
+        endpoint: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over every item of an endpoint, one server-side filtered page at a time.
+
+        :param endpoint: Endpoint name, e.g. "datasources", "workbooks", "flows", "projects" or "users".
+        :param filters: Field name to value (Equals) or to an (operator, value) tuple,
+            e.g. {"projectName": "Finance", "updatedAt": (TSC.RequestOptions.Operator.GreaterThan, "2024-01-01T00:00:00Z")}.
+        :param fields: Fields to return, e.g. ["_default_", "owner.name"].
+        :param sort: (field, direction) pairs, e.g. [("name", TSC.RequestOptions.Direction.Asc)].
+        :param page_size: Number of items per request (at most 1000).
+        :return: Iterator over endpoint items.
+        """
+        request_options = TSC.RequestOptions(pagesize=page_size)
+        for field, value in (filters or {}).items():
+            operator, value = value if isinstance(value, tuple) else (TSC.RequestOptions.Operator.Equals, value)
+            request_options.filter.add(TSC.Filter(field, operator, value))
+        for field, direction in (sort or []):
+            request_options.sort.add(TSC.Sort(field, direction))
+        if fields:
+            request_options.fields.update(fields)
+
+        endpoint_object = self._endpoint(endpoint)
+        return iter(TSC.Pager(lambda options: self.call(endpoint_object.get, options), request_options))
+
+    def bulk_apply(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: int = 8,
+        retry: bool = True,
+        idempotent: bool = True,
+    ) -> List[BulkResult]:
+        """
+        Apply a Tableau Server call to many items on a bounded thread pool.
+
+        Each call goes through ``call`` (rate limiting and retries), ``call_unsent`` when it is
+        not ``idempotent``, or ``call_once`` when ``retry`` is False; a failure is recorded in its
+        BulkResult instead of aborting the batch.
+
+        :param func: Callable taking one item.
+        :param items: Items to process.
+        :param max_workers: Number of concurrent requests.
+        :param retry: Retry transient failures; disable for calls that must not run twice.
+        :param idempotent: False limits retries to failures where the request was not sent.
+        :return: One BulkResult per item, in input order.
+        """
+        call = self.call_once if not retry else self.call if idempotent else self.call_unsent
+
+        def apply(item: Any) -> BulkResult:
+            try:
+                return BulkResult(item, call(func, item))
+            except Exception as e:
+                return BulkResult(item, error=e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(apply, items))
+
+    def bulk_download(
+        self,
+        endpoint: str,
+        item_ids: Iterable[str],
+        directory: str,
+        include_extract: bool = True,
+        max_workers: int = 8,
+    ) -> List[BulkResult]:
+        """
+        Download many datasources, workbooks or flows in parallel.
+
+        :param endpoint: "datasources", "workbooks" or "flows".
+        :param item_ids: IDs of the items to download.
+        :param directory: Directory to download into.
+        :param include_extract: Include extract data (datasources and workbooks only).
+        :param max_workers: Number of concurrent downloads.
+        :return: One BulkResult per ID whose result is the downloaded file path.
+        """
+        endpoint_object = self._endpoint(endpoint)
+        os.makedirs(directory, exist_ok=True)
+        if endpoint == "flows":
+            download = lambda item_id: endpoint_object.download(item_id, filepath=directory)
+        else:
+            download = lambda item_id: endpoint_object.download(item_id, filepath=directory, include_extract=include_extract)
+        return self.bulk_apply(download, item_ids, max_workers=max_workers)
+
+    def bulk_refresh(self, endpoint: str, items: Iterable[Any], max_workers: int = 8) -> List[BulkResult]:
+        """
+        Trigger extract refreshes for many datasources, workbooks or flows in parallel.
+
+        Each refresh queues a server-side job, so only failures where the request was not sent
+        are retried (``call_unsent``); a timeout or 5xx response is reported, not resubmitted.
+
+        :param endpoint: "datasources", "workbooks" or "flows".
+        :param items: Items (or IDs) to refresh.
+        :param max_workers: Number of concurrent requests.
+        :return: One BulkResult per item whose result is the refresh JobItem.
+        """
+        return self.bulk_apply(self._endpoint(endpoint).refresh, items, max_workers=max_workers, idempotent=False)
+
+    def bulk_publish(
+        self,
+        endpoint: str,
+        items: Iterable[Tuple[Any, str]],
+        mode: str = "Overwrite",
+        max_workers: int = 4,
+    ) -> List[BulkResult]:
+        """
+        Publish many datasources, workbooks or flows in parallel.
+
+        Publishes are not retried, since repeating one that reached the server (e.g. an Append)
+        would publish its data twice; failed pairs can be resubmitted from their BulkResults.
+
+        :param endpoint: "datasources", "workbooks" or "flows".
+        :param items: (item, file path) pairs, e.g. (TSC.DatasourceItem(project_id), "sales.hyper").
+        :param mode: Publish mode: "CreateNew", "Overwrite" or "Append".
+        :param max_workers: Number of concurrent uploads.
+        :return: One BulkResult per pair whose result is the published item.
+        """
+        endpoint_object = self._endpoint(endpoint)
+        publish_mode = getattr(TSC.Server.PublishMode, mode)
+        return self.bulk_apply(lambda pair: endpoint_object.publish(pair[0], pair[1], publish_mode), items, max_workers=max_workers, retry=False)
+
+    def load_hyper_to_dataframe(
+        self,
+        datasource_id: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        table_name: Optional[Union[str, hyperapi.TableName]] = None,
+    ) -> pd.DataFrame:
         """
         Load data from a published Tableau hyper file into a Pandas DataFrame.
 
         :param datasource_id: The ID of the datasource on Tableau Server.
+        :param columns: Columns to read (default: all columns).
+        :param where: SQL predicate evaluated inside Hyper, e.g. "region = 'EMEA'".
+        :param table_name: Table to read (default: the first table in the "Extract" schema).
         :return: DataFrame containing the data from the hyper file.
         """
+        temp_file = f"{datasource_id}.hyper"
         try:
             # Download the .hyper file from Tableau Server
-            temp_file = f"{datasource_id}.hyper"
-            self.datasources.download(datasource_id, filepath=temp_file)
-
-            with HyperProcess(telemetry=Telemetry.SEND_USAGE_DATA_TO_TABLEAU) as hyper:
-                with Connection(endpoint=hyper.endpoint, database=temp_file) as connection:
-                    table_names = connection.catalog.get_table_names("Extract")
-                    if not table_names:
-                        raise ValueError("No tables found in the Hyper file.")
-
-                    table_name = table_names[0]
-                    result = connection.execute_query(f"SELECT * FROM {table_name}")
-                    dataframe = pd.DataFrame(result)
-                    dataframe.columns = [column.name for column in connection.catalog.get_table_definition(table_name).columns]
-
-            os.remove(temp_file)
-            return dataframe
+            with instrument("tableau", "download", datasource_id=datasource_id) as event:
+                temp_file = self.call(self.datasources.download, datasource_id, filepath=temp_file) or temp_file
+                event["bytes"] = os.path.getsize(temp_file)
+            return self.read_hyper(temp_file, columns=columns, where=where, table_name=table_name)
 
         except Exception as e:
             raise RuntimeError(f"Failed to load hyper file into DataFrame: {e}")
 
-    def retrieve_data_from_local_hyper(self, hyper_file: str) -> pd.DataFrame:
+        finally:
+            self.release_hyper_file(temp_file)
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    def retrieve_data_from_local_hyper(
+        self,
+        hyper_file: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        table_name: Optional[Union[str, hyperapi.TableName]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Retrieve data from a local hyper file into a Pandas DataFrame.
 
         :param hyper_file: Path to the local hyper file.
+        :param columns: Columns to read (default: all columns).
+        :param where: SQL predicate evaluated inside Hyper, e.g. "region = 'EMEA'".
+        :param table_name: Table to read (default: the first table in the "Extract" schema).
+        :param chunk_size: If given, return an iterator of DataFrames with at most this many rows.
         :return: DataFrame containing the data from the hyper file.
         """
         try:
-            with HyperProcess(telemetry=Telemetry.SEND_USAGE_DATA_TO_TABLEAU) as hyper:
-                with Connection(endpoint=hyper.endpoint, database=hyper_file) as connection:
-                    table_names = connection.catalog.get_table_names("Extract")
-                    if not table_names:
-                        raise ValueError("No tables found in the Hyper file.")
+            return self.read_hyper(hyper_file, columns=columns, where=where, table_name=table_name, chunk_size=chunk_size)
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve data from local Hyper file: {e}")
+
+    @staticmethod
+    def _resolve_table_name(connection: hyperapi.Connection, table_name: Optional[Union[str, hyperapi.TableName]]) -> hyperapi.TableName:
+        """
+        Resolve an optional table name to a fully qualified table in the attached database.
+        """
+        if isinstance(table_name, hyperapi.TableName):
+            return table_name
+        if table_name and "." in table_name:
+            return hyperapi.TableName(*table_name.split(".", 1))
 
-                    table_name = table_names[0]
-                    result = connection.execute_query(f"SELECT * FROM {table_name}")
-                    dataframe = pd.DataFrame(result)
-                    dataframe.columns = [column.name for column in connection.catalog.get_table_definition(table_name).columns]
+        schemas = connection.catalog.get_schema_names()
+        schemas = sorted(schemas, key=lambda schema: schema.name.unescaped != "Extract")
+        for schema in schemas:
+            for candidate in connection.catalog.get_table_names(schema):
+                if table_name is None or candidate.name.unescaped == table_name:
+                    return candidate
+        raise ValueError(f"Table {table_name} not found in the Hyper file." if table_name else "No tables found in the Hyper file.")
 
-            return dataframe
+    @staticmethod
+    def _select_statement(table: hyperapi.TableName, columns: Optional[List[str]], where: Optional[str]) -> str:
+        projection = ", ".join(hyperapi.escape_name(column) for column in columns) if columns else "*"
+        statement = f"SELECT {projection} FROM {table}"
+        if where:
+            statement += f" WHERE {where}"
+        return statement
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to retrieve data from local Hyper file: {e}")
+    @staticmethod
+    def _result_to_dataframe(rows: List[tuple], result_columns) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from Hyper result rows, with dtypes taken from the result schema.
+        """
+        values = list(zip(*rows)) if rows else [()] * len(result_columns)
+        data = {}
+        for column, column_values in zip(result_columns, values):
+            data[column.name.unescaped] = _hyper_values_to_series(column_values, column.type.tag)
+        return pd.DataFrame(data, columns=[column.name.unescaped for column in result_columns])
+
+    def read_hyper(
+        self,
+        hyper_file: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        table_name: Optional[Union[str, hyperapi.TableName]] = None,
+        chunk_size: Optional[int] = None,
+        method: str = "fetch",
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Read a table from a local hyper file with column projection and predicate pushdown.
+
+        Column dtypes follow the Hyper schema, whichever ``method`` is used: integers become
+        Int64, doubles and numerics float64, booleans boolean, dates and timestamps datetime64
+        and text object.
+
+        :param hyper_file: Path to the local hyper file.
+        :param columns: Columns to read (default: all columns).
+        :param where: SQL predicate evaluated inside Hyper, e.g. "region = 'EMEA'".
+        :param table_name: Table to read; "schema.table" or a TableName (default: the first table,
+            preferring the "Extract" schema).
+        :param chunk_size: If given, return an iterator of DataFrames with at most this many rows.
+        :param method: "fetch" reads rows over the Hyper connection; "parquet" exports the query
+            with Hyper's ``COPY ... TO`` and reads it back columnar with pyarrow.
+        :return: A DataFrame, or an iterator of DataFrames when ``chunk_size`` is set.
+        """
+        if method not in ("fetch", "parquet"):
+            raise ValueError("Invalid method specified. Choose 'fetch' or 'parquet'.")
+        chunks = self._iter_hyper_chunks(hyper_file, columns, where, table_name, chunk_size, method)
+        if chunk_size:
+            return chunks
+        try:
+            return next(chunks)
+        finally:
+            chunks.close()
+
+    def _iter_hyper_chunks(
+        self,
+        hyper_file: str,
+        columns: Optional[List[str]],
+        where: Optional[str],
+        table_name: Optional[Union[str, hyperapi.TableName]],
+        chunk_size: Optional[int],
+        method: str,
+    ) -> Iterator[pd.DataFrame]:
+        with self._hyper_connection(hyper_file) as connection:
+            table = self._resolve_table_name(connection, table_name)
+            statement = self._select_statement(table, columns, where)
+
+            if method == "parquet":
+                import pyarrow.parquet as pq
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    path = os.path.join(temp_dir, "export.parquet")
+                    with instrument("hyper", "export", statement=statement) as event:
+                        connection.execute_command(f"COPY ({statement}) TO {hyperapi.escape_string_literal(path)} WITH (FORMAT PARQUET)")
+                        event["bytes"] = os.path.getsize(path)
+                    parquet_file = pq.ParquetFile(path)
+                    if chunk_size:
+                        chunks = (_arrow_to_dataframe(batch) for batch in parquet_file.iter_batches(batch_size=chunk_size))
+                    else:
+                        chunks = (_arrow_to_dataframe(parquet_file.read()) for _ in range(1))
+                    yield from _timed_chunks(chunks, statement=statement, method=method)
+                return
+
+            with connection.execute_query(statement) as result:
+                result_columns = result.schema.columns
+                if chunk_size:
+                    batches = iter(lambda: list(itertools.islice(result, chunk_size)), [])
+                    chunks = (self._result_to_dataframe(rows, result_columns) for rows in batches)
+                else:
+                    chunks = (self._result_to_dataframe(list(result), result_columns) for _ in range(1))
+                yield from _timed_chunks(chunks, statement=statement, method=method)
+
+    @staticmethod
+    def infer_table_definition(dataframe: pd.DataFrame, table_name: str = "Extract", nullable: bool = False) -> hyperapi.TableDefinition:
+        """
+        Build a typed Hyper table definition from a DataFrame's dtypes.
+
+        Integer, float, boolean, datetime (naive and tz-aware), date, categorical and Arrow-backed
+        (``pd.ArrowDtype``) columns get matching Hyper types; object columns are typed from their
+        values (Decimal, int, date, ...) and are text when they mix types. Unless ``nullable`` is
+        set, NumPy integer and boolean columns, which cannot hold missing values, are declared NOT NULL.
+
+        :param dataframe: DataFrame whose columns describe the table.
+        :param table_name: Name of the table inside the Hyper file.
+        :param nullable: Declare every column NULLABLE, e.g. when ``dataframe`` is only the first
+            of several chunks and later ones may have missing values.
+        :return: Hyper table definition.
+        """
+        columns = []
+        for position, (name, dtype) in enumerate(dataframe.dtypes.items()):
+            values = dataframe.iloc[:, position] if dtype == object else None
+            not_null = not nullable and isinstance(dtype, np.dtype) and dtype.kind in "iub"
+            columns.append(hyperapi.TableDefinition.Column(
+                str(name), _hyper_type_for_dtype(dtype, values), hyperapi.NOT_NULLABLE if not_null else hyperapi.NULLABLE
+            ))
+        return hyperapi.TableDefinition(table_name=table_name, columns=columns)
+
+    @staticmethod
+    def _copy_chunk_into_hyper(connection: hyperapi.Connection, table_definition: hyperapi.TableDefinition, chunk: pd.DataFrame, temp_dir: str) -> None:
+        """
+        Bulk load one chunk with Hyper's COPY, staging it as Parquet (or CSV without pyarrow).
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            path = os.path.join(temp_dir, "chunk.parquet")
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            # Cast to the table's types (e.g. uint64 or decimal128(5, 3) chunks into BIGINT or
+            # NUMERIC(10, 4) columns); Hyper also rejects optional Parquet fields for NOT NULL columns.
+            schema = pa.schema([
+                pa.field(field.name, _arrow_type_for_hyper_type(column.type, field.type), column.nullability == hyperapi.NULLABLE)
+                for field, column in zip(table.schema, table_definition.columns)
+            ])
+            pq.write_table(table.cast(schema), path, coerce_timestamps="us", allow_truncated_timestamps=True)
+            options = "FORMAT PARQUET"
+        except ImportError:
+            path = os.path.join(temp_dir, "chunk.csv")
+            chunk.to_csv(path, index=False, na_rep="\\N")
+            options = "FORMAT CSV, HEADER, NULL '\\N'"
+        connection.execute_command(
+            f"COPY {table_definition.table_name} FROM {hyperapi.escape_string_literal(path)} WITH ({options})"
+        )
+        os.remove(path)
 
-    def dataframe_to_local_hyper(self, dataframe: pd.DataFrame, hyper_file: str, table_name: str = "Extract") -> None:
+    def dataframe_to_local_hyper(
+        self,
+        dataframe: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        hyper_file: str,
+        table_name: str = "Extract",
+        method: str = "copy",
+        chunk_size: int = 100000,
+    ) -> None:
         """
-        Save a Pandas DataFrame into a local hyper file.
+        Save a Pandas DataFrame into a local hyper file with a typed schema.
 
-        :param dataframe: DataFrame containing the data to save.
+        :param dataframe: DataFrame containing the data to save, or an iterable of DataFrame chunks
+            sharing the same columns (e.g. from ``stream_query`` or ``pd.read_csv(chunksize=...)``)
+            for data larger than memory.
         :param hyper_file: Path to the output hyper file.
         :param table_name: Name of the table inside the Hyper file.
+        :param method: "copy" bulk loads each chunk through a Parquet/CSV file and Hyper's COPY;
+            "insert" streams rows through an Inserter.
+        :param chunk_size: Number of rows written per batch.
         """
+        if method not in ("copy", "insert"):
+            raise ValueError("Invalid method specified. Choose 'copy' or 'insert'.")
         try:
-            with HyperProcess(telemetry=Telemetry.SEND_USAGE_DATA_TO_TABLEAU) as hyper:
-                with Connection(endpoint=hyper.endpoint, database=hyper_file, create_mode=Connection.CreateMode.CREATE_AND_REPLACE) as connection:
-                    table_definition = TableDefinition(
-                        table_name=table_name,
-                        columns=[(col, SqlType.text(), NOT_NULLABLE) for col in dataframe.columns]
-                    )
-                    connection.catalog.create_table(table_definition)
+            if isinstance(dataframe, pd.DataFrame):
+                chunks = (dataframe.iloc[start:start + chunk_size] for start in range(0, max(len(dataframe), 1), chunk_size))
+            else:
+                chunks = iter(dataframe)
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                raise ValueError("No data to save.")
+            table_definition = self.infer_table_definition(first_chunk, table_name, nullable=not isinstance(dataframe, pd.DataFrame))
+
+            with self._hyper_connection(hyper_file, create_mode=hyperapi.CreateMode.CREATE_AND_REPLACE) as connection:
+                connection.catalog.create_table(table_definition)
 
-                    with Inserter(connection, table_definition) as inserter:
-                        inserter.add_rows(dataframe.values.tolist())
-                        inserter.execute()
+                if method == "copy":
+                    with tempfile.TemporaryDirectory() as temp_dir:
+                        for chunk in itertools.chain([first_chunk], chunks):
+                            if len(chunk):
+                                with instrument("hyper", "write", method=method, rows=len(chunk)):
+                                    self._copy_chunk_into_hyper(connection, table_definition, _conform_chunk(chunk, table_definition), temp_dir)
+                else:
+                    with hyperapi.Inserter(connection, table_definition) as inserter:
+                        for chunk in itertools.chain([first_chunk], chunks):
+                            with instrument("hyper", "write", method=method, rows=len(chunk)):
+                                inserter.add_rows(_hyper_rows(_conform_chunk(chunk, table_definition)))
+                        with instrument("hyper", "commit", method=method):
+                            inserter.execute()
 
-            print(f"DataFrame saved to {hyper_file} successfully.")
+            logger.info("DataFrame saved to %s successfully.", hyper_file)
 
         except Exception as e:
             raise RuntimeError(f"Failed to save DataFrame to Hyper file: {e}")
 
+    def _publish_hyper_file(self, hyper_file: str, datasource_name: str, project_id: str, mode: str = "Overwrite") -> Any:
+        """
+        Publish a local hyper file as a datasource; TSC switches to chunked upload above 64 MB.
+        """
+        datasource = TSC.DatasourceItem(project_id, name=datasource_name)
+        with instrument("tableau", "publish", datasource=datasource_name, bytes=os.path.getsize(hyper_file)):
+            # call_once: repeating an Append publish would duplicate rows, but a 401 still signs in again.
+            return self.call_once(self._endpoint("datasources").publish, datasource, hyper_file, getattr(TSC.Server.PublishMode, mode))
+
     def dataframe_to_published_datasource(self, dataframe: pd.DataFrame, datasource_name: str, project_id: str) -> None:
         """
         Publish a Pandas DataFrame to Tableau Server as a datasource.
@@ -185,18 +1007,213 @@ class TableauConnectionManager:
         :param datasource_name: Name of the published datasource.
         :param project_id: Tableau project ID where the datasource will be published.
         """
-        temp_file = f"{datasource_name}.hyper"
         try:
-            self.dataframe_to_local_hyper(dataframe, temp_file)
-
-            datasource = TSC.DatasourceItem(project_id)
-            self.server.datasources.publish(datasource, temp_file, TSC.Server.PublishMode.Overwrite)
+            # A private directory per call, so concurrent jobs publishing the same name do not clash.
+            with tempfile.TemporaryDirectory(prefix="cm_publish_") as temp_dir:
+                temp_file = os.path.join(temp_dir, f"{datasource_name}.hyper")
+                self.dataframe_to_local_hyper(dataframe, temp_file)
+                self.release_hyper_file(temp_file)
+                self._publish_hyper_file(temp_file, datasource_name, project_id)
 
-            print(f"Datasource {datasource_name} published successfully.")
+            logger.info("Datasource %s published successfully.", datasource_name)
 
         except Exception as e:
             raise RuntimeError(f"Failed to publish DataFrame as datasource: {e}")
 
+    @staticmethod
+    def _transfer_columns(source: Any, description: Sequence[Any], first_rows: List[tuple]) -> Tuple[List[Any], List[Optional[Callable[[Any], Any]]]]:
+        """
+        Hyper columns and per-column value converters for a source cursor description.
+
+        Types come from the source manager's ``describe_columns``; columns it cannot type are
+        inferred from the first batch (decimals as double), and fall back to text.
+        """
+        import pyarrow as pa
+
+        columns, converters = [], []
+        for index, column in enumerate(source.describe_columns(description)):
+            arrow_type, converter = column.arrow_type, column.converter
+            if arrow_type is None:
+                values = [row[index] for row in first_rows]
+                if converter is not None:
+                    values = [None if value is None else converter(value) for value in values]
+                try:
+                    arrow_type = pa.array(values).type
+                except (pa.ArrowException, TypeError, ValueError):
+                    arrow_type = pa.string()
+                if pa.types.is_decimal(arrow_type):
+                    # Precision and scale seen in one batch need not hold for the next ones.
+                    arrow_type = pa.float64()
+                sql_type = _hyper_type_for_arrow_type(arrow_type)
+                if sql_type == hyperapi.SqlType.text():
+                    read = converter
+                    converter = (lambda value, read=read: str(read(value))) if read is not None else str
+            else:
+                sql_type = _hyper_type_for_arrow_type(arrow_type)
+            columns.append(hyperapi.TableDefinition.Column(str(column.name), sql_type, hyperapi.NULLABLE))
+            converters.append(converter)
+        return columns, converters
+
+    def transfer(
+        self,
+        source: Any,
+        source_query: str,
+        target_datasource: str,
+        project_id: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        mode: str = "overwrite",
+        key_columns: Optional[List[str]] = None,
+        table_name: Union[str, hyperapi.TableName] = "Extract",
+        batch_size: int = 50000,
+        max_pending_batches: int = 2,
+        wait: bool = True,
+    ) -> TransferResult:
+        """
+        Stream a query result from Oracle or Redshift into a published Tableau datasource.
+
+        A producer thread fetches row batches with the source's ``stream_query`` while the
+        calling thread feeds them into a Hyper ``Inserter``, so fetching and inserting overlap
+        and no DataFrame is built. At most ``max_pending_batches`` batches wait between the two,
+        so memory is bounded by the batch size, not the result size. The extract is written in
+        a per-call temporary directory and removed after publishing.
+
+        :param source: OracleConnectionManager or RedshiftConnectionManager to read from.
+        :param source_query: SQL query whose result is transferred.
+        :param target_datasource: Name of the published datasource.
+        :param project_id: Tableau project ID of the datasource.
+        :param params: Optional bind parameters for the query.
+        :param mode: "overwrite" replaces the datasource, "append" adds the rows to it and
+            "upsert" updates rows matching ``key_columns`` and inserts the rest (Tableau's
+            update-data API; the datasource must have been published from a hyper file).
+        :param key_columns: Columns identifying a row, for "upsert".
+        :param table_name: Table inside the extract; "schema.table" or a TableName (default
+            schema: "public"). Upserts target the same schema and table in the datasource.
+        :param batch_size: Rows per fetch and per insert.
+        :param max_pending_batches: Fetched batches allowed to wait for the inserter.
+        :param wait: For "upsert", wait for the server-side update job to finish.
+        :return: TransferResult with the published datasource (or the updated datasource and its job),
+            the number of rows and the extract size in bytes.
+        """
+        if mode not in ("overwrite", "append", "upsert"):
+            raise ValueError("Invalid mode specified. Choose 'overwrite', 'append' or 'upsert'.")
+        if mode == "upsert" and not key_columns:
+            raise ValueError("key_columns are required for mode 'upsert'.")
+
+        batches: "queue.Queue" = queue.Queue(maxsize=max(max_pending_batches, 1))
+        stop = threading.Event()
+        description: List[Any] = []
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            # Runs the source generator to completion (or until the consumer stops) in this thread.
+            stream = source.stream_query(source_query, params, chunk_size=batch_size, on_description=description.extend)
+            try:
+                for rows in stream:
+                    if not put(rows):
+                        return
+                put(_TRANSFER_DONE)
+            except BaseException as e:
+                put(e)
+            finally:
+                stream.close()
+
+        def fetched() -> Iterator[List[tuple]]:
+            while True:
+                item = batches.get()
+                if item is _TRANSFER_DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        producer = threading.Thread(target=produce, name="connection-manager-transfer", daemon=True)
+        try:
+            with instrument("tableau", "transfer", datasource=target_datasource, mode=mode) as event, \
+                    tempfile.TemporaryDirectory(prefix="cm_transfer_") as temp_dir:
+                hyper_file = os.path.join(temp_dir, f"{target_datasource}.hyper")
+                producer.start()
+                rows_iter = fetched()
+                first_rows = next(rows_iter, [])
+                columns, converters = self._transfer_columns(source, description, first_rows)
+                if isinstance(table_name, str) and "." in table_name:
+                    table_name = hyperapi.TableName(*table_name.split(".", 1))
+                table_definition = hyperapi.TableDefinition(table_name=table_name, columns=columns)
+                convert = [(index, converter) for index, converter in enumerate(converters) if converter is not None]
+                row_count = 0
+
+                with self._hyper_connection(hyper_file, create_mode=hyperapi.CreateMode.CREATE_AND_REPLACE) as connection:
+                    if table_definition.table_name.schema_name is not None:
+                        connection.catalog.create_schema_if_not_exists(table_definition.table_name.schema_name)
+                    connection.catalog.create_table(table_definition)
+                    with hyperapi.Inserter(connection, table_definition) as inserter:
+                        for rows in itertools.chain([first_rows], rows_iter):
+                            if not rows:
+                                continue
+                            if convert:
+                                rows = [list(row) for row in rows]
+                                for row in rows:
+                                    for index, converter in convert:
+                                        if row[index] is not None:
+                                            row[index] = converter(row[index])
+                            with instrument("hyper", "write", method="insert", rows=len(rows)):
+                                inserter.add_rows(rows)
+                            row_count += len(rows)
+                        with instrument("hyper", "commit", method="insert"):
+                            inserter.execute()
+                producer.join()
+
+                size = os.path.getsize(hyper_file)
+                event.update(rows=row_count, bytes=size)
+                if mode == "upsert":
+                    datasource = self._find_datasource(target_datasource, project_id)
+                    conditions = [{"op": "eq", "source-col": column, "target-col": column} for column in key_columns]
+                    # Unqualified tables are created in Hyper's default "public" schema.
+                    table = table_definition.table_name
+                    schema = table.schema_name.name.unescaped if table.schema_name is not None else "public"
+                    actions = [{
+                        "action": "upsert",
+                        "source-schema": schema,
+                        "source-table": table.name.unescaped,
+                        "target-schema": schema,
+                        "target-table": table.name.unescaped,
+                        "condition": conditions[0] if len(conditions) == 1 else {"op": "and", "args": conditions},
+                    }]
+                    with instrument("tableau", "update_data", datasource=target_datasource, bytes=size):
+                        job = self.call(
+                            self._endpoint("datasources").update_hyper_data, datasource,
+                            request_id=uuid.uuid4().hex, actions=actions, payload=hyper_file,
+                        )
+                        if wait:
+                            job = self.call(self._endpoint("jobs").wait_for_job, job)
+                    result = TransferResult(datasource, row_count, size, job)
+                else:
+                    datasource = self._publish_hyper_file(hyper_file, target_datasource, project_id, mode.capitalize())
+                    result = TransferResult(datasource, row_count, size)
+
+            logger.info("Transferred %s rows into datasource %s (%s).", result.rows, target_datasource, mode)
+            return result
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to transfer query into datasource {target_datasource}: {e}")
+
         finally:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            stop.set()
+            if producer.is_alive():
+                producer.join()
+
+    def _find_datasource(self, datasource_name: str, project_id: str) -> Any:
+        """
+        Look up a published datasource by name within a project.
+        """
+        for datasource in self.iter_items("datasources", filters={"name": datasource_name}):
+            if datasource.project_id == project_id:
+                return datasource
+        raise ValueError(f"Datasource {datasource_name!r} not found in project {project_id}.")
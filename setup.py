@@ -1,5 +1,19 @@
 from setuptools import setup, find_packages
 
+# Drivers are imported lazily, so each backend is an optional extra; e.g. an S3-only job
+# needs just "pip install connection_manager[aws]".
+extras_require = {
+    "tableau": ["tableauserverclient", "tableauhyperapi", "pandas", "numpy", "pyarrow", "requests"],
+    "oracle": ["cx_Oracle"],
+    "aws": ["boto3==1.34.69"],
+    "redshift": ["psycopg2"],
+    "arrow": ["pyarrow", "pandas"],
+    "async": ["asyncpg"],
+    "prometheus": ["prometheus_client"],
+    "opentelemetry": ["opentelemetry-api"],
+}
+extras_require["all"] = sorted({requirement for requirements in extras_require.values() for requirement in requirements})
+
 setup(
     name="connection_manager",
     version="1.1.0",
@@ -7,11 +21,7 @@ setup(
     author="JKEEPS",
     packages=find_packages(),
     install_requires=[
-        "tableauserverclient",
-        "tableauhyperapi",
-        "cx_Oracle",
-        "boto3==1.34.69",
-        "psycopg2",
         "pyyaml",
     ],
-)
\ No newline at end of file
+    extras_require=extras_require,
+)
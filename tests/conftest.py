@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the unit tests.
+
+The cx_Oracle stub from the benchmark suite stands in for the Oracle driver, and Redshift
+tests replace ``psycopg2.connect`` with in-memory fakes, so no database server is needed.
+"""
+import os
+import sys
+
+import pytest
+
+# The stub must shadow any installed cx_Oracle before connection_manager is imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "stubs"))
+
+import cx_Oracle  # noqa: E402  (the stub)
+
+from fakes import FakeConnection  # noqa: E402
+
+@pytest.fixture(scope="session")
+def tableau_config(tmp_path_factory):
+    """
+    Tableau settings whose Hyper process logs to a temporary directory, not the working directory.
+    """
+    return {"tableau": {"hyper_telemetry": False, "hyper_parameters": {"log_dir": str(tmp_path_factory.mktemp("hyper_logs"))}}}
+
+@pytest.fixture
+def oracle_config():
+    return {"oracle": {"dsn": "localhost:1521/TEST", "user": "test", "password": "test"}}
+
+@pytest.fixture
+def oracle_result():
+    cx_Oracle.set_result([("ID", cx_Oracle.DB_TYPE_NUMBER, None, None, 10, 0, True)], [(i,) for i in range(10)])
+    yield
+    cx_Oracle.set_result(None, [])
+
+@pytest.fixture
+def redshift_connections(monkeypatch):
+    """
+    Make ``psycopg2.connect`` return FakeConnections; yields the list of connections opened.
+    """
+    import psycopg2
+
+    opened = []
+
+    def connect(**kwargs):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    monkeypatch.setattr(psycopg2, "connect", connect)
+    return opened
+
+@pytest.fixture
+def redshift_config():
+    return {"redshift": {"host": "localhost", "port": 5439, "dbname": "dev", "user": "test", "password": "test"}}
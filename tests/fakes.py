@@ -0,0 +1,76 @@
+"""
+In-memory stand-ins for psycopg2 connections and cursors.
+"""
+
+class FakeCursor:
+    """
+    DB-API cursor returning ``rows`` for every query and recording what was executed.
+    """
+    def __init__(self, connection: "FakeConnection"):
+        self.connection = connection
+        self.description = connection.description
+        self.itersize = 2000
+        self.rowcount = -1
+
+    def execute(self, query, params=None):
+        if self.connection.closed:
+            raise self.connection.error("connection already closed")
+        if self.connection.aborted:
+            raise self.connection.error("current transaction is aborted, commands ignored until end of transaction block")
+        self.connection.executed.append((query, params))
+        if self.connection.fail_on is not None and self.connection.fail_on in query:
+            self.connection.aborted = True
+            raise self.connection.error(f"failed: {query}")
+        if self.connection.on_execute is not None:
+            self.connection.on_execute(query)
+        self._rows = list(self.connection.rows)
+        self.rowcount = len(self._rows)
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchmany(self, size=None):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class FakeConnection:
+    """
+    Minimal psycopg2-style connection counting commits and rollbacks.
+
+    Like psycopg2, a failed statement aborts the transaction: further statements fail until
+    the connection is rolled back.
+    """
+    error = RuntimeError
+
+    def __init__(self, rows=((1, "a"), (2, "b")), description=(("id",), ("name",))):
+        self.rows = list(rows)
+        self.description = list(description)
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed = []
+        self.fail_on = None
+        self.aborted = False
+        self.on_execute = None
+
+    def cursor(self, name=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.aborted = False
+
+    def close(self):
+        self.closed = 1
@@ -0,0 +1,118 @@
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+pytest.importorskip("tableauserverclient")
+
+from connection_manager import AsyncOracleConnectionManager, AsyncRedshiftConnectionManager, AsyncTableauConnectionManager
+
+class ConcurrencyProbe:
+    """
+    Blocking callable recording how many calls run at the same time.
+    """
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return value
+
+def test_executor_calls_are_bounded_by_max_concurrency(oracle_config):
+    probe = ConcurrencyProbe()
+
+    async def main():
+        async with AsyncOracleConnectionManager(oracle_config, max_concurrency=3) as oracle:
+            return await oracle.gather((probe, (index,)) for index in range(12))
+
+    assert asyncio.run(main()) == list(range(12))
+    assert probe.peak == 3
+
+def test_fetch_all_runs_concurrently_on_pool(redshift_config, redshift_connections):
+    async def main():
+        async with AsyncRedshiftConnectionManager(redshift_config, max_concurrency=4) as redshift:
+            pool = await redshift.create_pool(min_size=0)
+            results = await asyncio.gather(*(redshift.fetch_all("SELECT id, name FROM t") for _ in range(8)))
+            await redshift.close_pool()
+            return pool, results
+
+    pool, results = asyncio.run(main())
+    assert pool.max_size == 4
+    assert results == [[(1, "a"), (2, "b")]] * 8
+    assert 1 <= len(redshift_connections) <= 4
+
+def test_stream_query_yields_batches(redshift_config, redshift_connections):
+    async def main():
+        async with AsyncRedshiftConnectionManager(redshift_config) as redshift:
+            await redshift.create_pool(min_size=0, max_size=1)
+            return [batch async for batch in redshift.stream_query("SELECT id, name FROM t", chunk_size=1)]
+
+    assert asyncio.run(main()) == [[(1, "a")], [(2, "b")]]
+
+def test_stream_query_releases_connection_on_break(redshift_config, redshift_connections):
+    async def main():
+        async with AsyncRedshiftConnectionManager(redshift_config) as redshift:
+            pool = await redshift.create_pool(min_size=0, max_size=1)
+            async for _ in redshift.stream_query("SELECT id, name FROM t", chunk_size=1):
+                break
+            after_break = len(pool._in_use)
+            async with redshift.stream_query("SELECT id, name FROM t", chunk_size=1) as batches:
+                async for _ in batches:
+                    break
+            return after_break, len(pool._in_use)
+
+    assert asyncio.run(main()) == (0, 0)
+
+def test_oracle_stream_query_releases_session_on_break(oracle_config, oracle_result):
+    async def main():
+        async with AsyncOracleConnectionManager(oracle_config) as oracle:
+            pool = await oracle.create_pool(min_size=1, max_size=1)
+            async for _ in oracle.stream_query("SELECT id FROM t", chunk_size=2):
+                break
+            busy = pool._busy
+            await oracle.close_pool()
+            return busy
+
+    assert asyncio.run(main()) == 0
+
+def test_native_pool_keeps_explicit_zero(redshift_config, monkeypatch):
+    created = {}
+
+    async def create_pool(**kwargs):
+        created.update(kwargs)
+        return "pool"
+
+    monkeypatch.setitem(sys.modules, "asyncpg", types.SimpleNamespace(create_pool=create_pool))
+
+    async def main():
+        async with AsyncRedshiftConnectionManager(redshift_config, native=True) as redshift:
+            return await redshift.create_pool(min_size=0, idle_timeout=0)
+
+    assert asyncio.run(main()) == "pool"
+    assert created["min_size"] == 0
+    assert created["max_inactive_connection_lifetime"] == 0
+    assert created["max_size"] == 10
+
+def test_read_hyper_chunks_are_async(tableau_config, tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("tableauhyperapi")
+    hyper_file = str(tmp_path / "data.hyper")
+
+    async def main():
+        async with AsyncTableauConnectionManager(tableau_config) as tableau:
+            await tableau.dataframe_to_local_hyper(pd.DataFrame({"id": [1, 2, 3]}), hyper_file)
+            whole = await tableau.read_hyper(hyper_file)
+            chunks = [chunk["id"].tolist() async for chunk in tableau.read_hyper(hyper_file, chunk_size=2)]
+            return whole["id"].tolist(), chunks
+
+    assert asyncio.run(main()) == ([1, 2, 3], [[1, 2], [3]])
@@ -0,0 +1,85 @@
+import gzip
+import io
+import json
+import re
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("psycopg2")
+pytest.importorskip("boto3")
+
+from connection_manager import AWSConnectionManager, RedshiftConnectionManager
+
+BUCKET = "staging"
+
+@pytest.fixture
+def aws():
+    moto = pytest.importorskip("moto")
+    config = {"aws": {"access_key_id": "test", "secret_access_key": "test", "region_name": "us-east-1"}}
+    with moto.mock_aws():
+        manager = AWSConnectionManager(config)
+        manager.connect_to_s3().create_bucket(Bucket=BUCKET)
+        yield manager
+
+@pytest.fixture
+def redshift(redshift_config, redshift_connections):
+    redshift_config["redshift"]["s3_staging_bucket"] = BUCKET
+    manager = RedshiftConnectionManager(redshift_config)
+    manager.connect()
+    return manager
+
+def read_csv_lines(aws, key):
+    body = aws.s3_client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+    return gzip.decompress(body).decode().splitlines()
+
+def test_stage_writes_manifest_and_partitions(redshift, aws):
+    data = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None]})
+    manifest_url, keys = redshift.stage_dataframe_to_s3(data, aws, rows_per_file=2)
+    manifest_key = manifest_url[len(f"s3://{BUCKET}/"):]
+    assert keys[-1] == manifest_key
+    manifest = json.loads(aws.s3_client.get_object(Bucket=BUCKET, Key=manifest_key)["Body"].read())
+    assert [entry["url"] for entry in manifest["entries"]] == [f"s3://{BUCKET}/{key}" for key in keys[:-1]]
+    lines = [line for key in keys[:-1] for line in read_csv_lines(aws, key)]
+    assert lines == ["1,a", "2,b", "3,\\N"]
+
+def test_stage_writes_nullable_integers_without_fraction(redshift, aws):
+    data = pd.DataFrame({"id": [1, None, 3], "price": [1.5, 2.0, None]})
+    assert data["id"].dtype == "float64"
+    _, keys = redshift.stage_dataframe_to_s3(data, aws)
+    assert read_csv_lines(aws, keys[0]) == ["1,1.5", "\\N,2.0", "3,\\N"]
+
+def test_bulk_load_copies_through_manifest_and_cleans_up(redshift, aws, redshift_connections):
+    connection = redshift_connections[0]
+    data = pd.DataFrame({"id": [1, 2, 3]})
+    assert redshift.bulk_load_dataframe(data, "public.orders", aws_manager=aws, copy_threshold=1) == 3
+    [(statement, _)] = connection.executed
+    assert "COPY " in repr(statement) and "MANIFEST" in repr(statement)
+    assert re.search(r"s3://staging/redshift-staging/[0-9a-f]+/manifest\.json", repr(statement))
+    assert connection.commits == 1
+    assert list(aws.iter_objects(BUCKET)) == []
+
+def test_bulk_load_falls_back_to_inserts_below_threshold(redshift, aws, monkeypatch):
+    inserted = []
+    monkeypatch.setattr(redshift, "insert_dataframe", lambda dataframe, table: inserted.append(table) or len(dataframe))
+    data = pd.DataFrame({"id": [1, 2, 3]})
+    assert redshift.bulk_load_dataframe(data, "orders", aws_manager=aws, copy_threshold=10) == 3
+    assert redshift.bulk_load_dataframe(data, "orders", copy_threshold=1) == 3
+    assert inserted == ["orders", "orders"]
+    assert list(aws.iter_objects(BUCKET)) == []
+
+def test_unload_reads_parquet_and_cleans_up(redshift, aws, redshift_connections):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    def unload(statement):
+        # Stand in for the cluster: write one Parquet file under the UNLOAD target.
+        prefix = re.search(r"s3://staging/(redshift-staging/unload-[0-9a-f]+/)", repr(statement)).group(1)
+        buffer = io.BytesIO()
+        pq.write_table(pa.table({"id": [1, 2]}), buffer)
+        aws.s3_client.put_object(Bucket=BUCKET, Key=f"{prefix}0000_part_00.parquet", Body=buffer.getvalue())
+
+    redshift_connections[0].on_execute = unload
+    table = redshift.unload_to_arrow("SELECT id FROM orders", aws)
+    assert table.column("id").to_pylist() == [1, 2]
+    assert list(aws.iter_objects(BUCKET)) == []
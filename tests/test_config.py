@@ -0,0 +1,165 @@
+import json
+import time
+
+import pytest
+
+from connection_manager.config_manager import ConfigManager
+from connection_manager.secret_store import FileSecretProvider, SecretProvider, SecretResolver, parse_secret_reference
+
+BASE = """
+redshift:
+  host: base-host
+  port: 5439
+  dbname: dev
+  user: etl
+  password: secret://env/TEST_REDSHIFT_PASSWORD
+  pool:
+    max_size: 5
+profiles:
+  prod:
+    redshift:
+      host: prod-host
+      pool:
+        max_size: 20
+"""
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    for name in ("CM_PROFILE", "CM__REDSHIFT__PORT", "CM__REDSHIFT__POOL__MIN_SIZE"):
+        monkeypatch.delenv(name, raising=False)
+    path = tmp_path / "config.yaml"
+    path.write_text(BASE)
+    return path
+
+def test_load_config_returns_independent_copies(config_file):
+    first = ConfigManager.load_config(str(config_file))
+    first["redshift"]["host"] = "changed"
+    assert ConfigManager.load_config(str(config_file))["redshift"]["host"] == "base-host"
+
+def test_load_config_reports_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ConfigManager.load_config(str(tmp_path / "missing.yaml"))
+
+def test_validate_coerces_types():
+    config = ConfigManager.validate_config({"redshift": {"port": "5439", "pool": {"timeout": "2.5"}}, "tableau": {"hyper_telemetry": "off"}})
+    assert config["redshift"]["port"] == 5439
+    assert config["redshift"]["pool"]["timeout"] == 2.5
+    assert config["tableau"]["hyper_telemetry"] is False
+
+def test_validate_lists_every_error():
+    with pytest.raises(ValueError) as error:
+        ConfigManager.validate_config({"redshift": {"port": "abc", "pool": {"min_size": 5, "max_size": 2}}, "oracle": "dsn"})
+    message = str(error.value)
+    assert "redshift.port" in message
+    assert "min_size 5 exceeds max_size 2" in message
+    assert "oracle: expected a section" in message
+
+def test_validate_rejects_negative_numbers():
+    with pytest.raises(ValueError, match="must not be negative"):
+        ConfigManager.validate_config({"oracle": {"pool": {"timeout": -1}}})
+
+def test_unknown_keys_are_kept(caplog):
+    config = ConfigManager.validate_config({"redshift": {"hots": "typo"}})
+    assert config["redshift"]["hots"] == "typo"
+    assert "redshift.hots" in caplog.text
+
+def test_base_settings(config_file):
+    config = ConfigManager(str(config_file)).config
+    assert config.redshift.host == "base-host"
+    assert config["redshift"]["pool"]["max_size"] == 5
+    assert "profiles" not in config
+
+def test_profile_layers_over_base(config_file):
+    config = ConfigManager(str(config_file), profile="prod").config
+    assert config.redshift.host == "prod-host"
+    assert config.redshift.pool.max_size == 20
+    assert config.redshift.dbname == "dev"
+
+def test_profile_from_environment(config_file, monkeypatch):
+    monkeypatch.setenv("CM_PROFILE", "prod")
+    assert ConfigManager(str(config_file)).config.redshift.host == "prod-host"
+
+def test_unknown_profile(config_file):
+    with pytest.raises(ValueError, match="Profile 'staging' is not defined"):
+        ConfigManager(str(config_file), profile="staging")
+
+def test_environment_overrides_win(config_file, monkeypatch):
+    monkeypatch.setenv("CM__REDSHIFT__PORT", "5440")
+    monkeypatch.setenv("CM__REDSHIFT__POOL__MIN_SIZE", "2")
+    config = ConfigManager(str(config_file), profile="prod").config
+    assert config.redshift.port == 5440
+    assert config.redshift.pool.min_size == 2
+    assert config.redshift.pool.max_size == 20
+
+def test_invalid_environment_override(config_file, monkeypatch):
+    monkeypatch.setenv("CM__REDSHIFT__PORT", "not-a-port")
+    with pytest.raises(ValueError, match="redshift.port"):
+        ConfigManager(str(config_file))
+
+def test_secrets_resolved_on_read(config_file, monkeypatch):
+    config = ConfigManager(str(config_file)).config
+    monkeypatch.setenv("TEST_REDSHIFT_PASSWORD", "hunter2")
+    assert config.redshift.password == "hunter2"
+    assert config.to_dict()["redshift"]["password"] == "secret://env/TEST_REDSHIFT_PASSWORD"
+    assert "hunter2" not in repr(config)
+
+def test_missing_secret(config_file, monkeypatch):
+    monkeypatch.delenv("TEST_REDSHIFT_PASSWORD", raising=False)
+    with pytest.raises(ValueError, match="redshift.password"):
+        ConfigManager(str(config_file)).config.redshift.password
+
+def test_reload_picks_up_changes(config_file):
+    manager = ConfigManager(str(config_file))
+    section = manager.config.redshift
+    assert manager.reload() is False
+    time.sleep(0.01)
+    config_file.write_text(BASE.replace("base-host", "new-host") + "\n")
+    assert manager.reload() is True
+    assert section.host == "new-host"
+
+def test_failed_reload_keeps_previous_config(config_file):
+    manager = ConfigManager(str(config_file))
+    config_file.write_text("redshift:\n  port: abc\n")
+    with pytest.raises(ValueError):
+        manager.reload()
+    assert manager.config.redshift.host == "base-host"
+    assert manager.reload() is False
+
+def test_json_config(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"oracle": {"dsn": "db:1521/ORCL", "statement_cache_size": "20"}}))
+    assert ConfigManager(str(path)).config.oracle.statement_cache_size == 20
+
+def test_parse_secret_reference():
+    assert parse_secret_reference("secret://vault/db/password") == ("vault", "db/password")
+    assert parse_secret_reference("plain") is None
+    with pytest.raises(ValueError):
+        parse_secret_reference("secret://vault")
+
+def test_file_secret_provider(tmp_path):
+    (tmp_path / "db_password").write_text("s3cret\n")
+    provider = FileSecretProvider(str(tmp_path))
+    assert provider.get_secret("db_password") == "s3cret"
+    with pytest.raises(KeyError):
+        provider.get_secret("../outside")
+    with pytest.raises(KeyError):
+        provider.get_secret("missing")
+
+def test_resolver_memoizes():
+    class Counting(SecretProvider):
+        calls = 0
+
+        def get_secret(self, name):
+            Counting.calls += 1
+            return name.upper()
+
+    resolver = SecretResolver({"count": Counting()})
+    assert resolver.resolve("count", "a") == resolver.resolve("count", "a") == "A"
+    assert Counting.calls == 1
+    resolver.clear()
+    resolver.resolve("count", "a")
+    assert Counting.calls == 2
+
+def test_secret_provider_is_abstract():
+    with pytest.raises(TypeError):
+        SecretProvider()
@@ -0,0 +1,86 @@
+import cx_Oracle
+import pytest
+
+class Batches:
+    """
+    Stand-in for executemany / execute_values / execute_batch that records batch sizes and
+    fails on the batch numbered ``fail_at``.
+    """
+    def __init__(self, fail_at=None, error=cx_Oracle.DatabaseError):
+        self.sizes = []
+        self.fail_at = fail_at
+        self.error = error
+
+    def __call__(self, cursor, query, batch, **kwargs):
+        if len(self.sizes) == self.fail_at:
+            raise self.error("duplicate key value violates unique constraint")
+        self.sizes.append(len(batch))
+
+@pytest.fixture
+def oracle(oracle_config, monkeypatch):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    connection = manager.connect()
+    connection.commits = connection.rollbacks = 0
+    monkeypatch.setattr(connection, "commit", lambda: setattr(connection, "commits", connection.commits + 1), raising=False)
+    monkeypatch.setattr(connection, "rollback", lambda: setattr(connection, "rollbacks", connection.rollbacks + 1), raising=False)
+    return manager
+
+def patch_executemany(monkeypatch, batches):
+    def executemany(cursor, query, batch):
+        batches(cursor, query, batch)
+        cursor.rowcount = len(batch)
+
+    monkeypatch.setattr(cx_Oracle.Cursor, "executemany", executemany)
+
+def test_oracle_sends_batches(oracle, monkeypatch):
+    batches = Batches()
+    patch_executemany(monkeypatch, batches)
+    assert oracle.execute_many("INSERT INTO t VALUES (:1)", ((i,) for i in range(25)), batch_size=10) == 25
+    assert batches.sizes == [10, 10, 5]
+    assert oracle.connection.commits == 1
+
+def test_oracle_rolls_back_failed_batches(oracle, monkeypatch):
+    patch_executemany(monkeypatch, Batches(fail_at=1))
+    with pytest.raises(cx_Oracle.DatabaseError):
+        oracle.execute_many("INSERT INTO t VALUES (:1)", [(i,) for i in range(25)], batch_size=10)
+    assert (oracle.connection.commits, oracle.connection.rollbacks) == (0, 1)
+
+def test_oracle_leaves_transaction_to_caller_without_commit(oracle, monkeypatch):
+    patch_executemany(monkeypatch, Batches(fail_at=0))
+    with pytest.raises(cx_Oracle.DatabaseError):
+        oracle.execute_many("INSERT INTO t VALUES (:1)", [(1,)], commit=False)
+    assert oracle.connection.rollbacks == 0
+
+@pytest.fixture
+def redshift(redshift_config, redshift_connections):
+    from connection_manager import RedshiftConnectionManager
+
+    manager = RedshiftConnectionManager(redshift_config)
+    manager.connect()
+    return manager
+
+@pytest.mark.parametrize("query, helper", [
+    ("INSERT INTO t (a) VALUES %s", "execute_values"),
+    ("UPDATE t SET a = %s WHERE id = %s", "execute_batch"),
+])
+def test_redshift_picks_batch_helper(redshift, monkeypatch, query, helper):
+    import psycopg2.extras
+
+    batches, other = Batches(), Batches()
+    monkeypatch.setattr(psycopg2.extras, helper, batches)
+    monkeypatch.setattr(psycopg2.extras, "execute_batch" if helper == "execute_values" else "execute_values", other)
+    assert redshift.execute_many(query, [(i, i) for i in range(5)], batch_size=2) == 5
+    assert batches.sizes == [2, 2, 1]
+    assert other.sizes == []
+    assert redshift.connection.commits == 1
+
+def test_redshift_rolls_back_failed_batches(redshift, monkeypatch):
+    import psycopg2
+    import psycopg2.extras
+
+    monkeypatch.setattr(psycopg2.extras, "execute_values", Batches(fail_at=1, error=psycopg2.IntegrityError))
+    with pytest.raises(psycopg2.IntegrityError):
+        redshift.execute_many("INSERT INTO t (a) VALUES %s", [(i,) for i in range(5)], batch_size=2)
+    assert (redshift.connection.commits, redshift.connection.rollbacks) == (0, 1)
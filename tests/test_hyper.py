@@ -0,0 +1,167 @@
+import datetime
+import decimal
+import threading
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+pytest.importorskip("tableauhyperapi")
+
+from connection_manager import TableauConnectionManager
+
+METHODS = ["copy", "insert"]
+
+@pytest.fixture(scope="module")
+def manager(tableau_config):
+    manager = TableauConnectionManager(tableau_config)
+    yield manager
+    manager.close()
+
+def round_trip(manager, tmp_path, data, method):
+    hyper_file = str(tmp_path / "data.hyper")
+    manager.dataframe_to_local_hyper(data, hyper_file, method=method)
+    return manager.read_hyper(hyper_file)
+
+@pytest.mark.parametrize("method", METHODS)
+def test_object_decimals(manager, tmp_path, method):
+    data = pd.DataFrame({"amount": [decimal.Decimal("1.50"), None, decimal.Decimal("22.125")]})
+    result = round_trip(manager, tmp_path, data, method)
+    assert result["amount"].tolist()[::2] == [1.5, 22.125]
+    assert result["amount"].isna().tolist() == [False, True, False]
+
+@pytest.mark.parametrize("method", METHODS)
+def test_object_integers(manager, tmp_path, method):
+    data = pd.DataFrame({"id": pd.Series([1, None, 3], dtype=object)})
+    result = round_trip(manager, tmp_path, data, method)
+    assert str(result["id"].dtype) == "Int64"
+    assert result["id"].tolist() == [1, pd.NA, 3]
+
+@pytest.mark.parametrize("method", METHODS)
+def test_mixed_objects_become_text(manager, tmp_path, method):
+    data = pd.DataFrame({"value": pd.Series([1, "x", 2.5, None], dtype=object)})
+    result = round_trip(manager, tmp_path, data, method)
+    assert result["value"].tolist() == ["1", "x", "2.5", None]
+
+@pytest.mark.parametrize("method", METHODS)
+def test_unsigned_integers(manager, tmp_path, method):
+    data = pd.DataFrame({"count": np.array([1, 2, 2 ** 40], dtype="uint64")})
+    result = round_trip(manager, tmp_path, data, method)
+    assert result["count"].tolist() == [1, 2, 2 ** 40]
+
+@pytest.mark.parametrize("method", METHODS)
+def test_object_dates(manager, tmp_path, method):
+    data = pd.DataFrame({"day": [datetime.date(2024, 1, 1), None]})
+    result = round_trip(manager, tmp_path, data, method)
+    assert result["day"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert pd.isna(result["day"].iloc[1])
+
+@pytest.mark.parametrize("method", METHODS)
+def test_later_chunks_may_have_missing_values(manager, tmp_path, method):
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "flag": [True, False]}),
+        pd.DataFrame({"id": [np.nan, 4.0], "flag": [None, True]}),
+    ]
+    result = round_trip(manager, tmp_path, iter(chunks), method)
+    assert result["id"].tolist() == [1, 2, pd.NA, 4]
+    assert result["flag"].tolist() == [True, False, pd.NA, True]
+
+def test_object_types_come_from_a_bounded_sample(monkeypatch):
+    import pyarrow as pa
+    from connection_manager import tableau_connection
+
+    converted = []
+    array = pa.array
+
+    def recording_array(values, *args, **kwargs):
+        converted.append(len(values))
+        return array(values, *args, **kwargs)
+
+    monkeypatch.setattr(pa, "array", recording_array)
+    values = pd.Series([None] * 10 + [decimal.Decimal("1.5")] * 5000, dtype=object)
+    definition = TableauConnectionManager.infer_table_definition(pd.DataFrame({"amount": values}))
+    assert str(definition.columns[0].type).startswith("NUMERIC")
+    assert max(converted) == tableau_connection._TYPE_SAMPLE_SIZE
+
+def test_single_dataframe_keeps_not_null_columns():
+    from tableauhyperapi import NOT_NULLABLE, NULLABLE
+
+    data = pd.DataFrame({"id": [1, 2], "name": ["a", None]})
+    definition = TableauConnectionManager.infer_table_definition(data)
+    assert [column.nullability for column in definition.columns] == [NOT_NULLABLE, NULLABLE]
+    definition = TableauConnectionManager.infer_table_definition(data, nullable=True)
+    assert [column.nullability for column in definition.columns] == [NULLABLE, NULLABLE]
+
+def test_parquet_read_matches_fetch_dtypes(manager, tmp_path):
+    data = pd.DataFrame({
+        "id": pd.array([1, None, 3], dtype="Int64"),
+        "price": [1.5, None, 2.0],
+        "flag": pd.array([True, None, False], dtype="boolean"),
+        "name": ["a", None, "c"],
+        "day": [datetime.date(2024, 1, 1), None, datetime.date(2024, 1, 3)],
+        "at": pd.to_datetime(["2024-01-01 10:00", None, "2024-01-02 00:00"]),
+        "at_utc": pd.to_datetime(["2024-01-01 10:00", None, "2024-01-02 00:00"]).tz_localize("UTC"),
+        "amount": [decimal.Decimal("1.25"), None, decimal.Decimal("2.5")],
+    })
+    hyper_file = str(tmp_path / "data.hyper")
+    manager.dataframe_to_local_hyper(data, hyper_file)
+    fetched = manager.read_hyper(hyper_file)
+    pd.testing.assert_frame_equal(manager.read_hyper(hyper_file, method="parquet"), fetched)
+    chunks = manager.read_hyper(hyper_file, method="parquet", chunk_size=2)
+    pd.testing.assert_frame_equal(pd.concat(list(chunks), ignore_index=True), fetched)
+
+@pytest.mark.parametrize("method", METHODS)
+def test_wide_decimals_load_as_double(manager, tmp_path, method):
+    pa = pytest.importorskip("pyarrow")
+
+    wide = decimal.Decimal("12345678901234567890.1234")
+    data = pd.DataFrame({
+        "arrow": pd.array([wide, None], dtype=pd.ArrowDtype(pa.decimal128(38, 4))),
+        "objects": [wide, decimal.Decimal("1")],
+    })
+    result = round_trip(manager, tmp_path, data, method)
+    assert result["arrow"].dtype == "float64"
+    assert result["arrow"].iloc[0] == pytest.approx(float(wide))
+    assert result["objects"].tolist() == pytest.approx([float(wide), 1.0])
+
+def run_with_timeout(func, timeout=30):
+    errors = []
+
+    def target():
+        try:
+            func()
+        except Exception as e:  # surfaced in the calling thread
+            errors.append(e)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "deadlocked"
+    if errors:
+        raise errors[0]
+
+def test_nested_reads_of_one_file(manager, tmp_path):
+    hyper_file = str(tmp_path / "data.hyper")
+    manager.dataframe_to_local_hyper(pd.DataFrame({"id": range(10)}), hyper_file)
+
+    def read():
+        chunks = manager.read_hyper(hyper_file, chunk_size=3)
+        first = next(chunks)
+        assert len(manager.read_hyper(hyper_file)) == 10
+        assert len(first) + sum(len(chunk) for chunk in chunks) == 10
+
+    run_with_timeout(read)
+
+def test_release_while_iterating(manager, tmp_path):
+    hyper_file = str(tmp_path / "data.hyper")
+    manager.dataframe_to_local_hyper(pd.DataFrame({"id": range(10)}), hyper_file)
+
+    def read():
+        chunks = manager.read_hyper(hyper_file, chunk_size=3)
+        next(chunks)
+        manager.release_hyper_file(hyper_file)
+        assert sum(len(chunk) for chunk in chunks) == 7
+        manager.dataframe_to_local_hyper(pd.DataFrame({"id": range(4)}), hyper_file)
+        assert len(manager.read_hyper(hyper_file)) == 4
+
+    run_with_timeout(read)
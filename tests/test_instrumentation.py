@@ -0,0 +1,128 @@
+import logging
+import sys
+
+import pytest
+
+from connection_manager import instrumentation
+from connection_manager.instrumentation import (
+    Event,
+    MetricsCollector,
+    OpenTelemetryExporter,
+    PrometheusExporter,
+    SlowQueryLogger,
+    add_listener,
+    instrument,
+    remove_listener,
+)
+
+def make_event(component="redshift", operation="execute", duration=0.01, error=None, **attributes):
+    return Event(component, operation, 0.0, duration, attributes, error)
+
+@pytest.fixture
+def events():
+    received = []
+    add_listener(received.append)
+    yield received
+    remove_listener(received.append)
+
+@pytest.fixture
+def redshift(redshift_config, redshift_connections):
+    from connection_manager import RedshiftConnectionManager
+
+    manager = RedshiftConnectionManager(redshift_config)
+    manager.connect()
+    return manager
+
+def test_no_listeners_means_no_events():
+    with instrument("redshift", "execute", statement="SELECT 1") as attributes:
+        attributes["rows"] = 1
+    assert instrumentation._listeners == []
+
+def test_manager_calls_emit_events(redshift, events):
+    assert redshift.fetch_all("SELECT id, name FROM t") == [(1, "a"), (2, "b")]
+    assert [(event.component, event.operation) for event in events] == [("redshift", "execute"), ("redshift", "fetch")]
+    assert events[0].attributes["statement"] == "SELECT id, name FROM t"
+    assert events[1].attributes["rows"] == 2
+    assert all(event.error is None and event.duration >= 0 for event in events)
+
+def test_failed_call_emits_event_with_error(redshift, events, redshift_connections):
+    redshift_connections[0].fail_on = "missing"
+    with pytest.raises(RuntimeError):
+        redshift.fetch_all("SELECT * FROM missing")
+    assert isinstance(events[-1].error, RuntimeError)
+
+def test_oracle_pool_checkout_is_instrumented(events, oracle_config, oracle_result):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    manager.create_pool(min_size=1, max_size=1)
+    manager.fetch_all("SELECT id FROM t")
+    manager.close_pool()
+    operations = [(event.component, event.operation) for event in events]
+    assert ("oracle", "checkout") in operations
+    assert ("oracle", "fetch") in operations
+
+def test_failing_listener_does_not_break_queries(redshift, events, caplog):
+    def broken(event):
+        raise ValueError("listener bug")
+
+    add_listener(broken)
+    try:
+        with caplog.at_level(logging.ERROR, logger="connection_manager.instrumentation"):
+            assert redshift.fetch_all("SELECT id, name FROM t") == [(1, "a"), (2, "b")]
+    finally:
+        remove_listener(broken)
+    assert len(events) == 2
+    assert "listener" in caplog.text and "failed" in caplog.text
+
+def test_metrics_collector_aggregates_per_operation():
+    collector = MetricsCollector(buckets=(0.01, 0.1, 1.0))
+    for duration in (0.005, 0.05, 0.05, 0.5):
+        collector(make_event(duration=duration, rows=10))
+    collector(make_event(operation="fetch", duration=0.2, error=RuntimeError("lost")))
+    stats = collector.snapshot()
+    execute = stats["redshift.execute"]
+    assert execute["count"] == 4 and execute["errors"] == 0
+    assert execute["rows"] == 40
+    assert execute["min"] == 0.005 and execute["max"] == 0.5
+    assert execute["buckets"] == {0.01: 1, 0.1: 2, 1.0: 1, float("inf"): 0}
+    assert 0.01 <= execute["p50"] <= 0.1
+    assert 0.1 <= execute["p99"] <= 0.5
+    assert stats["redshift.fetch"]["errors"] == 1
+    assert collector.report().splitlines()[1].startswith("redshift.execute")
+    collector.reset()
+    assert collector.snapshot() == {}
+
+def test_slow_query_logger_threshold(caplog):
+    slow = SlowQueryLogger(threshold=1.0, thresholds={"redshift.execute": 5.0, "s3": 0.1}, max_statement_length=20)
+    with caplog.at_level(logging.WARNING, logger="connection_manager.slow_query"):
+        slow(make_event(duration=2.0, statement="SELECT 1"))
+        slow(make_event(component="oracle", duration=0.5, statement="SELECT 1"))
+        slow(make_event(component="s3", operation="upload", duration=0.2, bytes=10))
+        slow(make_event(duration=6.0, statement="SELECT *\n  FROM a_table_with_a_long_name"))
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert messages[0].startswith("Slow s3.upload took 0.200s (threshold 0.100s)")
+    assert messages[1].endswith(": SELECT * FROM a_tabl")
+
+def test_exporters_are_no_ops_without_their_packages(monkeypatch, caplog):
+    for module in ("opentelemetry", "prometheus_client"):
+        monkeypatch.setitem(sys.modules, module, None)
+    with caplog.at_level(logging.WARNING, logger="connection_manager.instrumentation"):
+        exporters = [OpenTelemetryExporter(), PrometheusExporter()]
+    assert len(caplog.records) == 2
+    for exporter in exporters:
+        assert not exporter.enabled
+        exporter(make_event(rows=1))
+
+def test_prometheus_exporter_records_events():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    exporter = PrometheusExporter(registry=registry)
+    exporter(make_event(rows=5, bytes=100))
+    exporter(make_event(error=RuntimeError("failed")))
+    labels = {"component": "redshift", "operation": "execute", "status": "ok"}
+    assert registry.get_sample_value("connection_manager_operation_duration_seconds_count", labels) == 1
+    assert registry.get_sample_value("connection_manager_rows_total", labels) == 5
+    assert registry.get_sample_value("connection_manager_bytes_total", labels) == 100
+    assert registry.get_sample_value("connection_manager_operation_duration_seconds_count", dict(labels, status="error")) == 1
@@ -0,0 +1,72 @@
+"""
+Import behaviour checked in fresh interpreters, since this test session has already loaded the drivers.
+"""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "tableauserverclient", "tableauhyperapi", "cx_Oracle", "boto3", "botocore", "psycopg2")
+
+def run(code: str) -> dict:
+    # Run outside the repository so only the package (not the tests directory) is importable.
+    output = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        env=dict(os.environ, PYTHONPATH=PACKAGE_ROOT), cwd=os.path.dirname(PACKAGE_ROOT),
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+def loaded_after(statement: str) -> list:
+    return run(f"""
+        import json, sys
+        {statement}
+        print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))
+    """)
+
+def test_package_import_loads_no_driver():
+    assert loaded_after("import connection_manager") == []
+
+@pytest.mark.parametrize("name", [
+    "AWSConnectionManager", "OracleConnectionManager", "RedshiftConnectionManager", "TableauConnectionManager",
+    "AsyncRedshiftConnectionManager", "ConfigManager", "MetricsCollector",
+])
+def test_manager_access_loads_no_driver(name):
+    assert loaded_after(f"from connection_manager import {name}") == []
+
+@pytest.mark.parametrize("module, driver, extra", [
+    ("redshift_connection", "psycopg2", "redshift"),
+    ("oracle_connection", "cx_Oracle", "oracle"),
+    ("aws_connection", "boto3", "aws"),
+    ("tableau_connection", "hyperapi", "tableau"),
+])
+def test_missing_driver_names_its_extra(module, driver, extra):
+    result = run(f"""
+        import json, sys
+        for name in {HEAVY_MODULES!r}:
+            sys.modules[name] = None  # makes "import name" fail as if it were not installed
+        from connection_manager import {module}
+        try:
+            getattr({module}.{driver}, "anything")
+        except ImportError as e:
+            print(json.dumps(str(e)))
+        else:
+            print(json.dumps(None))
+    """)
+    assert result is not None and result.endswith(f"pip install connection_manager[{extra}]")
+
+def test_unknown_attribute_raises_attribute_error():
+    result = run("""
+        import json
+        import connection_manager
+        try:
+            connection_manager.NoSuchManager
+        except AttributeError as e:
+            print(json.dumps(str(e)))
+    """)
+    assert result == "module 'connection_manager' has no attribute 'NoSuchManager'"
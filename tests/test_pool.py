@@ -0,0 +1,155 @@
+import threading
+
+import cx_Oracle
+import pytest
+
+from connection_manager.pool import ConnectionPool, PoolTimeoutError
+
+from fakes import FakeConnection
+
+def make_pool(**kwargs):
+    opened = []
+
+    def factory():
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    kwargs.setdefault("timeout", 0.1)
+    return ConnectionPool(factory, **kwargs), opened
+
+def test_reuses_released_connections():
+    pool, opened = make_pool(min_size=1, max_size=2)
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    assert len(opened) == 1
+
+def test_times_out_when_exhausted():
+    pool, _ = make_pool(min_size=0, max_size=1)
+    pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+def test_waiting_checkout_gets_released_connection():
+    pool, _ = make_pool(min_size=0, max_size=1, timeout=5)
+    connection = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(connection,)).start()
+    assert pool.acquire() is connection
+
+def test_rejects_foreign_connection():
+    pool, _ = make_pool()
+    with pytest.raises(ValueError):
+        pool.release(FakeConnection())
+
+def test_discard_closes_connection():
+    pool, _ = make_pool(min_size=0, max_size=1)
+    connection = pool.acquire()
+    pool.release(connection, discard=True)
+    assert connection.closed
+    assert pool.size == 0
+
+def test_reset_runs_on_release():
+    pool, _ = make_pool(reset=lambda connection: connection.rollback())
+    with pool.connection() as connection:
+        pass
+    assert connection.rollbacks == 1
+
+def test_expired_connection_is_replaced():
+    pool, _ = make_pool(min_size=0, max_size=1, max_lifetime=0)
+    connection = pool.acquire()
+    pool.release(connection)
+    assert connection.closed
+    assert pool.acquire() is not connection
+
+def test_recently_used_connection_is_not_health_checked():
+    checked = []
+    pool, _ = make_pool(min_size=1, max_size=1, health_check=checked.append, health_check_interval=60)
+    with pool.connection():
+        pass
+    with pool.connection():
+        pass
+    assert checked == []
+
+def test_unhealthy_connection_is_replaced():
+    pool, opened = make_pool(min_size=1, max_size=1, health_check=lambda connection: not connection.closed, health_check_interval=0)
+    opened[0].closed = 1
+    assert pool.acquire() is not opened[0]
+    assert pool.size == 1
+
+def test_connection_discarded_after_failure_when_unhealthy():
+    pool, _ = make_pool(min_size=0, max_size=1, health_check=lambda connection: not connection.closed)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as connection:
+            connection.closed = 1
+            raise RuntimeError("lost connection")
+    assert pool.size == 0
+
+def test_connection_kept_after_failed_statement(redshift_config, redshift_connections):
+    from connection_manager import RedshiftConnectionManager
+
+    manager = RedshiftConnectionManager(redshift_config)
+    pool = manager.create_pool(min_size=1, max_size=1, health_check_interval=0)
+    redshift_connections[0].fail_on = "missing"
+    with pytest.raises(RuntimeError):
+        manager.fetch_all("SELECT * FROM missing")
+    assert pool.size == 1
+    assert manager.fetch_all("SELECT id, name FROM t") == [(1, "a"), (2, "b")]
+    assert len(redshift_connections) == 1
+
+def test_connection_returned_when_generator_closed_early():
+    pool, _ = make_pool(min_size=0, max_size=1)
+
+    def rows():
+        with pool.connection():
+            yield 1
+            yield 2
+
+    for _ in rows():
+        break
+    with pool.connection() as connection:
+        assert connection is not None
+
+def test_redshift_stream_query_releases_connection_on_break(redshift_config, redshift_connections):
+    from connection_manager import RedshiftConnectionManager
+
+    manager = RedshiftConnectionManager(redshift_config)
+    manager.create_pool(min_size=0, max_size=1, timeout=0.1)
+    for _ in manager.stream_query("SELECT id, name FROM t", chunk_size=1):
+        break
+    with manager.acquire() as connection:
+        assert connection is redshift_connections[0]
+
+def test_oracle_stream_query_releases_session_on_break(oracle_config, oracle_result):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    pool = manager.create_pool(min_size=1, max_size=1)
+    for _ in manager.stream_query("SELECT id FROM t", chunk_size=2):
+        break
+    assert pool._busy == 0
+    with manager.acquire() as connection:
+        assert connection is not None
+    manager.close_pool()
+
+def test_oracle_pool_pings_idle_sessions(oracle_config):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    pool = manager.create_pool(health_check_interval=15)
+    assert pool.ping_interval == 15
+
+@pytest.mark.parametrize("message, dropped", [
+    ("ORA-03113: end-of-file on communication channel", True),
+    ("DPI-1080: connection was closed by ORA-3113", True),
+    ("ORA-00942: table or view does not exist", False),
+])
+def test_oracle_drops_session_only_after_disconnect(oracle_config, message, dropped):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config)
+    pool = manager.create_pool(min_size=1, max_size=1)
+    with pytest.raises(cx_Oracle.DatabaseError):
+        with manager.acquire() as connection:
+            raise cx_Oracle.DatabaseError(message)
+    assert (connection not in pool._idle) is dropped
+    assert pool._busy == 0
@@ -0,0 +1,110 @@
+import datetime
+import decimal
+import time
+
+import pytest
+
+from connection_manager.query_cache import QueryCache
+
+ROWS = [(1, "a"), (2, "b")]
+
+def test_normalize_keeps_literals():
+    assert QueryCache.normalize_query("SELECT  *\n FROM t WHERE name = 'a  b' ;") == "SELECT * FROM t WHERE name = 'a  b'"
+
+def test_key_covers_params():
+    key = QueryCache.make_key("SELECT * FROM t WHERE id = :id", {"id": 1, "name": "x"})
+    assert key == QueryCache.make_key("SELECT *  FROM t WHERE id = :id", {"name": "x", "id": 1})
+    assert key != QueryCache.make_key("SELECT * FROM t WHERE id = :id", {"id": 2, "name": "x"})
+
+def test_table_tags():
+    assert QueryCache.table_tags("SELECT * FROM sales.orders o JOIN Customers c ON o.id = c.id") == {"sales.orders", "orders", "customers"}
+
+def test_hit_and_miss():
+    cache = QueryCache()
+    assert cache.get("key") is None
+    cache.put("key", ["id", "name"], ROWS)
+    columns, rows = cache.get("key")
+    assert columns == ["id", "name"]
+    assert list(rows) == ROWS
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+def test_entries_expire():
+    cache = QueryCache()
+    cache.put("key", ["id"], [(1,)], ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache()
+    cache.put("a", ["id"], [(1,)])
+    cache.put("b", ["id"], [(2,)])
+    cache.get("a")
+    cache.max_bytes = cache.stats()["memory_bytes"]
+    cache.put("c", ["id"], [(3,)])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_invalidate_by_table():
+    cache = QueryCache()
+    cache.put("orders", ["id"], [(1,)], tags=QueryCache.table_tags("SELECT * FROM sales.orders"))
+    cache.put("customers", ["id"], [(1,)], tags=QueryCache.table_tags("SELECT * FROM customers"))
+    assert cache.invalidate("ORDERS") == 1
+    assert cache.get("orders") is None
+    assert cache.get("customers") is not None
+
+@pytest.mark.parametrize("rows", [ROWS, [(1, {"nested": True})]])
+def test_large_results_spill_to_disk(tmp_path, rows):
+    cache = QueryCache(spill_dir=str(tmp_path), spill_threshold=0)
+    cache.put("key", ["id", "value"], rows)
+    assert cache.stats()["spills"] == 1
+    assert list(cache.get("key")[1]) == rows
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+@pytest.mark.parametrize("rows", [
+    [(1, 1.5), (None, None), (3, 2.0)],
+    [(1, 1.5), (2.5, 2)],
+    [(decimal.Decimal("1.5"), datetime.date(2024, 1, 1)), (decimal.Decimal("12.25"), None)],
+    [(datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=2))), None), (None, None)],
+    [(True, b"x"), (False, None)],
+])
+def test_spilled_hit_matches_miss(tmp_path, rows):
+    pytest.importorskip("pyarrow")
+    cache = QueryCache(spill_dir=str(tmp_path), spill_threshold=0)
+    cache.put("key", ["a", "b"], rows)
+    cached = list(cache.get("key")[1])
+    assert cached == rows
+    assert [[type(value) for value in row] for row in cached] == [[type(value) for value in row] for row in rows]
+    assert [[str(value) for value in row] for row in cached] == [[str(value) for value in row] for row in rows]
+
+def test_uniform_columns_spill_to_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    cache = QueryCache(spill_dir=str(tmp_path), spill_threshold=0)
+    cache.put("key", ["id", "name"], [(1, "a"), (None, None)])
+    assert [path.suffix for path in tmp_path.iterdir()] == [".parquet"]
+
+def test_cached_rows_are_not_aliased():
+    cache = QueryCache()
+    rows = list(ROWS)
+    cache.put("key", ["id", "name"], rows)
+    rows.append((3, "c"))
+    assert list(cache.get("key")[1]) == ROWS
+
+def test_from_config():
+    assert QueryCache.from_config(None) is None
+    assert QueryCache.from_config({"enabled": False}) is None
+    assert QueryCache.from_config({"default_ttl": 5}).default_ttl == 5
+
+def test_fetch_all_result_can_be_mutated(oracle_config, oracle_result):
+    from connection_manager import OracleConnectionManager
+
+    manager = OracleConnectionManager(oracle_config, cache=QueryCache())
+    manager.connect()
+    first = manager.fetch_all("SELECT id FROM t")
+    first.clear()
+    assert len(manager.fetch_all("SELECT id FROM t")) == 10
+    manager.fetch_all("SELECT id FROM t").clear()
+    assert len(manager.fetch_all("SELECT id FROM t")) == 10
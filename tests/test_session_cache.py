@@ -0,0 +1,59 @@
+import os
+import stat
+import time
+
+import pytest
+
+from connection_manager.session_cache import FileSessionCache, SessionCache
+
+def session(ttl=60):
+    return {"auth_token": "token", "expires_at": time.time() + ttl}
+
+def test_round_trip(tmp_path):
+    cache = FileSessionCache(str(tmp_path / "sessions.json"))
+    cache.set("key", session())
+    assert cache.get("key")["auth_token"] == "token"
+    assert FileSessionCache(cache.path).get("key")["auth_token"] == "token"
+
+def test_delete(tmp_path):
+    cache = FileSessionCache(str(tmp_path / "sessions.json"))
+    cache.set("key", session())
+    cache.delete("key")
+    cache.delete("missing")
+    assert cache.get("key") is None
+
+def test_expired_sessions_are_dropped(tmp_path):
+    cache = FileSessionCache(str(tmp_path / "sessions.json"))
+    cache.set("old", session(ttl=-1))
+    cache.set("new", session())
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+def test_file_is_private(tmp_path):
+    cache = FileSessionCache(str(tmp_path / "sessions.json"))
+    cache.set("key", session())
+    assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "sessions.json"
+    path.write_text("{not json")
+    cache = FileSessionCache(str(path))
+    assert cache.get("key") is None
+    cache.set("key", session())
+    assert cache.get("key") is not None
+
+def test_key_hides_identity():
+    key = SessionCache.make_key("https://tableau.example.com", "site", "token-name")
+    assert "token-name" not in key
+    assert key == SessionCache.make_key("https://tableau.example.com", "site", "token-name")
+
+def test_interface_is_abstract():
+    with pytest.raises(TypeError):
+        SessionCache()
+
+    class Partial(SessionCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
@@ -0,0 +1,154 @@
+import pytest
+
+pytest.importorskip("tableauserverclient")
+
+from connection_manager import TableauConnectionManager
+
+class ServerError(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+class FlakyCall:
+    """
+    Fails with the given error codes, one per call, then returns "ok".
+    """
+    def __init__(self, *codes):
+        self.codes = list(codes)
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.codes:
+            raise ServerError(self.codes.pop(0))
+        return "ok"
+
+class FakeDatasources:
+    def __init__(self, publish):
+        self.publish = publish
+
+class FakeServer:
+    def __init__(self, publish=None, download=None):
+        self.auth_token = "token"
+        self.datasources = FakeDatasources(publish)
+        self.datasources.download = download
+
+    def is_signed_in(self):
+        return True
+
+@pytest.fixture
+def manager(tableau_config):
+    manager = TableauConnectionManager({"tableau": dict(tableau_config["tableau"], max_retries=2)})
+    manager.server = FakeServer()
+    return manager
+
+def test_call_retries_transient_errors(manager, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    func = FlakyCall("503", "429")
+    assert manager.call(func) == "ok"
+    assert func.calls == 3
+
+def test_call_gives_up_after_max_retries(manager, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    func = FlakyCall("503", "503", "503")
+    with pytest.raises(ServerError):
+        manager.call(func)
+    assert func.calls == 3
+
+def test_call_does_not_retry_client_errors(manager):
+    func = FlakyCall("404")
+    with pytest.raises(ServerError):
+        manager.call(func)
+    assert func.calls == 1
+
+def test_call_once_does_not_retry(manager):
+    func = FlakyCall("503")
+    with pytest.raises(ServerError):
+        manager.call_once(func)
+    assert func.calls == 1
+
+def test_bulk_publish_does_not_retry(manager):
+    publish = FlakyCall("503")
+    manager.server = FakeServer(publish)
+    results = manager.bulk_publish("datasources", [("item", "data.hyper")], mode="Append")
+    assert publish.calls == 1
+    assert isinstance(results[0].error, ServerError)
+
+class FakeRefreshes:
+    def __init__(self, refresh):
+        self.refresh = refresh
+
+def test_bulk_refresh_does_not_resubmit_after_ambiguous_failures(manager, monkeypatch):
+    import requests
+
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    refresh = FlakyCall("503")
+    manager.server.datasources = FakeRefreshes(refresh)
+    results = manager.bulk_refresh("datasources", ["id"])
+    assert refresh.calls == 1
+    assert isinstance(results[0].error, ServerError)
+
+    def timeout(item):
+        timeout.calls += 1
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    timeout.calls = 0
+    manager.server.datasources = FakeRefreshes(timeout)
+    results = manager.bulk_refresh("datasources", ["id"])
+    assert timeout.calls == 1
+    assert isinstance(results[0].error, requests.exceptions.ReadTimeout)
+
+def test_bulk_refresh_retries_requests_that_were_not_sent(manager, monkeypatch):
+    import requests
+    import urllib3
+
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    refused = requests.exceptions.ConnectionError(
+        urllib3.exceptions.MaxRetryError(None, "/refresh", urllib3.exceptions.NewConnectionError(None, "refused"))
+    )
+    calls = []
+
+    def refresh(item):
+        calls.append(item)
+        if len(calls) == 1:
+            raise refused
+        if len(calls) == 2:
+            raise ServerError("429")
+        return "job"
+
+    manager.server.datasources = FakeRefreshes(refresh)
+    assert manager.bulk_refresh("datasources", ["id"])[0].result == "job"
+    assert len(calls) == 3
+
+@pytest.fixture
+def signed_in(manager, monkeypatch):
+    """
+    Pretend the manager signed in with a token; records re-sign-ins.
+    """
+    signed_in = []
+    manager._auth = object()
+    monkeypatch.setattr(manager, "reauthenticate", lambda stale_token=None: signed_in.append(stale_token))
+    return signed_in
+
+def test_call_signs_in_again_on_401(manager, signed_in):
+    func = FlakyCall("401002")
+    assert manager.call(func) == "ok"
+    assert signed_in == ["token"]
+
+def test_publish_signs_in_again_on_401(manager, signed_in, tmp_path):
+    hyper_file = tmp_path / "data.hyper"
+    hyper_file.write_bytes(b"hyper")
+    publish = FlakyCall("401002")
+    manager.server = FakeServer(publish)
+    assert manager._publish_hyper_file(str(hyper_file), "sales", "project") == "ok"
+    assert publish.calls == 2
+    assert signed_in == ["token"]
+
+def test_download_signs_in_again_on_401(manager, signed_in, monkeypatch):
+    download = FlakyCall("401002")
+    manager.server = FakeServer(download=download)
+    monkeypatch.setattr(manager, "read_hyper", lambda *args, **kwargs: "frame")
+    monkeypatch.setattr("os.path.getsize", lambda path: 0)
+    assert manager.load_hyper_to_dataframe("datasource-id") == "frame"
+    assert download.calls == 2
+    assert signed_in == ["token"]
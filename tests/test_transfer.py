@@ -0,0 +1,132 @@
+import decimal
+from collections import namedtuple
+
+import cx_Oracle
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("tableauserverclient")
+pytest.importorskip("tableauhyperapi")
+
+from connection_manager import OracleConnectionManager, RedshiftConnectionManager, TableauConnectionManager
+
+# The fields of psycopg2's cursor.description entries.
+Column = namedtuple("Column", "name type_code display_size internal_size precision scale null_ok")
+
+class FakeLob:
+    def __init__(self, value):
+        self.value = value
+
+    def read(self):
+        return self.value
+
+class FakeDatasources:
+    def __init__(self):
+        self.updates = []
+        self.published = []
+        self.read_hyper = None
+
+    def publish(self, datasource, hyper_file, mode):
+        self.published.append((mode, self.read_hyper(hyper_file)))
+        return datasource
+
+    def update_hyper_data(self, datasource, request_id, actions, payload):
+        self.updates.append(actions)
+        return "job"
+
+class FakeServer:
+    def __init__(self):
+        self.auth_token = "token"
+        self.datasources = FakeDatasources()
+
+    def is_signed_in(self):
+        return True
+
+@pytest.fixture
+def tableau(tableau_config):
+    manager = TableauConnectionManager(tableau_config)
+    manager.server = FakeServer()
+    manager._find_datasource = lambda name, project_id: "datasource"
+    manager.server.datasources.read_hyper = manager.read_hyper
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def oracle_rows():
+    cx_Oracle.set_result(
+        [
+            ("ID", cx_Oracle.DB_TYPE_NUMBER, None, None, 10, 0, True),
+            ("NOTE", cx_Oracle.DB_TYPE_CLOB, None, None, None, None, True),
+        ],
+        [(1, FakeLob("a")), (2, None)],
+    )
+    yield
+    cx_Oracle.set_result(None, [])
+
+def test_oracle_describe_columns(oracle_config):
+    manager = OracleConnectionManager(oracle_config)
+    columns = manager.describe_columns([
+        ("ID", cx_Oracle.DB_TYPE_NUMBER, None, None, 10, 0, True),
+        ("NOTE", cx_Oracle.DB_TYPE_CLOB, None, None, None, None, True),
+        ("OTHER", object(), None, None, None, None, True),
+    ])
+    assert [column.name for column in columns] == ["ID", "NOTE", "OTHER"]
+    assert [column.arrow_type for column in columns] == [pa.int64(), pa.string(), None]
+    assert columns[0].converter is None
+    assert columns[1].converter(FakeLob("text")) == "text"
+
+def test_redshift_describe_columns(redshift_config):
+    pytest.importorskip("psycopg2")
+    manager = RedshiftConnectionManager(redshift_config)
+    columns = manager.describe_columns([
+        Column("id", 20, None, 8, None, None, None),
+        Column("amount", 1700, None, None, 12, 2, None),
+        Column("other", 114, None, None, None, None, None),
+    ])
+    assert [column.name for column in columns] == ["id", "amount", "other"]
+    assert [column.arrow_type for column in columns] == [pa.int64(), pa.decimal128(12, 2), None]
+    assert all(column.converter is None for column in columns)
+
+@pytest.mark.parametrize("table_name, schema, table", [
+    ("Extract", "public", "Extract"),
+    ("Extract.Extract", "Extract", "Extract"),
+])
+def test_upsert_targets_the_extract_table(tableau, oracle_config, oracle_rows, table_name, schema, table):
+    source = OracleConnectionManager(oracle_config)
+    source.connect()
+    result = tableau.transfer(
+        source, "SELECT * FROM notes", "Notes", "project", mode="upsert", key_columns=["ID"], table_name=table_name, wait=False,
+    )
+    assert result.rows == 2
+    [actions] = tableau.server.datasources.updates
+    assert actions[0]["source-schema"] == actions[0]["target-schema"] == schema
+    assert actions[0]["source-table"] == actions[0]["target-table"] == table
+
+@pytest.mark.parametrize("mode", ["overwrite", "append"])
+def test_untyped_numeric_keeps_later_scales(tableau, redshift_config, redshift_connections, mode):
+    pytest.importorskip("psycopg2")
+    source = RedshiftConnectionManager(redshift_config)
+    source.connect()
+    connection = redshift_connections[0]
+    connection.description = [Column("amount", 1700, None, None, None, None, None)]
+    connection.rows = [(decimal.Decimal("1.5"),), (decimal.Decimal("123.45"),), (None,)]
+    result = tableau.transfer(source, "SELECT amount FROM t", "Amounts", "project", mode=mode, batch_size=1)
+    assert result.rows == 3
+    [(publish_mode, data)] = tableau.server.datasources.published
+    assert publish_mode == mode.capitalize()
+    assert data["amount"].tolist()[:2] == [1.5, 123.45]
+    assert data["amount"].isna().tolist() == [False, False, True]
+
+def test_inferred_decimals_keep_later_scales(tableau, oracle_config):
+    source = OracleConnectionManager(oracle_config)
+    source.connect()
+    cx_Oracle.set_result(
+        [("AMOUNT", object(), None, None, None, None, True)],
+        [(decimal.Decimal("1.5"),), (decimal.Decimal("123.45"),)],
+    )
+    try:
+        tableau.transfer(source, "SELECT amount FROM t", "Amounts", "project", batch_size=1)
+    finally:
+        cx_Oracle.set_result(None, [])
+    [(_, data)] = tableau.server.datasources.published
+    assert data["AMOUNT"].tolist() == [1.5, 123.45]